@@ -0,0 +1,9 @@
+"""
+ops.gitio — batched read-only git queries for gates and agent scripts.
+
+Rules:
+- Read-only: never writes the index, refs or the working tree
+  (status runs with --no-optional-locks).
+- Stdlib only; one subprocess per question, not per path.
+- Callers treat failures (not a checkout, git missing) as "no data", never raise.
+"""
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class WorktreeStatus:
+    """
+    One `git status --porcelain=v2` call: HEAD plus every path that differs
+    between HEAD and the index (`staged`) or the index and the working tree
+    (`unstaged`). Same path sets as `git diff --name-only --cached` and
+    `git diff --name-only`; renames report the new path, conflicts count as both.
+    """
+
+    ok: bool
+    head: str = ""
+    staged: list[str] = field(default_factory=list)
+    unstaged: list[str] = field(default_factory=list)
+    untracked: list[str] = field(default_factory=list)
+
+    def changed(self) -> list[str]:
+        return sorted(set(self.staged) | set(self.unstaged))
+
+
+def worktree_status(cwd: Path | None = None, untracked: bool = False) -> WorktreeStatus:
+    try:
+        p = subprocess.run(
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "-z",
+                f"--untracked-files={'all' if untracked else 'no'}",
+            ],
+            cwd=str(cwd) if cwd else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return WorktreeStatus(ok=False)
+    if p.returncode != 0:
+        return WorktreeStatus(ok=False)
+
+    st = WorktreeStatus(ok=True)
+    fields = p.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+    i = 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if not entry:
+            continue
+        kind = entry[0]
+        if kind == "#":
+            if entry.startswith("# branch.oid ") and not entry.endswith("(initial)"):
+                st.head = entry[len("# branch.oid "):]
+        elif kind == "?":
+            st.untracked.append(entry[2:])
+        elif kind in "12u":
+            # 1 XY sub mH mI mW hH hI path / 2 ... Xscore path\0orig / u XY sub m1 m2 m3 mW h1 h2 h3 path
+            parts = entry.split(" ", {"1": 8, "2": 9, "u": 10}[kind])
+            xy, path = parts[1], parts[-1]
+            if kind == "2":
+                i += 1  # skip origPath
+            if kind == "u" or xy[0] != ".":
+                st.staged.append(path)
+            if kind == "u" or xy[1] != ".":
+                st.unstaged.append(path)
+    return st
+
+
+def committed_changes(base: str, cwd: Path | None = None) -> list[str] | None:
+    """Paths changed in `base...HEAD` (since the merge base), or None when git fails."""
+    try:
+        p = subprocess.run(
+            ["git", "diff", "--name-only", "-z", f"{base}...HEAD"],
+            cwd=str(cwd) if cwd else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    if p.returncode != 0:
+        return None
+    return [x for x in p.stdout.decode("utf-8", errors="surrogateescape").split("\0") if x]
+
+
+class CatFile:
+    """
+    One long-lived `git cat-file --batch` process for any number of object
+    lookups (`<rev>:<path>`, `<rev>^{commit}`, ...). Use as a context manager;
+    every lookup after a failure to start returns None.
+    """
+
+    def __init__(self, cwd: Path | None = None) -> None:
+        self.cwd = cwd
+        self._proc: subprocess.Popen | None = None
+        self._failed = False
+
+    def __enter__(self) -> "CatFile":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _start(self) -> subprocess.Popen | None:
+        if self._proc is None and not self._failed:
+            try:
+                self._proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=str(self.cwd) if self.cwd else None,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                self._failed = True
+        return self._proc
+
+    def lookup(self, spec: str) -> tuple[str, str, bytes] | None:
+        """(oid, type, content) for `spec`, or None when it does not name an object."""
+        if "\n" in spec:
+            return None
+        proc = self._start()
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            return None
+        try:
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().decode("utf-8", errors="replace").split()
+            if len(header) != 3 or not header[2].isdigit():
+                # "<spec> missing" / "<spec> ambiguous": nothing else follows on stdout.
+                if not header:
+                    self.close()
+                    self._failed = True
+                return None
+            oid, kind, size = header[0], header[1], int(header[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing LF
+        except (OSError, ValueError):
+            self.close()
+            self._failed = True
+            return None
+        return oid, kind, data
+
+    def read(self, rev: str, path: str) -> bytes | None:
+        """Blob content of `path` at `rev` (like `git show rev:path`), or None."""
+        hit = self.lookup(f"{rev}:{path}")
+        if hit is None or hit[1] != "blob":
+            return None
+        return hit[2]
+
+    def resolve_commit(self, rev: str) -> str:
+        """Full commit sha for `rev`, or "" when it does not resolve."""
+        hit = self.lookup(f"{rev}^{{commit}}")
+        return hit[0] if hit is not None and hit[1] == "commit" else ""
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
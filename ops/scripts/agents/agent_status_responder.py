@@ -12,11 +12,26 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.gitio.worktree import worktree_status  # noqa: E402
+
 BUS_DEFAULT = Path("~/.openclaw/runtime/logs/team_bus.jsonl").expanduser()
 PERSIST_SCRIPT = Path("~/.openclaw/workspace/ops/scripts/agents/persist_status.sh").expanduser()
 REMBRANDT_WORKER = Path(__file__).with_name("rembrandt_worker.py")
 WORKSPACE_BASE = Path(os.environ.get("OPENCLAW_WORKSPACE", "~/.openclaw/workspace")).expanduser().resolve()
 REMBRANDT_TASK_META_DIR = Path("~/.openclaw/runtime/tasks/rembrandt").expanduser()
+STATUS_ROOT_DEFAULT = Path("~/.openclaw/runtime/logs/status").expanduser()
+# Mirrors the tracked set in persist_status.sh.
+PERSISTED_TYPES = {"STATUS", "TASK_ACK", "TASK_UPDATE", "STATUS_REPORT"}
+COMPLETION_AGENT = "custodian"
 
 
 def ts_utc() -> str:
@@ -24,9 +39,7 @@ def ts_utc() -> str:
 
 
 def write_bus_event(bus: Path, event: dict) -> None:
-    bus.parent.mkdir(parents=True, exist_ok=True)
-    with bus.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    append_bus_events(bus, [event])
 
 
 def persist(event: dict) -> None:
@@ -35,6 +48,123 @@ def persist(event: dict) -> None:
     subprocess.run([str(PERSIST_SCRIPT), "--event-json", json.dumps(event, ensure_ascii=False)], check=True)
 
 
+def append_bus_events(bus: Path, events: list[dict]) -> None:
+    """
+    Append a group of events in one flocked write. write_bus_event takes the
+    same lock, so no event from this script lands inside the batch; bus
+    writers that do not flock are not excluded.
+    """
+    if not events:
+        return
+    bus.parent.mkdir(parents=True, exist_ok=True)
+    payload = "".join(json.dumps(ev, ensure_ascii=False) + "\n" for ev in events)
+    with bus.open("a", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.write(payload)
+            f.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def persist_lanes(events: list[dict], status_root: Path = STATUS_ROOT_DEFAULT) -> None:
+    """
+    In-process equivalent of persist_status.sh for a batch of events: one append
+    per task lane file and one latest.json write per agent.
+    """
+    persisted_ts = ts_utc()
+    lanes: dict[Path, list[str]] = {}
+    latest: dict[str, dict] = {}
+    for ev in events:
+        actor = ev.get("actor") or ev.get("agent")
+        if not actor or ev.get("type", "") not in PERSISTED_TYPES:
+            continue
+        task_id = ev.get("task_id")
+        if task_id:
+            row = dict(ev)
+            row["persisted_ts"] = persisted_ts
+            lanes.setdefault(status_root / "tasks" / str(task_id) / f"{actor}.jsonl", []).append(
+                json.dumps(row, ensure_ascii=False) + "\n"
+            )
+        latest[actor] = {
+            "agent": actor,
+            "type": ev.get("type", ""),
+            "status": ev.get("status") or ev.get("state") or "unknown",
+            "task_id": task_id,
+            "summary": ev.get("summary", ""),
+            "ts": ev.get("ts"),
+            "persisted_ts": persisted_ts,
+            "dry_run": ev.get("dry_run", False),
+        }
+
+    agent_dir = status_root / "agents"
+    agent_dir.mkdir(parents=True, exist_ok=True)
+    os.chmod(agent_dir, 0o750)
+    for lane, rows in lanes.items():
+        lane.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(lane.parent, 0o750)
+        with lane.open("a", encoding="utf-8") as f:
+            f.write("".join(rows))
+        os.chmod(lane, 0o640)
+    for actor, snap in latest.items():
+        latest_file = agent_dir / f"{actor}.latest.json"
+        latest_file.write_text(json.dumps(snap, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.chmod(latest_file, 0o640)
+
+
+def batch_update(
+    bus: Path,
+    updates: list[dict],
+    *,
+    status_root: Path = STATUS_ROOT_DEFAULT,
+    live: bool = False,
+) -> list[dict]:
+    """
+    Emit TASK_UPDATE events for many lanes in-process.
+
+    `updates` rows carry agent, task_id, state and optional summary. All accepted
+    events are written in one locked bus append and then persisted to their lanes.
+    Returns one result per input row: {task_id, agent, ok, error}.
+
+    The topology v2 hard block applies per row (only custodian may emit
+    state=complete). Rembrandt strict-contract verification is not run here;
+    use the `update` subcommand for rembrandt completions.
+    """
+    results: list[dict] = []
+    events: list[dict] = []
+    for u in updates:
+        agent = str(u.get("agent") or "").strip()
+        task_id = str(u.get("task_id") or "").strip()
+        state = str(u.get("state") or "").strip()
+        res = {"task_id": task_id, "agent": agent, "ok": False, "error": ""}
+        results.append(res)
+        if not agent or not task_id:
+            res["error"] = "missing agent or task_id"
+            continue
+        if state not in {"in_process", "error", "complete"}:
+            res["error"] = f"invalid state: {state or 'none'}"
+            continue
+        if state == "complete" and agent != COMPLETION_AGENT:
+            res["error"] = "Only custodian may emit state=complete (agent-topology v2 hard block)."
+            continue
+        event = build_base(agent, "TASK_UPDATE", task_id, str(u.get("summary") or "Task state update"), not live)
+        event["state"] = state
+        events.append(event)
+        res["ok"] = True
+
+    try:
+        append_bus_events(bus, events)
+        persist_lanes(events, status_root)
+    except OSError as e:
+        for res in results:
+            if res["ok"]:
+                res["ok"] = False
+                res["error"] = f"write failed: {e}"
+    return results
+
+
 def build_base(agent: str, ev_type: str, task_id: str | None, summary: str, dry_run: bool) -> dict:
     return {
         "schema_version": "team_bus.v1.1",
@@ -75,41 +205,6 @@ def _task_meta_path(task_id: str) -> Path:
     return REMBRANDT_TASK_META_DIR / f"{task_id}.json"
 
 
-def _git_head_sha() -> str:
-    proc = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=str(WORKSPACE_BASE),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if proc.returncode != 0:
-        return ""
-    return (proc.stdout or "").strip()
-
-
-def _git_worktree_changes() -> list[str]:
-    files: set[str] = set()
-    for cmd in (
-        ["git", "diff", "--name-only", "--cached"],
-        ["git", "diff", "--name-only"],
-    ):
-        proc = subprocess.run(
-            cmd,
-            cwd=str(WORKSPACE_BASE),
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if proc.returncode != 0:
-            continue
-        for ln in (proc.stdout or "").splitlines():
-            txt = ln.strip()
-            if txt:
-                files.add(txt)
-    return sorted(files)
-
-
 def _load_task_meta(task_id: str) -> dict:
     p = _task_meta_path(task_id)
     if not p.exists():
@@ -133,7 +228,9 @@ def _ensure_task_base_sha(task_id: str, message: str) -> str:
     base_sha = str(meta.get("base_sha") or "").strip()
     if base_sha:
         return base_sha
-    head = _git_head_sha()
+    # HEAD and the pre-existing index/worktree deltas come from one `git status`.
+    st = worktree_status(WORKSPACE_BASE)
+    head = st.head
     if not head:
         return ""
     _save_task_meta(
@@ -143,7 +240,7 @@ def _ensure_task_base_sha(task_id: str, message: str) -> str:
             "base_sha": head,
             "created_at": ts_utc(),
             "mode": "strict_contract",
-            "baseline_changed_files": _git_worktree_changes(),
+            "baseline_changed_files": st.changed(),
         },
     )
     return head
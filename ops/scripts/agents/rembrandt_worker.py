@@ -16,14 +16,25 @@ Integrate it by importing and calling `run_rembrandt_task(...)` from your agent
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.gitio.worktree import CatFile, committed_changes, worktree_status  # noqa: E402
 
 WORKSPACE = Path(os.environ.get("OPENCLAW_WORKSPACE", Path.cwd())).resolve()
 
@@ -54,6 +65,21 @@ COMPILED_CSS_CANDIDATES = [
     "ui/dashboard/static/app.bundle.css",
     "ui/dashboard/static/app.css",
 ]
+# `pnpm run build:css` compiles CSS_BUILD_ENTRY into CSS_BUILD_OUTPUT; these
+# plus their @import/@use/@forward graph and the toolchain files decide its output.
+CSS_BUILD_ENTRY = "ui/dashboard/src/styles.scss"
+CSS_BUILD_OUTPUT = COMPILED_CSS_CANDIDATES[0]
+CSS_BUILD_TOOLCHAIN_FILES = [
+    "ui/dashboard/package.json",
+    "ui/dashboard/pnpm-lock.yaml",
+    "ui/dashboard/postcss.config.js",
+    "ui/dashboard/postcss.config.cjs",
+    "ui/dashboard/postcss.config.mjs",
+    "ui/dashboard/.postcssrc",
+    "ui/dashboard/.postcssrc.json",
+    "ui/dashboard/.browserslistrc",
+]
+CSS_BUILD_STAMP = "css_build.json"
 COMPONENT_PATTERNS = {
     "navigation": [r"\bnav\b", r"\.site-header\b", r"\.site-nav\b", r"\[data-nav\]"],
     "buttons": [r"\bbutton\b", r"\.action-btn\b", r"\.theme-toggle\b", r"\.btn\b"],
@@ -63,6 +89,10 @@ COMPONENT_PATTERNS = {
     "badges_tags": [".badge", ".tag", ".pill", ".status"],
     "charts": [r"\.chart\b", r"\.sparkline\b", r"\bsvg\b"],
 }
+# Bump when gate semantics change so stale cached verdicts are never reused.
+VERIFY_CACHE_VERSION = 1
+# Gate jobs are git/pnpm subprocesses and file reads, so threads overlap them fine.
+VERIFY_WORKERS = 4
 
 
 @dataclass
@@ -80,10 +110,11 @@ class ScribeSourceResolution:
     reason: str
 
 
-def _run(cmd: list[str], cwd: Path | None = None) -> tuple[int, str]:
+def _run(cmd: list[str], cwd: Path | None = None, env: dict[str, str] | None = None) -> tuple[int, str]:
     p = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
+        env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
@@ -183,22 +214,13 @@ def _git_changed_files(base_ref: str = "HEAD") -> list[str]:
     """
     Get changed files using base...HEAD (triple-dot) plus working-tree/index deltas.
     This keeps verify robust whether task changes are committed or still in working tree.
+    Index and working-tree deltas come from one `git status`; the committed range
+    needs a second call only when the base is not HEAD itself.
     """
-    files: set[str] = set()
-
-    def collect(args: list[str]) -> None:
-        code, out = _run(args)
-        if code != 0:
-            return
-        for ln in out.splitlines():
-            txt = ln.strip()
-            if txt:
-                files.add(txt)
-
-    if base_ref:
-        collect(["git", "diff", "--name-only", f"{base_ref}...HEAD"])
-    collect(["git", "diff", "--name-only", "--cached"])
-    collect(["git", "diff", "--name-only"])
+    st = worktree_status()
+    files = set(st.changed()) if st.ok else set()
+    if base_ref and not (st.head and base_ref in {"HEAD", st.head}):
+        files.update(committed_changes(base_ref) or [])
     return sorted(files)
 
 
@@ -243,12 +265,13 @@ def _read_compiled_css_current() -> tuple[str, str]:
     return "", ""
 
 
-def _read_compiled_css_at_base(base_ref: str) -> tuple[str, str]:
+def _read_compiled_css_at_base(base_ref: str, git: CatFile) -> tuple[str, str]:
     if not base_ref:
         return "", ""
     for rel in COMPILED_CSS_CANDIDATES:
-        code, out = _run(["git", "show", f"{base_ref}:{rel}"])
-        if code == 0 and out.strip():
+        blob = git.read(base_ref, rel)
+        out = blob.decode("utf-8", errors="replace") if blob else ""
+        if out.strip():
             return rel, out
     return "", ""
 
@@ -261,14 +284,84 @@ def _component_coverage(css_text: str) -> dict[str, bool]:
     return out
 
 
+RM_VAR_PATTERN = r"--(rm-[a-z0-9_-]+)\s*:\s*([^;]+);"
+
+
 def _parse_rm_vars(css_text: str) -> dict[str, str]:
-    pairs = re.findall(r"--(rm-[a-z0-9_-]+)\s*:\s*([^;]+);", css_text or "", flags=re.I)
+    pairs = re.findall(RM_VAR_PATTERN, css_text or "", flags=re.I)
     out: dict[str, str] = {}
     for k, v in pairs:
         out[k.strip().lower()] = v.strip()
     return out
 
 
+def _pattern_anchor(pattern: str) -> tuple[str, int]:
+    """
+    Literal every match of a COMPONENT_PATTERNS entry contains, and how many
+    characters of the match precede it (a leading bare "." is a wildcard).
+    """
+    core = pattern.removeprefix(r"\b").removesuffix(r"\b")
+    offset = 0
+    if core.startswith("."):
+        core, offset = core[1:], 1
+    return re.sub(r"\\(.)", r"\1", core).lower(), offset
+
+
+def _compile_css_scanner() -> tuple[re.Pattern[str], dict[str, list[tuple[str, re.Pattern[str], int]]]]:
+    checks: dict[str, list[tuple[str, re.Pattern[str], int]]] = {}
+    for target, pats in COMPONENT_PATTERNS.items():
+        for pat in pats:
+            literal, offset = _pattern_anchor(pat)
+            checks.setdefault(literal, []).append((target, re.compile(pat, flags=re.I), offset))
+    # "rm-" opens every `--rm-*` declaration and cannot overlap itself or any
+    # component literal, so no declaration start is ever consumed by another hit.
+    literals = sorted([*checks, "rm-"], key=len, reverse=True)
+    # Case-sensitive over lowercased text: an IGNORECASE alternation is ~7x slower.
+    return re.compile("|".join(re.escape(x) for x in literals)), checks
+
+
+CSS_SCANNER, CSS_ANCHOR_CHECKS = _compile_css_scanner()
+RM_VAR_RE = re.compile(RM_VAR_PATTERN, flags=re.I)
+
+
+def _scan_css(css_text: str) -> tuple[dict[str, bool], dict[str, str]]:
+    """
+    One pass over compiled CSS for component coverage and `--rm-*` tokens,
+    with the same results as _component_coverage + _parse_rm_vars.
+
+    A single literal alternation over the lowercased text finds candidate
+    positions; the original pattern is then matched in place. Literal hits
+    do not overlap, so a target the pass reports missing is re-checked with
+    its own patterns (only when coverage is genuinely incomplete or a hit
+    hides inside a longer literal).
+    """
+    txt = css_text or ""
+    low = txt.lower()
+    if len(low) != len(txt):
+        # Some non-ASCII case mappings change length; positions would not line up.
+        return _component_coverage(txt), _parse_rm_vars(txt)
+    coverage = dict.fromkeys(COMPONENT_PATTERNS, False)
+    rm_vars: dict[str, str] = {}
+    rm_end = 0
+    for m in CSS_SCANNER.finditer(low):
+        pos, literal = m.start(), m.group()
+        if literal == "rm-":
+            # findall semantics: declarations never overlap.
+            if pos >= 2 and pos - 2 >= rm_end:
+                decl = RM_VAR_RE.match(txt, pos - 2)
+                if decl:
+                    rm_vars[decl.group(1).strip().lower()] = decl.group(2).strip()
+                    rm_end = decl.end()
+            continue
+        for target, pat, offset in CSS_ANCHOR_CHECKS[literal]:
+            if not coverage[target] and pos >= offset and pat.match(txt, pos - offset):
+                coverage[target] = True
+    for target, found in coverage.items():
+        if not found:
+            coverage[target] = any(re.search(p, txt, flags=re.I) for p in COMPONENT_PATTERNS[target])
+    return coverage, rm_vars
+
+
 def _parse_float_token(val: str) -> float | None:
     m = re.search(r"([0-9]+(?:\.[0-9]+)?)", val or "")
     if not m:
@@ -349,16 +442,109 @@ html[data-theme="dark"] .badge {{
         return False, str(e), []
 
 
-def _compile_css() -> tuple[bool, str]:
+_SCSS_IMPORT_RE = re.compile(r"(?m)^\s*@(?:import|use|forward)\s+([^;]+);")
+_SCSS_STRING_RE = re.compile(r"""["']([^"']+)["']""")
+
+
+def _scss_import_candidates(base: Path, name: str) -> list[Path]:
+    target = base / name
+    if target.suffix in {".scss", ".sass", ".css"}:
+        return [target, target.with_name(f"_{target.name}")]
+    out: list[Path] = []
+    for suffix in (".scss", ".sass", ".css"):
+        out.extend([target.with_name(f"{target.name}{suffix}"), target.with_name(f"_{target.name}{suffix}")])
+    out.extend([target / "_index.scss", target / "index.scss"])
+    return out
+
+
+def _css_build_inputs() -> dict[str, str]:
+    """
+    sha256 of every file the CSS build reads: THEME_SOURCE_FILES stylesheets,
+    everything they reach through @import/@use/@forward, and the toolchain
+    files. Imports that do not resolve to a workspace file (packages, load
+    paths) are listed as "unresolved:<name>"; pnpm-lock.yaml pins those.
+    """
+    inputs: dict[str, str] = {}
+    roots = [CSS_BUILD_ENTRY, *sorted(f for f in THEME_SOURCE_FILES if f.endswith((".scss", ".sass")))]
+    pending = [WORKSPACE / rel for rel in roots]
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        inputs[path.relative_to(WORKSPACE).as_posix()] = hashlib.sha256(data).hexdigest()
+        if path.suffix == ".css":
+            continue
+        text = re.sub(r"/\*.*?\*/", "", data.decode("utf-8", errors="replace"), flags=re.S)
+        for clause in _SCSS_IMPORT_RE.findall(text):
+            for name in _SCSS_STRING_RE.findall(clause):
+                if name.startswith("sass:"):
+                    continue  # built-in module
+                hit = next((c for c in _scss_import_candidates(path.parent, name) if c.is_file()), None)
+                if hit is not None and hit.resolve().is_relative_to(WORKSPACE):
+                    pending.append(hit.resolve())
+                else:
+                    inputs[f"unresolved:{name}"] = ""
+    for rel in CSS_BUILD_TOOLCHAIN_FILES:
+        digest = _sha256_file(WORKSPACE / rel)
+        if digest:
+            inputs[rel] = digest
+    return dict(sorted(inputs.items()))
+
+
+def _read_css_build_stamp(path: Path) -> dict[str, Any]:
+    try:
+        stamp = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return stamp if isinstance(stamp, dict) else {}
+
+
+def _compile_css(cache_dir: Path, force: bool = False) -> tuple[bool, str, dict[str, Any]]:
     """
     Optional build check; if pnpm script exists, run it.
     Non-fatal if dashboard package not installed, but in strict mode we treat failure as failure.
+
+    Incremental: the build is skipped when the output still has the hash the
+    last successful build produced from identical input hashes (see
+    _css_build_inputs), as recorded in cache_dir/css_build.json next to the
+    verify cache. The returned mapping records inputs -> output either way.
     """
     dash = WORKSPACE / "ui" / "dashboard"
     if not dash.exists():
-        return False, "ui/dashboard missing"
+        return False, "ui/dashboard missing", {}
+    inputs = _css_build_inputs()
+    input_digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+    stamp_path = cache_dir / CSS_BUILD_STAMP
+    stamp = _read_css_build_stamp(stamp_path)
+    output_sha = _sha256_file(WORKSPACE / CSS_BUILD_OUTPUT)
+    info: dict[str, Any] = {"input_digest": input_digest, "inputs": inputs, "output": CSS_BUILD_OUTPUT}
+    if (
+        not force
+        and output_sha
+        and stamp.get("input_digest") == input_digest
+        and stamp.get("output_sha256") == output_sha
+    ):
+        info.update({"output_sha256": output_sha, "skipped": True})
+        return True, "up_to_date", info
+
     code, out = _run(["pnpm", "-C", str(dash), "run", "build:css"])
-    return code == 0, (out.splitlines()[-1] if out else "ok" if code == 0 else "build failed")
+    info.update({"output_sha256": _sha256_file(WORKSPACE / CSS_BUILD_OUTPUT), "skipped": False})
+    if code == 0 and info["output_sha256"]:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            stamp_path.write_text(
+                json.dumps({k: info[k] for k in ("input_digest", "inputs", "output", "output_sha256")}, indent=2),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+    return code == 0, (out.splitlines()[-1] if out else "ok" if code == 0 else "build failed"), info
 
 
 def _write_report(report_path: Path, report: dict[str, Any]) -> None:
@@ -366,6 +552,130 @@ def _write_report(report_path: Path, report: dict[str, Any]) -> None:
     report_path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
 
 
+def _verify_cache_enabled() -> bool:
+    return os.environ.get("OPENCLAW_REM_VERIFY_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _sha256_file(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _dashboard_tree_hash() -> str:
+    """
+    Git tree hash of ui/dashboard/ as it is on disk: committed, staged and
+    unstaged edits plus untracked (non-ignored) files. Built in a throwaway copy
+    of the index so the real index is never touched; unchanged files are
+    skipped by git's stat cache, so this stays cheap on large trees.
+    """
+    code, out = _run(["git", "rev-parse", "--git-path", "index"])
+    if code != 0 or not out.strip():
+        return ""
+    real_index = Path(out.strip())
+    with tempfile.TemporaryDirectory(prefix="rembrandt-index-") as tmp:
+        index = Path(tmp) / "index"
+        if real_index.exists():
+            shutil.copyfile(real_index, index)
+        env = {**os.environ, "GIT_INDEX_FILE": str(index)}
+        code, _ = _run(
+            ["git", "add", "-A", "--", ALLOWED_PREFIX, f":(exclude){ALLOWED_PREFIX}node_modules"],
+            env=env,
+        )
+        if code != 0:
+            return ""
+        code, out = _run(["git", "write-tree", f"--prefix={ALLOWED_PREFIX}"], env=env)
+    return out.strip() if code == 0 else ""
+
+
+def _verify_cache_key(
+    run_mode: str,
+    diff_base_used: str,
+    directives: dict[str, str],
+    scribe: ScribeSourceResolution,
+    changed_files_raw: list[str],
+    require_css_build: bool,
+    tree: str,
+    git: CatFile,
+) -> str:
+    """
+    Content address of every input the gates read. Empty when the tree hash
+    cannot be computed (not a git checkout), which disables caching. `tree` is
+    the _dashboard_tree_hash() result, computed alongside the other inputs.
+
+    Compiled CSS is hashed separately because build output is git-ignored and
+    therefore absent from the tree hash; the changed-file list covers edits
+    outside ui/dashboard/ that the scope gates reject.
+    """
+    if not tree:
+        return ""
+    base = ""
+    if run_mode == "verify" and diff_base_used:
+        base = git.resolve_commit(diff_base_used) or f"unresolved:{diff_base_used}"
+    inputs = {
+        "version": VERIFY_CACHE_VERSION,
+        "run_mode": run_mode,
+        "dashboard_tree": tree,
+        "base_sha": base,
+        "directives": directives,
+        "scribe_source": [scribe.path, _sha256_file(Path(scribe.path)) if scribe.ok else ""],
+        "compiled_css": {rel: _sha256_file(WORKSPACE / rel) for rel in COMPILED_CSS_CANDIDATES},
+        "changed_files": changed_files_raw,
+        "ignored_changed": os.environ.get("OPENCLAW_REM_IGNORE_CHANGED", ""),
+        "require_css_build": require_css_build,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _read_cached_verify(cache_dir: Path, key: str) -> dict[str, Any] | None:
+    path = cache_dir / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        rec = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(rec, dict) or rec.get("version") != VERIFY_CACHE_VERSION or not isinstance(rec.get("result"), dict):
+        return None
+    return rec
+
+
+def _write_cached_verify(cache_dir: Path, key: str, result: dict[str, Any]) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{key}.json.{os.getpid()}.tmp"
+        tmp.write_text(
+            json.dumps({"version": VERIFY_CACHE_VERSION, "key": key, "result": result}, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp, cache_dir / f"{key}.json")
+    except OSError:
+        pass
+
+
+def _timed(timings: dict[str, float], name: str, fn: Any, *args: Any) -> Any:
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _timing_summary(timings: dict[str, float], started: float) -> dict[str, Any]:
+    """Per-check wall time plus the check that bounded the (parallel) run."""
+    return {
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        "checks_ms": dict(sorted(timings.items())),
+        "dominant_check": max(timings, key=timings.__getitem__) if timings else "none",
+    }
+
+
+def _scan_base_css(base_ref: str, git: CatFile) -> tuple[str, dict[str, str]]:
+    rel, css_txt = _read_compiled_css_at_base(base_ref, git)
+    return rel, _parse_rm_vars(css_txt)
+
+
 def _collect_failed_checks(run_mode: str, strict_requested: bool, checks: dict[str, Any]) -> list[str]:
     """
     Return all failing strict verify gates for debugging.
@@ -431,19 +741,51 @@ def run_rembrandt_task(
     base_sha: str | None = None,
     require_css_build: bool = True,
     mode: str = "verify",
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """
     Main entrypoint.
     This function assumes some other code performs the actual UI mutation.
     It enforces the contract gates and returns a machine-readable result payload.
+
+    Preflight/verify verdicts are cached under report_dir/cache, keyed by the
+    content of everything the gates read (see _verify_cache_key), so a repeat
+    run against an unchanged tree and message returns the stored verdict.
+    The CSS build is likewise skipped while its inputs are unchanged
+    (_compile_css). use_cache=False recomputes both.
     """
+    with CatFile() as git, ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+        return _run_task(
+            task_id, message, report_dir, diff_base, base_sha, require_css_build, mode, use_cache, git, pool
+        )
 
+
+def _run_task(
+    task_id: str,
+    message: str,
+    report_dir: Path | None,
+    diff_base: str,
+    base_sha: str | None,
+    require_css_build: bool,
+    mode: str,
+    use_cache: bool,
+    git: CatFile,
+    pool: ThreadPoolExecutor,
+) -> dict[str, Any]:
+    """
+    Independent checks run on `pool`: scribe/pages/changed-files/tree hash
+    first, then (on a cache miss) the CSS build in the background while the
+    current and base compiled CSS are scanned. `git` is only used from one
+    thread at a time. Per-check wall times land in the report's "timing".
+    """
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
     report_dir = report_dir or (WORKSPACE / ".openclaw" / "runtime" / "reports" / "rembrandt")
     report_path = report_dir / f"{task_id}.json"
 
     contract = _resolve_contract(message)
-    scribe = _resolve_scribe_principles_source()
-    pages = _dashboard_pages()
+    scribe_f = pool.submit(_timed, timings, "scribe_source", _resolve_scribe_principles_source)
+    pages_f = pool.submit(_timed, timings, "dashboard_pages", _dashboard_pages)
 
     run_mode = (mode or "verify").strip().lower()
     if run_mode not in {"preflight", "implementation", "verify"}:
@@ -455,11 +797,51 @@ def run_rembrandt_task(
     impl_files: list[str] = []
     if run_mode == "implementation":
         impl_ok, impl_reason, impl_files = _apply_minimal_dashboard_overhaul(task_id)
+    cache_verdict = use_cache and run_mode != "implementation" and _verify_cache_enabled()
+    tree_f = pool.submit(_timed, timings, "dashboard_tree", _dashboard_tree_hash) if cache_verdict else None
     # In preflight mode, no mutation is expected yet.
-    changed_files_raw = [] if run_mode == "preflight" else _git_changed_files(diff_base_used)
+    changed_f = (
+        None if run_mode == "preflight" else pool.submit(_timed, timings, "changed_files", _git_changed_files, diff_base_used)
+    )
+    scribe = scribe_f.result()
+    pages = pages_f.result()
+    changed_files_raw = [] if changed_f is None else changed_f.result()
     changed_files = _normalize_changed_files_for_gates(changed_files_raw)
     contract_type = contract.contract_type
 
+    cache_dir = report_dir / "cache"
+    cache_key = ""
+    if tree_f is not None:
+        cache_key = _verify_cache_key(
+            run_mode,
+            diff_base_used,
+            contract.directives,
+            scribe,
+            changed_files_raw,
+            require_css_build,
+            tree_f.result(),
+            git,
+        )
+    cached = _read_cached_verify(cache_dir, cache_key) if cache_key else None
+    if cached is not None:
+        result = dict(cached["result"])
+        result["task_id"] = task_id
+        result["report_path"] = str(report_path)
+        result["verify_cache"] = {"key": cache_key, "hit": True}
+        result["timing"] = _timing_summary(timings, started)
+        _write_report(report_path, result)
+        return result
+
+    enforce_style_only_gates = run_mode == "verify" and contract.strict_requested and contract_type == "style-only"
+    if enforce_style_only_gates:
+        # Read before the build starts: the gates judge the CSS as the task left it.
+        css_rel, css_txt = _read_compiled_css_current()
+        current_f = pool.submit(_timed, timings, "compiled_css_current", _scan_css, css_txt)
+        base_f = pool.submit(_timed, timings, "compiled_css_base", _scan_base_css, diff_base_used, git)
+    build_f = None
+    if run_mode == "verify" and require_css_build and contract.strict_requested:
+        build_f = pool.submit(_timed, timings, "css_build", _compile_css, cache_dir, not use_cache)
+
     checks: dict[str, Any] = {
         "contract_directives_ok": _contract_directives_ok(contract.directives) if contract.strict_requested else True,
         "scribe_source_ok": scribe.ok if contract.strict_requested else True,
@@ -483,24 +865,20 @@ def run_rembrandt_task(
         "implementation_write_reason": impl_reason,
         "implementation_touched_files": impl_files,
     }
-    enforce_style_only_gates = run_mode == "verify" and contract.strict_requested and contract_type == "style-only"
     if run_mode == "verify" and contract.strict_requested:
         checks["theme_source_changed_ok"] = _theme_source_changed(changed_files)
         if enforce_style_only_gates:
-            css_rel, css_txt = _read_compiled_css_current()
             checks["compiled_css_source"] = css_rel or "none"
-            coverage = _component_coverage(css_txt)
+            coverage, curr_vars = current_f.result()
             required_targets = ["navigation", "buttons", "cards_panels", "tables", "forms_inputs", "badges_tags"]
             missing = [t for t in required_targets if not coverage.get(t, False)]
             checks["component_coverage"] = coverage
             checks["component_coverage_missing"] = missing
             checks["component_coverage_ok"] = len(missing) == 0
 
-            base_rel, base_css = _read_compiled_css_at_base(diff_base_used)
+            base_rel, base_vars = base_f.result()
             checks["base_css_source"] = base_rel or "none"
             checks["base_css_source_ok"] = bool(base_rel)
-            curr_vars = _parse_rm_vars(css_txt)
-            base_vars = _parse_rm_vars(base_css)
             required_var_keys = [
                 "rm-font-scale",
                 "rm-panel-radius",
@@ -569,11 +947,10 @@ def run_rembrandt_task(
         checks["scope_is_dashboard_wide"] = contract.directives.get("scope", "") == "dashboard-wide"
         checks["type_is_valid"] = contract_type in CONTRACT_ALLOWED_TYPES
 
-    build_ok, build_reason = (True, "skipped")
-    if run_mode == "verify" and require_css_build and contract.strict_requested:
-        build_ok, build_reason = _compile_css()
+    build_ok, build_reason, build_info = (True, "skipped", {}) if build_f is None else build_f.result()
     checks["build_css_ok"] = build_ok if contract.strict_requested else True
     checks["build_css_reason"] = build_reason
+    checks["css_build"] = build_info
 
     # Completion decision
     strict_ok = True
@@ -657,7 +1034,13 @@ def run_rembrandt_task(
         "changed_files_raw": changed_files_raw,
         "checks": checks,
         "report_path": str(report_path),
+        "timing": _timing_summary(timings, started),
     }
+    if cache_key:
+        result["verify_cache"] = {"key": cache_key, "hit": False}
+        # A failed build usually means a missing toolchain, not a property of the tree; retry it next time.
+        if checks["build_css_ok"]:
+            _write_cached_verify(cache_dir, cache_key, result)
 
     _write_report(report_path, result)
     return result
@@ -676,6 +1059,7 @@ def main() -> int:
     ap.add_argument("--diff-base", default="HEAD")
     ap.add_argument("--base-sha", default="")
     ap.add_argument("--mode", choices=["preflight", "implementation", "verify"], default="verify")
+    ap.add_argument("--no-cache", action="store_true", help="recompute every gate and rebuild CSS even if cached results match")
     args = ap.parse_args()
 
     msg = Path(args.message_file).read_text(encoding="utf-8", errors="replace")
@@ -685,6 +1069,7 @@ def main() -> int:
         diff_base=args.diff_base,
         base_sha=(args.base_sha or "").strip() or None,
         mode=args.mode,
+        use_cache=not args.no_cache,
     )
     print(json.dumps(res, indent=2, sort_keys=True))
     return 0 if res.get("state") == "complete" else 1
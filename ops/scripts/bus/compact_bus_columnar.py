@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+compact_bus_columnar.py
+
+Periodic compaction of sealed (newline-terminated) team bus history into a
+columnar snapshot for analytics panels. Each run appends only the bytes written
+since the previous run as a new segment (Arrow IPC when pyarrow is installed,
+otherwise a NumPy .npy bundle) plus a shared string dictionary.
+
+Read-only with respect to the bus. Requires numpy.
+
+Exit codes:
+  0 ok
+  2 bad usage / analytics extras missing
+  3 bus missing or unreadable
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.teambus import columnar  # noqa: E402
+
+BUS_DEFAULT = Path("~/.openclaw/runtime/logs/team_bus.jsonl").expanduser()
+OUT_DEFAULT = Path("~/.openclaw/runtime/logs/bus_columnar").expanduser()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Compact team bus history into a columnar snapshot.")
+    ap.add_argument("--bus", default=str(BUS_DEFAULT))
+    ap.add_argument("--out", default=str(OUT_DEFAULT), help="snapshot directory")
+    ap.add_argument("--format", choices=["auto", "arrow", "npy"], default="auto")
+    ap.add_argument("--rebuild", action="store_true", help="discard existing segments and re-encode the whole bus")
+    ap.add_argument("--stats", action="store_true", help="print per-type counts and top edges after compacting")
+    args = ap.parse_args()
+
+    bus = Path(args.bus).expanduser()
+    out = Path(args.out).expanduser()
+    fmt = None if args.format == "auto" else args.format
+    started = time.perf_counter()
+    try:
+        manifest = columnar.compact(bus, out, fmt=fmt, rebuild=args.rebuild)
+    except columnar.ColumnarUnavailable as e:
+        print(f"COMPACT ERROR: {e}", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"COMPACT ERROR: cannot read bus: {e}", file=sys.stderr)
+        return 3
+    took_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"COMPACT OK: rows={manifest['rows']} segments={len(manifest['segments'])} "
+        f"sealed_offset={manifest['sealed_offset']} took_ms={took_ms:.1f} out={out}"
+    )
+
+    if args.stats:
+        snap = columnar.load(out)
+        if snap is None:
+            return 0
+        started = time.perf_counter()
+        per_type = columnar.counts_per_bucket(snap, "type", bucket_s=86400)
+        edges = columnar.edge_counts(snap)
+        took_ms = (time.perf_counter() - started) * 1000
+        totals = {k: sum(v) for k, v in per_type["series"].items()}
+        top_edges = sorted(edges.items(), key=lambda kv: kv[1], reverse=True)[:10]
+        print(
+            json.dumps(
+                {
+                    "rows": len(snap),
+                    "query_ms": round(took_ms, 2),
+                    "types": dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True)),
+                    "top_edges": [{"actor": a, "target": t, "count": n} for (a, t), n in top_edges],
+                },
+                indent=2,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -34,7 +34,6 @@ Notes:
 """
 
 import argparse
-import json
 import os
 import sys
 from dataclasses import dataclass
@@ -42,6 +41,12 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.teambus.record import EventRecord  # noqa: E402
+
 
 DEFAULT_DENY = {"high", "critical"}
 
@@ -154,20 +159,22 @@ class TaskDetail:
     block_state: str
     approval_status: str
     approval_expires_at: Optional[str]
-    blocking_risk: Optional[dict]
-    last_event: dict
+    blocking_risk: Optional[EventRecord]
+    last_event: EventRecord
     counts: Dict[str, int]
 
-def load_events(bus_path: Path) -> List[dict]:
-    events: List[dict] = []
-    with bus_path.open("r", encoding="utf-8") as f:
+def load_events(bus_path: Path) -> List[EventRecord]:
+    # Compact records keep --interval mode cheap on large buses; fields decode on access.
+    events: List[EventRecord] = []
+    with bus_path.open("rb") as f:
         for line_no, line in enumerate(f, 1):
             if not line.strip():
                 continue
-            try:
-                events.append(json.loads(line))
-            except Exception as e:
-                print(f"[warn] bus parse error line {line_no}: {e}", file=sys.stderr)
+            rec = EventRecord.from_line(line)
+            if rec is None:
+                print(f"[warn] bus parse error line {line_no}: not a JSON object", file=sys.stderr)
+                continue
+            events.append(rec)
     return events
 
 def truncate(s: str, width: int) -> str:
@@ -177,10 +184,10 @@ def truncate(s: str, width: int) -> str:
         return s[:width]
     return s[: max(0, width - 1)] + "…"
 
-def compute_task_detail(task_id: str, evs: List[dict], deny_set: set) -> TaskDetail:
+def compute_task_detail(task_id: str, evs: List[EventRecord], deny_set: set) -> TaskDetail:
     block_state: Optional[str] = None  # None | "BLOCKED" | "UNBLOCKED"
     last_unblocked_index = -1
-    approval_ev: Optional[dict] = None
+    approval_ev: Optional[EventRecord] = None
 
     counts: Dict[str, int] = {}
     for ev in evs:
@@ -188,18 +195,18 @@ def compute_task_detail(task_id: str, evs: List[dict], deny_set: set) -> TaskDet
         counts[t] = counts.get(t, 0) + 1
 
     for i, ev in enumerate(evs):
-        t = ev.get("type")
+        t = ev.type
         if t == "BLOCKED":
             block_state = "BLOCKED"
         elif t == "UNBLOCKED":
             block_state = "UNBLOCKED"
             last_unblocked_index = i
-        elif t == "APPROVAL" and ev.get("agent") == "deiphobe":
+        elif t == "APPROVAL" and ev.agent == "deiphobe":
             approval_ev = ev  # newest wins
 
     blocking_risk = None
     for ev in evs[last_unblocked_index + 1:]:
-        if ev.get("type") == "RISK":
+        if ev.type == "RISK":
             sev = (ev.get("severity") or "").strip()
             if sev in deny_set:
                 blocking_risk = ev
@@ -238,7 +245,7 @@ def compute_task_detail(task_id: str, evs: List[dict], deny_set: set) -> TaskDet
         counts=counts,
     )
 
-def compute_task_row(task_id: str, evs: List[dict], deny_set: set) -> TaskRow:
+def compute_task_row(task_id: str, evs: List[EventRecord], deny_set: set) -> TaskRow:
     d = compute_task_detail(task_id, evs, deny_set)
 
     approval = d.approval_status
@@ -248,7 +255,7 @@ def compute_task_row(task_id: str, evs: List[dict], deny_set: set) -> TaskRow:
     elif approval == "expired":
         approval = "expired"
 
-    last = d.last_event
+    last = d.last_event.to_dict()
     return TaskRow(
         task_id=task_id,
         state=d.state,
@@ -304,12 +311,13 @@ def render_detail(d: TaskDetail, color: bool):
         print(f"{k('APPROVAL EXPIRES')}: {d.approval_expires_at}")
 
     if d.blocking_risk:
-        sev = d.blocking_risk.get("severity")
-        summ = d.blocking_risk.get("summary", "")
+        risk = d.blocking_risk.to_dict()
+        sev = risk.get("severity")
+        summ = risk.get("summary", "")
         print(f"{k('BLOCKING RISK')}: severity={sev}")
         print(f"  summary: {summ}")
 
-    le = d.last_event
+    le = d.last_event.to_dict()
     print(f"{k('LAST EVENT')}:")
     print(f"  ts: {le.get('ts')}")
     print(f"  agent: {le.get('agent')}")
@@ -317,13 +325,14 @@ def render_detail(d: TaskDetail, color: bool):
     print(f"  summary: {le.get('summary')}")
     print(f"{k('COUNTS')}: " + ", ".join([f"{t}={n}" for t, n in sorted(d.counts.items())]))
 
-def render_event_tail(evs: List[dict], n: int, color: bool):
+def render_event_tail(evs: List[EventRecord], n: int, color: bool):
     if n <= 0:
         return
     tail = evs[-n:]
 
     print("\nRECENT EVENTS:")
-    for ev in tail:
+    for rec in tail:
+        ev = rec.to_dict()
         ts = ev.get("ts", "")
         agent = ev.get("agent", "")
         etype = ev.get("type", "")
@@ -377,9 +386,9 @@ def main():
     def run_once():
         events = load_events(bus_path)
 
-        by_task: Dict[str, List[dict]] = {}
+        by_task: Dict[str, List[EventRecord]] = {}
         for ev in events:
-            tid = ev.get("task_id")
+            tid = ev.task_id
             if not tid:
                 continue
             if args.filter and args.filter not in tid:
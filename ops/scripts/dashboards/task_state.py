@@ -8,10 +8,16 @@ Usage:
   task_state.py --task-id TASK --bus /path/to/team_bus.jsonl
 """
 
-import argparse, json
+import argparse, sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.teambus.record import EventRecord  # noqa: E402
+
 
 DENY_RISK_SEVERITY = {"high", "critical"}
 
@@ -24,14 +30,16 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def load_events(bus_path: Path, task_id: str):
+def load_events(bus_path: Path, task_id: str) -> list[EventRecord]:
     events = []
-    with bus_path.open("r", encoding="utf-8") as f:
+    with bus_path.open("rb") as f:
         for line in f:
             if not line.strip():
                 continue
-            ev = json.loads(line)
-            if ev.get("task_id") == task_id:
+            ev = EventRecord.from_line(line)
+            if ev is None:
+                raise ValueError(f"invalid bus line: {line[:80]!r}")
+            if ev.task_id == task_id:
                 events.append(ev)
     return events
 
@@ -55,7 +63,7 @@ def main():
     blocking_risk = None
 
     for i, ev in enumerate(events):
-        t = ev.get("type")
+        t = ev.type
 
         if t == "BLOCKED":
             block_state = "BLOCKED"
@@ -64,12 +72,12 @@ def main():
             block_state = "UNBLOCKED"
             last_unblocked_index = i
 
-        elif t == "APPROVAL" and ev.get("agent") == "deiphobe":
+        elif t == "APPROVAL" and ev.agent == "deiphobe":
             approval = ev  # newest wins
 
     # Check for blocking risks after last UNBLOCKED
     for ev in events[last_unblocked_index + 1:]:
-        if ev.get("type") == "RISK":
+        if ev.type == "RISK":
             sev = (ev.get("severity") or "").strip()
             if sev in DENY_RISK_SEVERITY:
                 blocking_risk = ev
@@ -99,7 +107,7 @@ def main():
     else:
         state = "PENDING"
 
-    last_event = events[-1]
+    last_event = events[-1].to_dict()
 
     # Output (intentionally boring and clear)
     print(f"TASK: {args.task_id}")
@@ -111,8 +119,9 @@ def main():
         print(f"APPROVAL EXPIRES: {approval['expires_at']}")
 
     if blocking_risk:
-        print(f"BLOCKING RISK: severity={blocking_risk.get('severity')}")
-        print(f"  summary: {blocking_risk.get('summary')}")
+        risk = blocking_risk.to_dict()
+        print(f"BLOCKING RISK: severity={risk.get('severity')}")
+        print(f"  summary: {risk.get('summary')}")
 
     print("LAST EVENT:")
     print(f"  ts: {last_event.get('ts')}")
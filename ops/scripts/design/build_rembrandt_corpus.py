@@ -2,24 +2,82 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 from datetime import datetime, timezone
 import hashlib
 import html
 from html.parser import HTMLParser
 import json
+import os
 from pathlib import Path
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import urllib.error
 import urllib.parse
 import urllib.request
+from typing import Callable
+
+CHUNK_BYTES = 64 * 1024
+MAX_BYTES_DEFAULT = 16 * 1024 * 1024
+
+
+class SourceTooLarge(Exception):
+    pass
+
+
+class TextNormalizer:
+    """
+    Streaming form of: join parts with "\\n", html.unescape, collapse
+    [ \\t]+ to one space and 3+ newlines to two, strip. Whitespace is held
+    back until the next non-whitespace character so newline runs and the
+    final strip come out exactly as on the joined string.
+    """
+
+    def __init__(self, write: Callable[[str], None]) -> None:
+        self._write = write
+        self._pending = ""
+        self._started = False
+        self._first = True
+
+    def part(self, txt: str) -> None:
+        piece = re.sub(r"[ \t]+", " ", html.unescape(txt))
+        self._pending += piece if self._first else "\n" + piece
+        self._first = False
+        stripped = self._pending.rstrip()
+        if not stripped:
+            return
+        out, self._pending = stripped, self._pending[len(stripped):]
+        if not self._started:
+            out = out.lstrip()
+            self._started = True
+        self._write(re.sub(r"\n{3,}", "\n\n", out))
 
 
 class TextExtractor(HTMLParser):
-    def __init__(self) -> None:
+    """
+    Visible text of an HTML document, fed in any number of chunks. Text is
+    passed to `write` as it is found (or collected for text() when no writer
+    is given). Input is handed to the parser only up to the last "<" seen,
+    so chunk boundaries never split a text node differently from feeding
+    the whole document at once.
+    """
+
+    def __init__(self, write: Callable[[str], None] | None = None) -> None:
         super().__init__()
         self._skip = 0
-        self._parts: list[str] = []
+        self._hold = ""
+        self._out: list[str] = []
+        self._norm = TextNormalizer(write or self._out.append)
+
+    def feed(self, data: str) -> None:
+        self._hold += data
+        cut = self._hold.rfind("<")
+        if cut > 0:
+            super().feed(self._hold[:cut])
+            self._hold = self._hold[cut:]
 
     def handle_starttag(self, tag: str, attrs) -> None:
         if tag in {"script", "style", "noscript"}:
@@ -34,14 +92,17 @@ class TextExtractor(HTMLParser):
             return
         txt = data.strip()
         if txt:
-            self._parts.append(txt)
+            self._norm.part(txt)
+
+    def finish(self) -> None:
+        """Parse the held tail. The parser is not closed, matching the original whole-document behaviour."""
+        if self._hold:
+            super().feed(self._hold)
+            self._hold = ""
 
     def text(self) -> str:
-        merged = "\n".join(self._parts)
-        merged = html.unescape(merged)
-        merged = re.sub(r"[ \t]+", " ", merged)
-        merged = re.sub(r"\n{3,}", "\n\n", merged)
-        return merged.strip()
+        self.finish()
+        return "".join(self._out)
 
 
 def utc_now() -> str:
@@ -71,17 +132,214 @@ def enforce_allowed_domain(url: str, allowed_domains: list[str]) -> bool:
     return False
 
 
-def fetch_url(url: str, timeout_s: int) -> tuple[int, bytes, str]:
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "OpenClaw-Rembrandt-Corpus/1.0 (+local-cache)"},
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        code = int(getattr(resp, "status", 200))
-        ctype = str(resp.headers.get("Content-Type", ""))
-        data = resp.read()
-    return code, data, ctype
+def fetch_url(
+    url: str,
+    timeout_s: int,
+    etag: str = "",
+    last_modified: str = "",
+    sink: Callable[[bytes], None] | None = None,
+    max_bytes: int = MAX_BYTES_DEFAULT,
+) -> tuple[int, int, str, dict[str, str]]:
+    """
+    GET `url`, conditional when validators from a previous fetch are given,
+    passing the body to `sink` in CHUNK_BYTES pieces. Returns (status,
+    bytes_read, content_type, validators); a 304 comes back as status 304
+    with no body rather than an HTTPError. Raises SourceTooLarge past
+    `max_bytes`.
+    """
+    headers = {"User-Agent": "OpenClaw-Rembrandt-Corpus/1.0 (+local-cache)"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    total = 0
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            code = int(getattr(resp, "status", 200))
+            ctype = str(resp.headers.get("Content-Type", ""))
+            validators = {"etag": resp.headers.get("ETag", ""), "last_modified": resp.headers.get("Last-Modified", "")}
+            declared = resp.headers.get("Content-Length", "")
+            if declared.isdigit() and int(declared) > max_bytes:
+                raise SourceTooLarge(f"content-length {declared} > {max_bytes}")
+            while True:
+                chunk = resp.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > max_bytes:
+                    raise SourceTooLarge(f"body exceeds {max_bytes} bytes")
+                if sink is not None:
+                    sink(chunk)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        return 304, 0, "", {"etag": e.headers.get("ETag", ""), "last_modified": e.headers.get("Last-Modified", "")}
+    return code, total, ctype, validators
+
+
+class SourceWriter:
+    """
+    Consumes a response body chunk by chunk: hashes the bytes, writes the
+    decoded HTML and its extracted text to temp files beside the final
+    paths. commit() renames them into place; discard() drops them, so a
+    failed, oversized or unchanged fetch never touches the stored copy.
+    """
+
+    def __init__(self, raw_path: Path, text_path: Path) -> None:
+        self.raw_path = raw_path
+        self.text_path = text_path
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        self._raw_tmp = raw_path.with_name(raw_path.name + suffix)
+        self._text_tmp = text_path.with_name(text_path.name + suffix)
+        self._raw = self._raw_tmp.open("w", encoding="utf-8")
+        self._text = self._text_tmp.open("w", encoding="utf-8")
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._extractor = TextExtractor(self._text.write)
+        self.sha256 = hashlib.sha256()
+
+    def write(self, chunk: bytes) -> None:
+        self.sha256.update(chunk)
+        self._feed(self._decoder.decode(chunk))
+
+    def _feed(self, txt: str) -> None:
+        if txt:
+            self._raw.write(txt)
+            self._extractor.feed(txt)
+
+    def finish(self) -> None:
+        self._feed(self._decoder.decode(b"", final=True))
+        self._extractor.finish()
+        self._raw.close()
+        self._text.close()
+
+    def commit(self) -> None:
+        os.replace(self._raw_tmp, self.raw_path)
+        os.replace(self._text_tmp, self.text_path)
+
+    def discard(self) -> None:
+        for f in (self._raw, self._text):
+            f.close()
+        for tmp in (self._raw_tmp, self._text_tmp):
+            tmp.unlink(missing_ok=True)
+
+
+def load_previous_meta(meta_dir: Path, src_id: str, url: str, out_root: Path) -> dict:
+    """Last successful fetch of this source, if its raw/text files are still on disk."""
+    try:
+        prev = json.loads((meta_dir / f"{src_id}.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(prev, dict) or not prev.get("ok") or prev.get("url") != url:
+        return {}
+    for key in ("raw_path", "text_path"):
+        rel = str(prev.get(key) or "")
+        if not rel or not (out_root.parent / rel).exists():
+            return {}
+    return prev
+
+
+class DomainLimiter:
+    """Caps concurrent requests per host so a parallel refresh stays polite."""
+
+    def __init__(self, per_domain: int) -> None:
+        self.per_domain = max(1, per_domain)
+        self._sems: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url: str) -> threading.Semaphore:
+        host = (urllib.parse.urlparse(url).hostname or "").lower()
+        with self._lock:
+            if host not in self._sems:
+                self._sems[host] = threading.Semaphore(self.per_domain)
+            return self._sems[host]
+
+
+def fetch_source(
+    src: dict,
+    allowed_domains: list[str],
+    out_root: Path,
+    ts: str,
+    timeout_s: int,
+    limiter: DomainLimiter,
+    force: bool,
+    max_bytes: int = MAX_BYTES_DEFAULT,
+) -> dict | None:
+    raw_dir = out_root / "raw"
+    text_dir = out_root / "text"
+    meta_dir = out_root / "meta"
+    src_id = safe_slug(str(src.get("id", "")))
+    url = str(src.get("url", "")).strip()
+    topic = str(src.get("topic", "")).strip()
+    if not src_id or not url:
+        return None
+
+    row: dict[str, object] = {
+        "id": src_id,
+        "url": url,
+        "topic": topic,
+        "fetched_at": ts,
+        "ok": False,
+    }
+
+    if not enforce_allowed_domain(url, allowed_domains):
+        row["error"] = "domain_not_allowed"
+        (meta_dir / f"{src_id}.json").write_text(json.dumps(row, indent=2), encoding="utf-8")
+        return row
+
+    prev = {} if force else load_previous_meta(meta_dir, src_id, url, out_root)
+    writer = SourceWriter(raw_dir / f"{src_id}.html", text_dir / f"{src_id}.txt")
+    try:
+        with limiter.slot(url):
+            code, nbytes, ctype, validators = fetch_url(
+                url,
+                timeout_s=timeout_s,
+                etag=str(prev.get("etag") or ""),
+                last_modified=str(prev.get("last_modified") or ""),
+                sink=writer.write,
+                max_bytes=max_bytes,
+            )
+        writer.finish()
+        digest = writer.sha256.hexdigest() if code != 304 else str(prev.get("sha256") or "")
+        if prev and (code == 304 or digest == prev.get("sha256")):
+            # Unchanged upstream: keep raw/text as they are, refresh validators.
+            writer.discard()
+            row = dict(prev)
+            row.update({"fetched_at": ts, "changed": False, "checked_status": code})
+            for key, value in validators.items():
+                if value:
+                    row[key] = value
+        else:
+            writer.commit()
+            row.update(
+                {
+                    "ok": True,
+                    "changed": True,
+                    "status_code": code,
+                    "content_type": ctype,
+                    "bytes": nbytes,
+                    "sha256": digest,
+                    "etag": validators.get("etag", ""),
+                    "last_modified": validators.get("last_modified", ""),
+                    "raw_path": str((raw_dir / f"{src_id}.html").relative_to(out_root.parent)),
+                    "text_path": str((text_dir / f"{src_id}.txt").relative_to(out_root.parent)),
+                    "meta_path": str((meta_dir / f"{src_id}.json").relative_to(out_root.parent)),
+                }
+            )
+    except SourceTooLarge as e:
+        writer.discard()
+        row["error"] = "too_large"
+        row["detail"] = str(e)
+    except urllib.error.HTTPError as e:
+        writer.discard()
+        row["error"] = f"http_{e.code}"
+    except Exception as e:  # pragma: no cover - defensive for network/runtime differences
+        writer.discard()
+        row["error"] = f"fetch_error:{type(e).__name__}"
+        row["detail"] = str(e)[:200]
+
+    (meta_dir / f"{src_id}.json").write_text(json.dumps(row, indent=2), encoding="utf-8")
+    return row
 
 
 def build(args: argparse.Namespace) -> int:
@@ -102,67 +360,24 @@ def build(args: argparse.Namespace) -> int:
     for d in (raw_dir, text_dir, meta_dir):
         d.mkdir(parents=True, exist_ok=True)
 
-    index_rows: list[dict] = []
-    ok_count = 0
-    err_count = 0
     ts = utc_now()
-
-    for src in sources:
-        src_id = safe_slug(str(src.get("id", "")))
-        url = str(src.get("url", "")).strip()
-        topic = str(src.get("topic", "")).strip()
-        if not src_id or not url:
-            continue
-
-        row: dict[str, object] = {
-            "id": src_id,
-            "url": url,
-            "topic": topic,
-            "fetched_at": ts,
-            "ok": False,
-        }
-
-        if not enforce_allowed_domain(url, allowed_domains):
-            row["error"] = "domain_not_allowed"
-            err_count += 1
-            index_rows.append(row)
-            (meta_dir / f"{src_id}.json").write_text(json.dumps(row, indent=2), encoding="utf-8")
-            continue
-
-        try:
-            code, raw_bytes, ctype = fetch_url(url, timeout_s=args.timeout)
-            raw_html = raw_bytes.decode("utf-8", errors="replace")
-            extractor = TextExtractor()
-            extractor.feed(raw_html)
-            text = extractor.text()
-            digest = hashlib.sha256(raw_bytes).hexdigest()
-
-            (raw_dir / f"{src_id}.html").write_text(raw_html, encoding="utf-8")
-            (text_dir / f"{src_id}.txt").write_text(text, encoding="utf-8")
-
-            row.update(
-                {
-                    "ok": True,
-                    "status_code": code,
-                    "content_type": ctype,
-                    "bytes": len(raw_bytes),
-                    "sha256": digest,
-                    "raw_path": str((raw_dir / f"{src_id}.html").relative_to(out_root.parent)),
-                    "text_path": str((text_dir / f"{src_id}.txt").relative_to(out_root.parent)),
-                    "meta_path": str((meta_dir / f"{src_id}.json").relative_to(out_root.parent)),
-                }
+    started = time.perf_counter()
+    limiter = DomainLimiter(args.per_domain)
+    # Fetches overlap across sources (bounded per host); index order follows the manifest.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        results = list(
+            pool.map(
+                lambda src: fetch_source(
+                    src, allowed_domains, out_root, ts, args.timeout, limiter, args.force, args.max_bytes
+                ),
+                sources,
             )
-            ok_count += 1
-        except urllib.error.HTTPError as e:
-            row["error"] = f"http_{e.code}"
-            err_count += 1
-        except Exception as e:  # pragma: no cover - defensive for network/runtime differences
-            row["error"] = f"fetch_error:{type(e).__name__}"
-            row["detail"] = str(e)[:200]
-            err_count += 1
-
-        index_rows.append(row)
-        (meta_dir / f"{src_id}.json").write_text(json.dumps(row, indent=2), encoding="utf-8")
+        )
+    index_rows: list[dict] = [row for row in results if row is not None]
+    ok_count = sum(1 for row in index_rows if row.get("ok"))
+    err_count = len(index_rows) - ok_count
+    changed_count = sum(1 for row in index_rows if row.get("ok") and row.get("changed"))
+    took_s = time.perf_counter() - started
 
     with index_path.open("w", encoding="utf-8") as f:
         for row in index_rows:
@@ -174,6 +389,8 @@ def build(args: argparse.Namespace) -> int:
         f"- built_at: {ts}",
         f"- sources_total: {len(index_rows)}",
         f"- sources_ok: {ok_count}",
+        f"- sources_changed: {changed_count}",
+        f"- sources_unchanged: {ok_count - changed_count}",
         f"- sources_error: {err_count}",
         f"- index: {index_path}",
         "",
@@ -189,7 +406,10 @@ def build(args: argparse.Namespace) -> int:
         summary.append("- none")
 
     summary_path.write_text("\n".join(summary) + "\n", encoding="utf-8")
-    print(f"[rembrandt-corpus] built={ts} total={len(index_rows)} ok={ok_count} err={err_count}")
+    print(
+        f"[rembrandt-corpus] built={ts} total={len(index_rows)} ok={ok_count} "
+        f"changed={changed_count} err={err_count} took_s={took_s:.2f}"
+    )
     print(f"[rembrandt-corpus] index={index_path}")
     print(f"[rembrandt-corpus] summary={summary_path}")
     return 0
@@ -209,6 +429,15 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     )
     p.add_argument("--timeout", type=int, default=20, help="Fetch timeout seconds per source.")
     p.add_argument("--limit", type=int, default=None, help="Optional max number of sources.")
+    p.add_argument("--workers", type=int, default=8, help="Concurrent fetches across all hosts.")
+    p.add_argument("--per-domain", type=int, default=2, help="Concurrent fetches per host.")
+    p.add_argument(
+        "--max-bytes",
+        type=int,
+        default=MAX_BYTES_DEFAULT,
+        help="Per-source body cap; larger sources fail with too_large and keep their previous copy.",
+    )
+    p.add_argument("--force", action="store_true", help="Ignore stored ETag/Last-Modified/sha256 and re-extract every source.")
     return p.parse_args(argv)
 
 
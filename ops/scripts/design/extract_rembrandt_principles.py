@@ -2,12 +2,24 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+import hashlib
 import json
+import os
 from pathlib import Path
 import re
 import sys
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ops.textindex.near_dup import NearDupIndex  # noqa: E402
+
+# Bump when sentence chunking or scoring changes; cached partials from another version are re-extracted.
+EXTRACTOR_VERSION = 1
+
 
 PRINCIPLE_HINTS = {
     "must",
@@ -179,6 +191,28 @@ def extract_principles(text: str, max_items: int) -> list[str]:
     return [s for _, s in ranked[:max_items]]
 
 
+def _extract_job(job: tuple[str, int]) -> list[str]:
+    text, max_items = job
+    return extract_principles(text, max_items=max_items)
+
+
+def load_partial(path: Path, text_sha256: str, max_items: int) -> dict | None:
+    """Cached extraction for one source, if it was made from the same text with the same settings."""
+    try:
+        partial = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(partial, dict)
+        or partial.get("version") != EXTRACTOR_VERSION
+        or partial.get("text_sha256") != text_sha256
+        or partial.get("max_per_source") != max_items
+        or not isinstance(partial.get("principles"), list)
+    ):
+        return None
+    return partial
+
+
 def load_index(index_path: Path) -> list[dict]:
     rows: list[dict] = []
     for line in index_path.read_text(encoding="utf-8", errors="replace").splitlines():
@@ -205,6 +239,8 @@ def build(args: argparse.Namespace) -> int:
     weak_report_md = root / "WEAK_SOURCES.md"
     weak_report_json = root / "weak_sources.json"
     citations_md = root / "PRINCIPLES_CITATIONS.md"
+    canon_path = root / "principles_canon.jsonl"
+    near_dup_path = root / "cache" / "near_dup.json"
 
     if not index_path.exists():
         print(f"missing index: {index_path}", file=sys.stderr)
@@ -212,9 +248,12 @@ def build(args: argparse.Namespace) -> int:
 
     rows = load_index(index_path)
     now = utc_now()
-    out_rows: list[dict] = []
-    weak_rows: list[dict] = []
-    ok = 0
+    partial_dir = root / "cache" / "principles"
+    partial_dir.mkdir(parents=True, exist_ok=True)
+
+    # Pass 1: hash every source's text and reuse cached partials; collect the rest.
+    sources: list[tuple[dict, str, dict | None]] = []
+    pending: dict[str, tuple[str, str]] = {}
     for row in rows:
         if not row.get("ok"):
             continue
@@ -224,22 +263,58 @@ def build(args: argparse.Namespace) -> int:
         text_path = text_dir / f"{src_id}.txt"
         if not text_path.exists():
             continue
-        text = text_path.read_text(encoding="utf-8", errors="replace")
-        principles = extract_principles(text, max_items=args.max_per_source)
-        accepted = len(principles) >= args.min_principles
+        data = text_path.read_bytes()
+        text_sha256 = hashlib.sha256(data).hexdigest()
+        partial = None if args.force else load_partial(partial_dir / f"{src_id}.json", text_sha256, args.max_per_source)
+        if partial is None:
+            pending[src_id] = (data.decode("utf-8", errors="replace"), text_sha256)
+        sources.append((row, src_id, partial))
+
+    # Pass 2: extract changed sources, in parallel when there is more than one.
+    extracted: dict[str, list[str]] = {}
+    jobs = [(text, args.max_per_source) for text, _ in pending.values()]
+    if len(jobs) > 1 and args.jobs != 1:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), args.jobs or os.cpu_count() or 1)) as pool:
+            extracted = dict(zip(pending, pool.map(_extract_job, jobs)))
+    else:
+        extracted = {src_id: _extract_job(job) for src_id, job in zip(pending, jobs)}
+
+    # Pass 3: outputs are regenerated from partials; principle files only for changed sources.
+    out_rows: list[dict] = []
+    weak_rows: list[dict] = []
+    principles_by_id: dict[str, list[str]] = {}
+    ok = 0
+    for row, src_id, partial in sources:
         p_path = out_dir / f"{src_id}.md"
-        lines = [f"# Principles — {src_id}", "", f"- generated_at: {now}", f"- source_url: {row.get('url','')}", ""]
+        url = row.get("url", "")
+        if partial is None:
+            partial = {
+                "version": EXTRACTOR_VERSION,
+                "id": src_id,
+                "text_sha256": pending[src_id][1],
+                "max_per_source": args.max_per_source,
+                "generated_at": now,
+                "principles": extracted[src_id],
+            }
+            (partial_dir / f"{src_id}.json").write_text(json.dumps(partial, ensure_ascii=False, indent=2), encoding="utf-8")
+        principles = [str(p) for p in partial["principles"]]
+        principles_by_id[src_id] = principles
+        generated_at = str(partial.get("generated_at") or now)
+        lines = [f"# Principles — {src_id}", "", f"- generated_at: {generated_at}", f"- source_url: {url}", ""]
         for p in principles:
             lines.append(f"- {p}")
         if not principles:
             lines.append("- [no high-signal principles extracted]")
-        p_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        body = "\n".join(lines) + "\n"
+        if src_id in pending or not p_path.exists() or p_path.read_text(encoding="utf-8", errors="replace") != body:
+            p_path.write_text(body, encoding="utf-8")
+        accepted = len(principles) >= args.min_principles
         out_row = {
             "id": src_id,
             "topic": row.get("topic", ""),
-            "url": row.get("url", ""),
+            "url": url,
             "source_name": src_id.replace("-", " ").title(),
-            "generated_at": now,
+            "generated_at": generated_at,
             "principles_count": len(principles),
             "principles_path": str(p_path.relative_to(root.parent)),
             "accepted": accepted,
@@ -252,7 +327,7 @@ def build(args: argparse.Namespace) -> int:
                 {
                     "id": src_id,
                     "topic": topic,
-                    "url": row.get("url", ""),
+                    "url": url,
                     "principles_count": len(principles),
                     "min_required": args.min_principles,
                     "replacement_candidates": TOPIC_REPLACEMENTS.get(topic, []),
@@ -263,6 +338,30 @@ def build(args: argparse.Namespace) -> int:
         for row in out_rows:
             f.write(json.dumps(row, ensure_ascii=False) + "\n")
 
+    # Near-duplicate canon over accepted sources; only sources whose principles changed are re-fingerprinted.
+    near_dup = NearDupIndex.load(near_dup_path)
+    fingerprinted = 0
+    for src_id, principles in principles_by_id.items():
+        key = hashlib.sha256("\n".join(principles).encode("utf-8")).hexdigest()
+        fingerprinted += near_dup.update(src_id, key, principles)
+    near_dup.retain(principles_by_id)
+    near_dup.save(near_dup_path)
+    by_id = {row["id"]: row for row in out_rows}
+    clusters = near_dup.clusters([row["id"] for row in out_rows if row.get("accepted")])
+    with canon_path.open("w", encoding="utf-8") as f:
+        for cluster in clusters:
+            canon_row = {
+                "text": cluster.canonical,
+                "topic": by_id[cluster.members[0][0]].get("topic", ""),
+                "citations": [
+                    {"id": src, "url": by_id[src].get("url", ""), "principles_path": by_id[src].get("principles_path", "")}
+                    for src in cluster.sources
+                ],
+                "duplicates": len(cluster.members) - 1,
+            }
+            f.write(json.dumps(canon_row, ensure_ascii=False) + "\n")
+    merged = sum(len(c.members) - 1 for c in clusters)
+
     snap = [
         "# Rembrandt Principles Snapshot",
         "",
@@ -272,6 +371,8 @@ def build(args: argparse.Namespace) -> int:
         f"- accepted_sources: {sum(1 for r in out_rows if r.get('accepted'))}",
         f"- weak_sources: {len(weak_rows)}",
         f"- index: {principles_index_path}",
+        f"- canonical_principles: {len(clusters)} ({merged} near-duplicates merged)",
+        f"- canon: {canon_path}",
         "",
         "## Top Principle Files",
     ]
@@ -329,8 +430,9 @@ def build(args: argparse.Namespace) -> int:
         citation_lines.append("| none | n/a | n/a | n/a | n/a | n/a |")
     citations_md.write_text("\n".join(citation_lines) + "\n", encoding="utf-8")
 
-    print(f"[rembrandt-principles] generated={now} sources={ok}")
+    print(f"[rembrandt-principles] generated={now} sources={ok} extracted={len(pending)} cached={ok - len(pending)}")
     print(f"[rembrandt-principles] index={principles_index_path}")
+    print(f"[rembrandt-principles] canon={canon_path} principles={len(clusters)} merged={merged} fingerprinted={fingerprinted}")
     print(f"[rembrandt-principles] snapshot={snapshot_path}")
     print(f"[rembrandt-principles] weak_md={weak_report_md}")
     print(f"[rembrandt-principles] weak_json={weak_report_json}")
@@ -343,6 +445,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--corpus", default="docs/design/corpus", help="Corpus root directory.")
     p.add_argument("--max-per-source", type=int, default=32, help="Max principles per source file.")
     p.add_argument("--min-principles", type=int, default=2, help="Minimum principles required for a source to be accepted.")
+    p.add_argument("--jobs", type=int, default=0, help="Worker processes for changed sources (0 = CPU count, 1 = in-process).")
+    p.add_argument("--force", action="store_true", help="Ignore cached partials and re-extract every source.")
     return p.parse_args(argv)
 
 
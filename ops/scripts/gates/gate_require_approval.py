@@ -8,8 +8,14 @@ Allows execution ONLY if:
 - Latest Deiphobe APPROVAL exists and is unexpired
 """
 
-import argparse, json, sys
+import argparse, sys
 from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from ops.teambus.codec import loads, prefer_backends  # noqa: E402
 
 def parse_ts(ts: str) -> datetime:
     return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
@@ -29,13 +35,16 @@ def main() -> int:
         print("GATE ERROR: empty deny set", file=sys.stderr)
         return 14
 
+    # Every non-blank line is decoded: a corrupt or truncated line anywhere on
+    # the bus fails the gate closed (no byte prefilter here).
+    prefer_backends("json")
     events = []
     try:
-        with open(args.bus, "r", encoding="utf-8") as f:
+        with open(args.bus, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
-                ev = json.loads(line)
+                ev = loads(line)
                 if ev.get("task_id") == args.task_id:
                     events.append(ev)
     except Exception as e:
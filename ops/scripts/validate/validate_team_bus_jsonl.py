@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 import json
 import sys
-from jsonschema import Draft7Validator
-
-schema = json.load(open("schemas/team_bus.v1.json", "r", encoding="utf-8"))
-validator = Draft7Validator(schema)
 
 if len(sys.argv) < 2:
     print("usage: validate_team_bus_jsonl.py <events.jsonl>", file=sys.stderr)
     sys.exit(2)
 
+# jsonschema is slow to import; only pay for it once there is something to validate.
+from jsonschema import Draft7Validator  # noqa: E402
+
+schema = json.load(open("schemas/team_bus.v1.json", "r", encoding="utf-8"))
+validator = Draft7Validator(schema)
+
 bad = 0
 with open(sys.argv[1], "r", encoding="utf-8") as f:
     for i, line in enumerate(f, 1):
@@ -0,0 +1,10 @@
+"""
+ops.teambus — shared readers for the append-only team bus (team_bus.jsonl).
+
+Rules:
+- Read-side only: decoding and record types, never bus writes.
+- Stdlib only; optional accelerators must degrade to the stdlib path.
+- numpy/pyarrow-backed analytics (columnar) are optional features: they raise
+  ColumnarUnavailable when missing and callers fall back to row scans.
+- Callers (UI/agents/dashboards) import from here instead of re-parsing lines.
+"""
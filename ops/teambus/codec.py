@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Optional
+
+# Decoder selection: orjson, then msgspec, then the stdlib, resolved on the first
+# decode so importing this module stays cheap. OPENCLAW_JSON_BACKEND=json (or
+# orjson/msgspec) pins a backend, e.g. to compare results.
+BACKENDS = ("orjson", "msgspec", "json")
+_order: tuple[str, ...] = BACKENDS
+_loads: Optional[Callable[[bytes], Any]] = None
+_backend = ""
+DECODE_ERRORS: tuple[type[BaseException], ...] = (ValueError,)
+
+
+def _import_backend(name: str) -> Optional[Callable[[bytes], Any]]:
+    global DECODE_ERRORS
+    try:
+        if name == "orjson":
+            import orjson
+
+            return orjson.loads
+        if name == "msgspec":
+            import msgspec
+
+            DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+            return msgspec.json.Decoder().decode
+    except ImportError:
+        return None
+    return json.loads
+
+
+def _select() -> Callable[[bytes], Any]:
+    global _loads, _backend
+    wanted = (os.environ.get("OPENCLAW_JSON_BACKEND") or "").strip().lower()
+    for name in ((wanted,) if wanted in BACKENDS else _order) + ("json",):
+        fn = _import_backend(name)
+        if fn is not None:
+            _loads, _backend = fn, name
+            return fn
+    raise AssertionError("unreachable: json is always available")
+
+
+def prefer_backends(*names: str) -> None:
+    """
+    Set the default backend order (OPENCLAW_JSON_BACKEND still wins). Short-lived
+    scripts prefer "json": importing orjson costs more than it saves on a scan.
+    """
+    global _order, _loads
+    _order = tuple(n for n in names if n in BACKENDS) or BACKENDS
+    _loads = None
+
+
+def backend() -> str:
+    """Name of the active decoder (resolves it if nothing was decoded yet)."""
+    if _loads is None:
+        _select()
+    return _backend
+
+
+def loads(raw: bytes | str) -> Any:
+    """Decode one JSON document with the selected backend."""
+    return (_loads or _select())(raw)
+
+
+def loads_object(raw: bytes) -> Optional[dict]:
+    """Decode a bus line to a dict; None for blank, malformed or non-object lines."""
+    try:
+        obj = (_loads or _select())(raw)
+    except DECODE_ERRORS:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def value_needle(value: str) -> Optional[bytes]:
+    """
+    The bytes a JSON line must contain to hold `value` as a plain string, or None
+    when no safe needle exists (value needs escaping, so any spelling is possible).
+    """
+    if not value or not value.isascii() or any(c in value for c in '"\\') or not value.isprintable():
+        return None
+    return b'"' + value.encode("ascii") + b'"'
+
+
+def may_contain(raw: bytes, needle: Optional[bytes]) -> bool:
+    """
+    Cheap prefilter before decoding. A line holding neither the literal needle nor
+    any backslash escape cannot decode to a string equal to the needle's value,
+    so it is safe to skip; escaped lines always go through the full decode.
+    """
+    return needle is None or needle in raw or b"\\" in raw
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from .codec import loads_object
+from .record import EventRecord
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts run one compaction at a time by convention
+    fcntl = None
+
+# Columnar snapshots are an optional analytics feature: numpy is required to
+# build or load them, pyarrow only selects the Arrow IPC segment format. Both are
+# imported on first use so importing this module stays off the startup path.
+np: Any = None
+pa: Any = None
+pa_ipc: Any = None
+
+SNAPSHOT_VERSION = 1
+MANIFEST = "manifest.json"
+STRINGS = "strings.json"
+LOCK = ".lock"
+INT_COLUMNS = ("offset", "ts")
+CODE_COLUMNS = ("type", "actor", "agent", "target_agent", "task_id", "state")
+COLUMNS = INT_COLUMNS + CODE_COLUMNS
+TS_MISSING = -1
+# Segments appended before the next compaction folds them into one.
+MERGE_AFTER = 32
+
+
+class ColumnarUnavailable(RuntimeError):
+    pass
+
+
+def _require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ColumnarUnavailable("numpy is required for columnar bus snapshots (pip install numpy)") from None
+        np = numpy
+
+
+def _have_arrow() -> bool:
+    global pa, pa_ipc
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            return False
+        pa, pa_ipc = pyarrow, pyarrow.ipc
+    return True
+
+
+def default_format() -> str:
+    return "arrow" if _have_arrow() else "npy"
+
+
+class StringDictionary:
+    """Append-only string table; code 0 is always "" so empty fields need no lookup."""
+
+    def __init__(self, values: Optional[list[str]] = None) -> None:
+        self.values = values or [""]
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value: str) -> int:
+        c = self._codes.get(value)
+        if c is None:
+            c = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def find(self, value: str) -> int:
+        """Code for `value`, or -1 when it never occurs (matches no row)."""
+        return self._codes.get(value, -1)
+
+
+class Snapshot:
+    """
+    Loaded columnar history: `columns[name]` are equal-length numpy arrays in bus
+    order (`offset`/`ts` int64, code columns int32 into `strings`).
+    """
+
+    def __init__(self, columns: dict[str, Any], strings: StringDictionary, manifest: dict) -> None:
+        self.columns = columns
+        self.strings = strings
+        self.manifest = manifest
+
+    def __len__(self) -> int:
+        return int(self.columns["ts"].shape[0])
+
+    @property
+    def sealed_offset(self) -> int:
+        return int(self.manifest.get("sealed_offset", 0))
+
+    def code(self, value: str) -> int:
+        return self.strings.find(value)
+
+    def mask(self, since: Optional[int] = None, until: Optional[int] = None, **equals: str) -> Any:
+        """Boolean row mask: `since <= ts < until` plus `column=value` equality filters."""
+        ts = self.columns["ts"]
+        m = ts != TS_MISSING
+        if since is not None:
+            m &= ts >= since
+        if until is not None:
+            m &= ts < until
+        for name, value in equals.items():
+            m &= self.columns[name] == self.code(value)
+        return m
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_atomic(path: Path, obj: Any) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(obj, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _segment_path(root: Path, seg: dict) -> Path:
+    return root / (seg["name"] + (".arrow" if seg["format"] == "arrow" else ""))
+
+
+def _remove_segment(root: Path, seg: dict) -> None:
+    path = _segment_path(root, seg)
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _write_segment(root: Path, name: str, fmt: str, cols: dict[str, Any]) -> None:
+    if fmt == "arrow":
+        if not _have_arrow():
+            raise ColumnarUnavailable("pyarrow is required for --format arrow")
+        table = pa.table({c: cols[c] for c in COLUMNS})
+        path = root / f"{name}.arrow"
+        tmp = path.with_name(path.name + ".tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+        return
+    path = root / name
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for c in COLUMNS:
+        np.save(tmp / f"{c}.npy", cols[c], allow_pickle=False)
+    os.replace(tmp, path)
+
+
+def _read_segment(root: Path, seg: dict) -> dict[str, Any]:
+    path = _segment_path(root, seg)
+    if seg["format"] == "arrow":
+        if not _have_arrow():
+            raise ColumnarUnavailable(f"pyarrow is required to read {path.name}")
+        table = pa_ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        return {c: table.column(c).to_numpy() for c in COLUMNS}
+    return {c: np.load(path / f"{c}.npy", mmap_mode="r", allow_pickle=False) for c in COLUMNS}
+
+
+def _scan(bus: Path, start: int, strings: StringDictionary) -> tuple[dict[str, Any], int]:
+    """Encode complete lines from byte `start`; returns (columns, end offset of the last complete line)."""
+    ints = {c: array("q") for c in INT_COLUMNS}
+    codes = {c: array("i") for c in CODE_COLUMNS}
+    code = strings.code
+    pos = start
+    with bus.open("rb") as f:
+        f.seek(start)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # Unsealed partial write; the next compaction picks it up.
+                break
+            offset = pos
+            pos += len(raw)
+            ev = loads_object(raw)
+            if ev is None:
+                continue
+            rec = EventRecord(ev, raw)
+            state = ev.get("state")
+            ints["offset"].append(offset)
+            ints["ts"].append(rec.ts if rec.ts is not None else TS_MISSING)
+            codes["type"].append(code(rec.type))
+            codes["actor"].append(code(rec.actor))
+            codes["agent"].append(code(rec.agent))
+            codes["target_agent"].append(code(rec.target_agent))
+            codes["task_id"].append(code(rec.task_id))
+            codes["state"].append(code(state.strip().lower() if isinstance(state, str) else ""))
+    cols: dict[str, Any] = {c: np.frombuffer(ints[c], dtype=np.int64) for c in INT_COLUMNS}
+    cols.update({c: np.frombuffer(codes[c], dtype=np.int32) for c in CODE_COLUMNS})
+    return cols, pos
+
+
+def _new_manifest(bus: Path, st: os.stat_result) -> dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "bus": str(bus),
+        "dev": st.st_dev,
+        "ino": st.st_ino,
+        "sealed_offset": 0,
+        "rows": 0,
+        "next_segment": 1,
+        "segments": [],
+    }
+
+
+def compact(bus: Path, root: Path, fmt: Optional[str] = None, rebuild: bool = False) -> dict:
+    """
+    Append bus lines written since the last run as a new immutable segment under
+    `root`. A replaced or truncated bus (new inode / smaller than the sealed
+    offset) or `rebuild` starts the snapshot over. Returns the updated manifest.
+
+    Runs hold an exclusive flock on `root/.lock`, so overlapping runs (cron plus
+    a manual one) take turns instead of racing on the manifest and segment names.
+    """
+    _require_numpy()
+    fmt = fmt or default_format()
+    root.mkdir(parents=True, exist_ok=True)
+    fd = os.open(root / LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        return _compact(bus, root, fmt, rebuild)
+    finally:
+        os.close(fd)
+
+
+def _compact(bus: Path, root: Path, fmt: str, rebuild: bool) -> dict:
+    st = bus.stat()
+    manifest = _read_json(root / MANIFEST)
+    strings_list = _read_json(root / STRINGS)
+    stale = (
+        rebuild
+        or not isinstance(manifest, dict)
+        or manifest.get("version") != SNAPSHOT_VERSION
+        or (manifest.get("dev"), manifest.get("ino")) != (st.st_dev, st.st_ino)
+        or st.st_size < int(manifest.get("sealed_offset", 0))
+        or not isinstance(strings_list, list)
+    )
+    if stale:
+        # Every segment goes, not only the ones a (possibly unreadable) manifest lists:
+        # numbering restarts at 1 and must not collide with leftovers.
+        for path in root.glob("seg-*"):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+        manifest = _new_manifest(bus, st)
+        strings_list = None
+    strings = StringDictionary(strings_list)
+
+    start = int(manifest["sealed_offset"])
+    cols, end = _scan(bus, start, strings)
+    rows = int(cols["ts"].shape[0])
+    if rows:
+        name = f"seg-{manifest['next_segment']:06d}"
+        _write_segment(root, name, fmt, cols)
+        manifest["segments"].append({"name": name, "format": fmt, "start": start, "end": end, "rows": rows})
+        manifest["next_segment"] += 1
+        manifest["rows"] += rows
+    manifest["sealed_offset"] = end
+    manifest["updated_ts"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    old_segments: list[dict] = []
+    if len(manifest["segments"]) > MERGE_AFTER:
+        merged = _load_columns(root, manifest["segments"])
+        name = f"seg-{manifest['next_segment']:06d}"
+        _write_segment(root, name, fmt, merged)
+        old_segments = manifest["segments"]
+        manifest["segments"] = [
+            {"name": name, "format": fmt, "start": old_segments[0]["start"], "end": end, "rows": manifest["rows"]}
+        ]
+        manifest["next_segment"] += 1
+
+    # Strings before manifest: a reader never sees codes without their strings.
+    _write_json_atomic(root / STRINGS, strings.values)
+    _write_json_atomic(root / MANIFEST, manifest)
+    for seg in old_segments:
+        _remove_segment(root, seg)
+    return manifest
+
+
+def _load_columns(root: Path, segments: list[dict]) -> dict[str, Any]:
+    parts = [_read_segment(root, seg) for seg in segments]
+    if not parts:
+        cols = {c: np.zeros(0, dtype=np.int64) for c in INT_COLUMNS}
+        cols.update({c: np.zeros(0, dtype=np.int32) for c in CODE_COLUMNS})
+        return cols
+    if len(parts) == 1:
+        return parts[0]
+    return {c: np.concatenate([p[c] for p in parts]) for c in COLUMNS}
+
+
+def load(root: Path) -> Optional[Snapshot]:
+    """Load every segment under `root` (memory-mapped where the format allows); None when no snapshot exists."""
+    _require_numpy()
+    manifest = _read_json(root / MANIFEST)
+    strings_list = _read_json(root / STRINGS)
+    if not isinstance(manifest, dict) or manifest.get("version") != SNAPSHOT_VERSION or not isinstance(strings_list, list):
+        return None
+    return Snapshot(_load_columns(root, manifest["segments"]), StringDictionary(strings_list), manifest)
+
+
+def _empty_snapshot(bus: Path) -> Snapshot:
+    return Snapshot(_load_columns(Path(), []), StringDictionary(), {"bus": str(bus), "sealed_offset": 0, "segments": []})
+
+
+class LiveHistory:
+    """
+    Snapshot under `root` plus the bus lines appended after its sealed offset,
+    as one Snapshot. The snapshot is reloaded when its manifest changes; the tail
+    is encoded incrementally. Without a (matching) snapshot the whole bus is
+    encoded in memory once, so analytics work before the first compaction.
+    """
+
+    def __init__(self, bus: Path, root: Path) -> None:
+        self.bus = bus
+        self.root = root
+        self._lock = threading.Lock()
+        self._manifest_key: Optional[tuple[int, int]] = None
+        self._bus_ident: Optional[tuple[int, int]] = None
+        self._base: Optional[Snapshot] = None
+        self._tail: list[dict[str, Any]] = []
+        self._tail_end = 0
+        self._combined: Optional[Snapshot] = None
+
+    def _reset(self, st: os.stat_result) -> None:
+        base = None
+        try:
+            mst = (self.root / MANIFEST).stat()
+            self._manifest_key = (mst.st_mtime_ns, mst.st_size)
+            base = load(self.root)
+        except OSError:
+            self._manifest_key = None
+        if base is None or (base.manifest.get("dev"), base.manifest.get("ino")) != (st.st_dev, st.st_ino) or st.st_size < base.sealed_offset:
+            base = _empty_snapshot(self.bus)
+        self._base = base
+        self._bus_ident = (st.st_dev, st.st_ino)
+        self._tail = []
+        self._tail_end = base.sealed_offset
+        self._combined = None
+
+    def current(self) -> Snapshot:
+        _require_numpy()
+        with self._lock:
+            try:
+                st = self.bus.stat()
+            except OSError:
+                self._reset_missing()
+                return self._base  # type: ignore[return-value]
+            try:
+                mst = (self.root / MANIFEST).stat()
+                manifest_key: Optional[tuple[int, int]] = (mst.st_mtime_ns, mst.st_size)
+            except OSError:
+                manifest_key = None
+            if (
+                self._base is None
+                or manifest_key != self._manifest_key
+                or (st.st_dev, st.st_ino) != self._bus_ident
+                or st.st_size < self._tail_end
+            ):
+                self._reset(st)
+            if st.st_size > self._tail_end:
+                cols, end = _scan(self.bus, self._tail_end, self._base.strings)  # type: ignore[union-attr]
+                self._tail_end = end
+                if cols["ts"].shape[0]:
+                    self._tail.append(cols)
+                    self._combined = None
+            if self._combined is None:
+                base = self._base
+                assert base is not None
+                parts = [base.columns] + self._tail
+                columns = parts[0] if len(parts) == 1 else {c: np.concatenate([p[c] for p in parts]) for c in COLUMNS}
+                self._combined = Snapshot(columns, base.strings, dict(base.manifest, sealed_offset=self._tail_end))
+            return self._combined
+
+    def _reset_missing(self) -> None:
+        self._base = self._combined = _empty_snapshot(self.bus)
+        self._manifest_key = self._bus_ident = None
+        self._tail = []
+        self._tail_end = 0
+
+
+def counts_per_bucket(
+    snap: Snapshot,
+    column: str = "type",
+    bucket_s: int = 3600,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+) -> dict:
+    """
+    Row counts per `column` value per time bucket, e.g. events per type per hour.
+    Returns {"start", "bucket_s", "buckets", "series": {value: [count per bucket]}}.
+    """
+    ts = snap.columns["ts"]
+    m = snap.mask(since, until)
+    t = ts[m]
+    if t.size == 0:
+        return {"start": since, "bucket_s": bucket_s, "buckets": 0, "series": {}}
+    start = int(since if since is not None else t.min() - t.min() % bucket_s)
+    b = (t - start) // bucket_s
+    n_buckets = int(b.max()) + 1 if until is None else max(1, -(-(int(until) - start) // bucket_s))
+    uniq, inv = np.unique(snap.columns[column][m], return_inverse=True)
+    counts = np.bincount(inv.astype(np.int64) * n_buckets + b, minlength=len(uniq) * n_buckets)
+    counts = counts.reshape(len(uniq), n_buckets)
+    values = snap.strings.values
+    return {
+        "start": start,
+        "bucket_s": bucket_s,
+        "buckets": n_buckets,
+        "series": {values[int(c)]: counts[i].tolist() for i, c in enumerate(uniq)},
+    }
+
+
+def edge_counts(snap: Snapshot, since: Optional[int] = None, until: Optional[int] = None) -> dict[tuple[str, str], int]:
+    """actor -> target_agent event counts (self-edges and blank ends dropped)."""
+    actor = snap.columns["actor"]
+    target = snap.columns["target_agent"]
+    m = snap.mask(since, until) & (actor != 0) & (target != 0) & (actor != target)
+    pairs = (actor[m].astype(np.int64) << 32) | target[m].astype(np.int64)
+    uniq, counts = np.unique(pairs, return_counts=True)
+    values = snap.strings.values
+    return {(values[int(p >> 32)], values[int(p & 0xFFFFFFFF)]): int(n) for p, n in zip(uniq, counts)}
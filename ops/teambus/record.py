@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .codec import loads, loads_object, may_contain
+
+# Routing fields kept as interned slots; everything else is decoded from the raw line on demand.
+ROUTING_FIELDS = ("type", "actor", "agent", "target_agent", "task_id")
+_MISSING = object()
+
+
+@lru_cache(maxsize=8192)
+def ts_to_epoch(value: str) -> Optional[int]:
+    """`2026-02-07T12:00:00Z` (or any ISO-8601 with offset) to integer UTC epoch seconds."""
+    txt = value.strip()
+    if not txt:
+        return None
+    try:
+        dt = datetime.fromisoformat(txt.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _field(value: object) -> str:
+    return sys.intern(value.strip()) if isinstance(value, str) else ""
+
+
+class EventRecord:
+    """
+    Compact in-memory form of one bus row.
+
+    `type`, `actor`, `agent`, `target_agent` and `task_id` are interned,
+    whitespace-stripped strings ("" when absent or not a string); `ts` is epoch
+    seconds (None when unparseable). The original line is kept as bytes and only
+    decoded when another field is read, so a window of records costs roughly the
+    raw file size instead of one dict per row. Nothing decoded is kept: callers
+    reading several other fields of one record call `to_dict()` once.
+
+    `get()` mirrors dict.get() so record lists can replace parsed-dict lists.
+    """
+
+    __slots__ = ("type", "actor", "agent", "target_agent", "task_id", "ts", "_raw")
+
+    def __init__(self, ev: dict, raw: bytes | None = None) -> None:
+        get = ev.get
+        self.type = _field(get("type"))
+        self.actor = _field(get("actor"))
+        self.agent = _field(get("agent"))
+        self.target_agent = _field(get("target_agent"))
+        self.task_id = _field(get("task_id"))
+        ts = get("ts")
+        self.ts = ts_to_epoch(ts) if isinstance(ts, str) else None
+        self._raw = raw if raw is not None else json.dumps(ev, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_line(cls, raw: bytes) -> Optional["EventRecord"]:
+        ev = loads_object(raw)
+        if ev is None:
+            return None
+        return cls(ev, raw.rstrip(b"\r\n"))
+
+    def to_dict(self) -> dict:
+        return loads(self._raw)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ROUTING_FIELDS:
+            value = getattr(self, key)
+            if value:
+                return value
+        return self.to_dict().get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    @property
+    def dt(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.ts, timezone.utc) if self.ts is not None else None
+
+    @property
+    def summary(self) -> str:
+        return str(self.get("summary") or "")
+
+    @property
+    def message(self) -> str:
+        return str(self.get("message") or "")
+
+    @property
+    def details(self) -> Any:
+        return self.get("details")
+
+    def __repr__(self) -> str:
+        return f"EventRecord(type={self.type!r}, actor={self.actor!r}, task_id={self.task_id!r}, ts={self.ts!r})"
+
+
+def iter_records(path: Path, needle: Optional[bytes] = None) -> Iterator[EventRecord]:
+    """
+    Yield a record per decodable, non-blank line of a JSONL file (missing file
+    yields nothing). With a `needle` from codec.value_needle(), lines that cannot
+    contain that value are skipped before decoding; callers still filter records.
+    """
+    try:
+        f = path.open("rb")
+    except OSError:
+        return
+    with f:
+        for raw in f:
+            if not may_contain(raw, needle) or not raw.strip():
+                continue
+            rec = EventRecord.from_line(raw)
+            if rec is not None:
+                yield rec
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from .record import EventRecord, iter_records
+
+STATUS_STATES = {"error", "complete", "in_process"}
+RECENT_EVENTS = 5
+
+
+def last_record(path: Path) -> Optional[EventRecord]:
+    last = None
+    for last in iter_records(path):
+        pass
+    return last
+
+
+class TaskView:
+    """What query_status reports for one task, updated one bus record at a time."""
+
+    __slots__ = ("events", "last_update", "last_status")
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.last_update: Optional[EventRecord] = None
+        self.last_status: Optional[EventRecord] = None
+
+    def add(self, ev: EventRecord) -> None:
+        self.events += 1
+        if ev.type == "TASK_UPDATE":
+            self.last_update = ev
+        elif ev.type == "STATUS" and ev.get("status") in STATUS_STATES:
+            self.last_status = ev
+
+    @property
+    def state(self) -> str:
+        # The latest TASK_UPDATE wins; only without one does the latest qualifying STATUS count.
+        if self.last_update is not None:
+            return self.last_update.get("state", "in_process")
+        if self.last_status is not None:
+            return self.last_status.get("status")
+        return "in_process"
+
+
+class AgentView:
+    """Event count and most recent events for one agent (as `agent` or `actor`)."""
+
+    __slots__ = ("events", "recent")
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.recent: deque[EventRecord] = deque(maxlen=RECENT_EVENTS)
+
+    def add(self, ev: EventRecord) -> None:
+        self.events += 1
+        self.recent.append(ev)
+
+
+class StatusProjection:
+    """TaskView/AgentView for every task and agent on the bus, fed in bus order."""
+
+    def __init__(self) -> None:
+        self.tasks: dict[str, TaskView] = {}
+        self.agents: dict[str, AgentView] = {}
+
+    def add(self, ev: EventRecord) -> None:
+        if ev.task_id:
+            view = self.tasks.get(ev.task_id)
+            if view is None:
+                view = self.tasks[ev.task_id] = TaskView()
+            view.add(ev)
+        for name in {ev.agent, ev.actor} - {""}:
+            agent = self.agents.get(name)
+            if agent is None:
+                agent = self.agents[name] = AgentView()
+            agent.add(ev)
+
+
+def task_report(task_id: str, view: Optional[TaskView], persisted: dict[str, EventRecord]) -> str:
+    """`query_status --task-id` output; `persisted` maps agent -> last row of its status log."""
+    view = view or TaskView()
+    lines = [f"TASK: {task_id}", f"STATE: {view.state}", f"BUS_EVENTS: {view.events}", "LATEST_BY_AGENT:"]
+    if not persisted:
+        lines.append("  (none)")
+    else:
+        for agent, rec in persisted.items():
+            ev = rec.to_dict()
+            status = ev.get("state") or ev.get("status") or ev.get("type")
+            lines.append(f"  - {agent}: {status} | {ev.get('summary', '')}")
+    return "\n".join(lines) + "\n"
+
+
+def agent_report(agent: str, view: Optional[AgentView], latest: Optional[str]) -> str:
+    """`query_status --agent` output; `latest` is the agent's latest.json text, if any."""
+    view = view or AgentView()
+    lines = [f"AGENT: {agent}", latest.rstrip() if latest is not None else "LATEST: none", f"BUS_EVENTS: {view.events}"]
+    if view.events:
+        lines.append("RECENT:")
+        for rec in view.recent:
+            ev = rec.to_dict()
+            task = ev.get("task_id") or "-"
+            lines.append(f"  - {ev.get('ts')} {ev.get('type')} task={task} {ev.get('summary', '')}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,10 @@
+"""
+ops.textindex — persisted lexical indexes over the design corpus and agent docs.
+
+Rules:
+- Stdlib only; indexes are JSON files written via temp file + rename.
+- Deterministic: fixed hash seeds and stable ordering, so a rebuild from
+  scratch equals the incrementally maintained index.
+- Incremental by content key: callers pass a sha256 per source, and only
+  sources whose key changed are re-processed.
+"""
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+INDEX_VERSION = 1
+CHUNK_TOKENS = 160
+K1 = 1.2
+B = 0.75
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do for from has have how i if in into is it its me my not of on or our "
+    "so than that the their then there these this to us was we what when which who will with you your".split()
+)
+
+
+def approx_tokens(text: str) -> int:
+    """Rough model-token count (about 4 characters per token); used for context budgets."""
+    return (len(text) + 3) // 4
+
+
+def terms(text: str) -> list[str]:
+    out = []
+    for w in WORD_RE.findall(text.lower()):
+        if w in STOPWORDS:
+            continue
+        # Fold simple plurals ("buttons" -> "button") without a stemmer.
+        if len(w) > 3 and w.endswith("s") and not w.endswith("ss"):
+            w = w[:-1]
+        out.append(w)
+    return out
+
+
+def chunk_text(text: str, max_tokens: int = CHUNK_TOKENS) -> list[str]:
+    """
+    Split markdown or extracted page text into chunks of at most `max_tokens`.
+    Headings and blank lines end a chunk; each chunk repeats its section's
+    heading so it reads (and scores) on its own. Over-long lines split on words.
+    """
+    chunks: list[str] = []
+    heading = ""
+    buf: list[str] = []
+    size = 0
+
+    def flush() -> None:
+        nonlocal buf, size
+        if buf:
+            body = "\n".join(buf)
+            chunks.append(f"{heading}\n{body}" if heading and not body.startswith(heading) else body)
+        buf, size = [], 0
+
+    budget = max(16, max_tokens - approx_tokens(heading))
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line.strip():
+            flush()
+            continue
+        if line.lstrip().startswith("#"):
+            flush()
+            heading = line.strip()
+            budget = max(16, max_tokens - approx_tokens(heading))
+            continue
+        pieces = [line]
+        if approx_tokens(line) > budget:
+            pieces, cur = [], ""
+            for word in line.split():
+                if cur and approx_tokens(cur) + approx_tokens(word) + 1 > budget:
+                    pieces.append(cur)
+                    cur = ""
+                cur = f"{cur} {word}" if cur else word
+            if cur:
+                pieces.append(cur)
+        for piece in pieces:
+            n = approx_tokens(piece) + 1
+            if buf and size + n > budget:
+                flush()
+            buf.append(piece)
+            size += n
+    flush()
+    return chunks
+
+
+@dataclass(frozen=True)
+class Hit:
+    source_id: str
+    chunk_no: int
+    score: float
+    text: str
+
+
+class Bm25Index:
+    """
+    BM25 over text chunks, grouped by source and keyed by the source's content
+    sha256. `update` only re-chunks and re-counts sources whose key changed;
+    postings, document frequencies and the average chunk length are rebuilt in
+    memory on the next search after any change.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, dict] = {}
+        self._dirty = True
+        self._chunks: list[tuple[str, int, str, int]] = []  # (source id, chunk no, text, length)
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._avgdl = 0.0
+
+    @classmethod
+    def load(cls, path: Path) -> "Bm25Index":
+        idx = cls()
+        try:
+            obj = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return idx
+        if isinstance(obj, dict) and obj.get("version") == INDEX_VERSION and isinstance(obj.get("sources"), dict):
+            idx.sources = obj["sources"]
+        return idx
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        payload = {"version": INDEX_VERSION, "sources": self.sources}
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def key(self, source_id: str) -> str | None:
+        entry = self.sources.get(source_id)
+        return entry.get("key") if entry is not None else None
+
+    def update(self, source_id: str, key: str, chunks: Iterable[str]) -> bool:
+        """Index `chunks` for `source_id` unless it is already indexed under `key`; True when it was."""
+        if self.key(source_id) == key:
+            return False
+        self.sources[source_id] = {
+            "key": key,
+            "chunks": [{"text": c, "tf": dict(Counter(terms(c)))} for c in chunks],
+        }
+        self._dirty = True
+        return True
+
+    def retain(self, source_ids: Iterable[str]) -> bool:
+        keep = set(source_ids)
+        stale = [s for s in self.sources if s not in keep]
+        for src in stale:
+            del self.sources[src]
+        self._dirty |= bool(stale)
+        return bool(stale)
+
+    def chunk_count(self, source_ids: Iterable[str] | None = None) -> int:
+        ids = self.sources if source_ids is None else source_ids
+        return sum(len(self.sources[s]["chunks"]) for s in ids if s in self.sources)
+
+    def chunks(self, source_id: str) -> list[str]:
+        entry = self.sources.get(source_id)
+        return [c["text"] for c in entry["chunks"]] if entry is not None else []
+
+    def _rebuild(self) -> None:
+        self._chunks, self._postings = [], {}
+        total = 0
+        for src, entry in self.sources.items():
+            for no, chunk in enumerate(entry["chunks"]):
+                tf = chunk["tf"]
+                length = sum(tf.values())
+                doc = len(self._chunks)
+                self._chunks.append((src, no, chunk["text"], length))
+                total += length
+                for term, n in tf.items():
+                    self._postings.setdefault(term, []).append((doc, n))
+        self._avgdl = total / len(self._chunks) if self._chunks else 0.0
+        self._dirty = False
+
+    def search(self, query: str, k: int = 10, source_ids: Iterable[str] | None = None) -> list[Hit]:
+        """Top `k` chunks for `query`, best first, optionally limited to `source_ids`."""
+        if self._dirty:
+            self._rebuild()
+        allowed = None if source_ids is None else set(source_ids)
+        n_docs = len(self._chunks)
+        scores: dict[int, float] = {}
+        for term in set(terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc, tf in postings:
+                src, _, _, length = self._chunks[doc]
+                if allowed is not None and src not in allowed:
+                    continue
+                norm = K1 * (1.0 - B + B * length / self._avgdl) if self._avgdl else K1
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1.0) / (tf + norm)
+        best = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:k]
+        return [Hit(self._chunks[d][0], self._chunks[d][1], s, self._chunks[d][2]) for d, s in best]
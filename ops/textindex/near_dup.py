@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+INDEX_VERSION = 1
+NUM_PERM = 64
+BANDS = 16  # 4 rows per band: pairs at Jaccard 0.5 share a band ~65% of the time, at 0.7 ~99%
+SHINGLE_WORDS = 3
+THRESHOLD = 0.5
+
+# Keeps ratios and versions ("4.5:1", "2.2") as single tokens.
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.:][0-9]+)*")
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x6E64)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def tokens(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def shingles(toks: list[str], k: int = SHINGLE_WORDS) -> set[str]:
+    if len(toks) <= k:
+        return {" ".join(toks)} if toks else set()
+    return {" ".join(toks[i : i + k]) for i in range(len(toks) - k + 1)}
+
+
+def minhash(shingle_set: set[str]) -> list[int]:
+    if not shingle_set:
+        return [_PRIME] * NUM_PERM
+    hs = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingle_set]
+    return [min((a * h + b) % _PRIME for h in hs) for a, b in _PERMS]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def fingerprint(text: str) -> dict:
+    """Signature plus the statement's numbers; statements that differ in a number (3:1 vs 4.5:1) never merge."""
+    toks = tokens(text)
+    return {
+        "text": text,
+        "sig": minhash(shingles(toks)),
+        "nums": sorted({t for t in toks if t[0].isdigit()}),
+    }
+
+
+@dataclass
+class Cluster:
+    canonical: str
+    members: list[tuple[str, str]] = field(default_factory=list)  # (source id, statement)
+
+    @property
+    def sources(self) -> list[str]:
+        return list(dict.fromkeys(src for src, _ in self.members))
+
+
+class NearDupIndex:
+    """
+    MinHash signatures of every statement, grouped by source and keyed by the
+    source's content sha256. `update` only fingerprints sources whose key
+    changed; `clusters` buckets the stored signatures with LSH bands, confirms
+    candidates by estimated similarity, and unions matches.
+    """
+
+    def __init__(self, threshold: float = THRESHOLD) -> None:
+        self.threshold = threshold
+        self.sources: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Path, threshold: float = THRESHOLD) -> "NearDupIndex":
+        idx = cls(threshold)
+        try:
+            obj = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return idx
+        if (
+            isinstance(obj, dict)
+            and obj.get("version") == INDEX_VERSION
+            and obj.get("num_perm") == NUM_PERM
+            and obj.get("shingle_words") == SHINGLE_WORDS
+            and isinstance(obj.get("sources"), dict)
+        ):
+            idx.sources = obj["sources"]
+        return idx
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "num_perm": NUM_PERM,
+            "shingle_words": SHINGLE_WORDS,
+            "sources": self.sources,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def update(self, source_id: str, key: str, statements: Iterable[str]) -> bool:
+        """Fingerprint `statements` unless `source_id` is already indexed under `key`; True when it was."""
+        cur = self.sources.get(source_id)
+        if cur is not None and cur.get("key") == key:
+            return False
+        self.sources[source_id] = {"key": key, "items": [fingerprint(s) for s in statements]}
+        return True
+
+    def retain(self, source_ids: Iterable[str]) -> None:
+        keep = set(source_ids)
+        for src in [s for s in self.sources if s not in keep]:
+            del self.sources[src]
+
+    def clusters(self, source_ids: Iterable[str]) -> list[Cluster]:
+        """
+        Near-duplicate clusters over the given sources, in order. The canonical
+        statement is the cluster's first member (earlier sources first, then
+        extraction rank), so adding a source never changes an existing canonical.
+        """
+        items: list[tuple[str, dict]] = []
+        for src in source_ids:
+            entry = self.sources.get(src)
+            if entry is not None:
+                items.extend((src, it) for it in entry["items"])
+
+        parent = list(range(len(items)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        rows = NUM_PERM // BANDS
+        buckets: dict[tuple, list[int]] = {}
+        checked: set[tuple[int, int]] = set()
+        for i, (_, it) in enumerate(items):
+            sig = it["sig"]
+            for band in range(BANDS):
+                peers = buckets.setdefault((band, *sig[band * rows : (band + 1) * rows]), [])
+                for j in peers:
+                    if (j, i) in checked:
+                        continue
+                    checked.add((j, i))
+                    other = items[j][1]
+                    if other["nums"] == it["nums"] and similarity(other["sig"], sig) >= self.threshold:
+                        ri, rj = find(i), find(j)
+                        if ri != rj:
+                            parent[max(ri, rj)] = min(ri, rj)
+                peers.append(i)
+
+        grouped: dict[int, Cluster] = {}
+        for i, (src, it) in enumerate(items):
+            root = find(i)
+            cluster = grouped.get(root)
+            if cluster is None:
+                cluster = grouped[root] = Cluster(canonical=items[root][1]["text"])
+            cluster.members.append((src, it["text"]))
+        return list(grouped.values())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Cold-start budget for CLI entry points.
+
+Runs each entry point under `python -X importtime` and sums the import time of
+everything loaded after interpreter/site startup (so site-packages .pth hooks
+do not count). Fails when the median exceeds its budget or when a heavy module
+that belongs to another code path shows up.
+
+  python3 tests/bench_cold_start.py [--runs 5] [--scale 1.0]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Heavy modules no CLI path should import.
+HEAVY = {"numpy", "pyarrow", "fastapi", "jinja2", "jsonschema"}
+
+# (label, argv after the interpreter, budget_ms, modules that must not load)
+CASES = [
+    ("ui.dashboard --help", ["-m", "ui.dashboard", "--help"], 25, HEAVY | {"subprocess", "dataclasses"}),
+    ("ui.dashboard agents list", ["-m", "ui.dashboard", "agents", "list"], 25, HEAVY | {"subprocess", "dataclasses"}),
+    ("query_status --task-id", ["ops/scripts/agents/query_status.py", "--task-id", "bench-task", "--bus", "{bus}"], 30, HEAVY | {"orjson"}),
+    ("gate_require_approval", ["ops/scripts/gates/gate_require_approval.py", "--task-id", "bench-task", "--bus", "{bus}"], 30, HEAVY | {"orjson"}),
+    ("import ui.dashboard.app", ["-c", "import ui.dashboard.app"], 1500, {"numpy", "pyarrow"}),
+]
+
+
+def import_profile(argv: list[str]) -> tuple[float, set[str]]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    total_us = 0
+    modules: set[str] = set()
+    after_site = False
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        mod = name.strip()
+        if not after_site:
+            after_site = mod == "site" and name.startswith(" site")
+            continue
+        modules.add(mod.split(".")[0])
+        if name.startswith(" ") and not name.startswith("  "):
+            total_us += int(parts[1])
+    return total_us / 1000.0, modules
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply budgets (slow CI hosts)")
+    args = ap.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = Path(tmp) / "team_bus.jsonl"
+        bus.write_text('{"type":"STATUS","actor":"bench","agent":"bench","task_id":"bench-task","ts":"2026-01-01T00:00:00Z"}\n')
+        print(f"{'entry point':28s} {'median ms':>9s} {'budget':>7s}")
+        for label, argv, budget, forbidden in CASES:
+            argv = [a.replace("{bus}", str(bus)) for a in argv]
+            samples = []
+            loaded: set[str] = set()
+            for _ in range(max(1, args.runs)):
+                ms, mods = import_profile(argv)
+                samples.append(ms)
+                loaded |= mods
+            med = statistics.median(samples)
+            limit = budget * args.scale
+            heavy = sorted(loaded & forbidden)
+            ok = med <= limit and not heavy
+            failed |= not ok
+            note = "" if ok else ("  OVER BUDGET" if med > limit else "") + (f"  imports {', '.join(heavy)}" if heavy else "")
+            print(f"{label:28s} {med:9.1f} {limit:7.0f}{note}")
+
+    if failed:
+        print("FAIL: cold-start budget exceeded")
+        return 1
+    print("OK: cold-start budgets met")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
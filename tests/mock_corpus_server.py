@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the design-corpus sources fetched by
+ops/scripts/design/build_rembrandt_corpus.py.
+
+Serves in-memory HTML pages with optional ETag or Last-Modified validators
+and answers matching conditional requests with 304. Each response waits
+`delay_s`, and the server tracks peak concurrency (overall and per Host
+header) so smoke tests can assert that fetches overlap and stay within
+per-domain limits.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.server
+import sys
+import threading
+import time
+
+LAST_MODIFIED = "Mon, 02 Feb 2026 10:00:00 GMT"
+
+
+def fixture_page(title: str, paragraphs: int = 40) -> bytes:
+    body = "".join(
+        f"<p>{title}: keep interactive targets at least 24 by 24 pixels and maintain a 4.5:1 contrast ratio ({i}).</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        f"<!doctype html><html><head><title>{title}</title><style>p{{color:red}}</style>"
+        f"<script>var x = 1;</script></head><body><h1>{title}</h1>{body}</body></html>"
+    ).encode("utf-8")
+
+
+class MockCorpusServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], delay_s: float = 0.0) -> None:
+        super().__init__(addr, Handler)
+        self.delay_s = delay_s
+        # path -> (body, validator: "etag" | "last-modified" | "none")
+        self.pages: dict[str, tuple[bytes, str]] = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+        self._lock = threading.Lock()
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that stop reading (e.g. the builder's --max-bytes cap) are expected.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def add_page(self, path: str, body: bytes, validator: str = "etag") -> None:
+        self.pages[path] = (body, validator)
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.server_address[1]}{path}"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args) -> None:
+        return
+
+    def do_GET(self) -> None:
+        host = (self.headers.get("Host") or "").split(":")[0]
+        srv = self.server
+        with srv._lock:
+            srv.requests += 1
+            srv.active[host] = srv.active.get(host, 0) + 1
+            srv.peak[host] = max(srv.peak.get(host, 0), srv.active[host])
+            srv.peak_total = max(srv.peak_total, sum(srv.active.values()))
+        try:
+            if srv.delay_s:
+                time.sleep(srv.delay_s)
+            self._serve(srv.pages.get(self.path))
+        finally:
+            with srv._lock:
+                srv.active[host] -= 1
+
+    def _serve(self, page: tuple[bytes, str] | None) -> None:
+        if page is None:
+            self._send(404, b"not found", {})
+            return
+        body, validator = page
+        headers: dict[str, str] = {}
+        fresh = False
+        if validator == "etag":
+            headers["ETag"] = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            fresh = self.headers.get("If-None-Match") == headers["ETag"]
+        elif validator == "last-modified":
+            headers["Last-Modified"] = LAST_MODIFIED
+            fresh = self.headers.get("If-Modified-Since") == LAST_MODIFIED
+        if fresh:
+            with self.server._lock:
+                self.server.not_modified += 1
+            self._send(304, b"", headers)
+            return
+        self._send(200, body, {**headers, "Content-Type": "text/html; charset=utf-8"})
+
+    def _send(self, code: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if code != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def start_mock_server(port: int = 0, delay_s: float = 0.0) -> MockCorpusServer:
+    server = MockCorpusServer(("127.0.0.1", port), delay_s=delay_s)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Serve fixture design-corpus pages on localhost.")
+    ap.add_argument("--port", type=int, default=8798)
+    ap.add_argument("--delay", type=float, default=0.2, help="Seconds before each response.")
+    ap.add_argument("--pages", type=int, default=6)
+    args = ap.parse_args()
+    srv = MockCorpusServer(("127.0.0.1", args.port), delay_s=args.delay)
+    for i in range(args.pages):
+        srv.add_page(f"/doc-{i}", fixture_page(f"Doc {i}"), ("etag", "last-modified", "none")[i % 3])
+    print(f"Mock corpus pages at {srv.url('/doc-0')} .. /doc-{args.pages - 1}. Ctrl-C to exit.")
+    srv.serve_forever()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI Responses API (POST /v1/responses).
+
+Speaks HTTP/1.1 keep-alive so pooled clients can reuse sockets, and answers
+`"stream": true` requests with chunked SSE deltas. Tracks how many TCP
+connections were accepted so smoke tests can assert reuse.
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import threading
+import time
+
+REPLY_PIECES = ["Mock ", "reply ", "from ", "the ", "stand-in."]
+
+
+class MockResponsesServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], delta_delay_s: float = 0.0) -> None:
+        super().__init__(addr, Handler)
+        self.delta_delay_s = delta_delay_s
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def process_request(self, request, client_address) -> None:
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args) -> None:
+        return
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b"{}"
+        with self.server._lock:
+            self.server.requests += 1
+        if self.path != "/v1/responses":
+            self._json(404, {"error": {"code": "not_found"}})
+            return
+        if not (self.headers.get("Authorization") or "").removeprefix("Bearer").strip():
+            self._json(401, {"error": {"code": "invalid_api_key"}})
+            return
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            self._json(400, {"error": {"code": "invalid_json"}})
+            return
+        text = "".join(REPLY_PIECES)
+        final = {
+            "id": "resp_mock",
+            "object": "response",
+            "status": "completed",
+            "output": [
+                {"type": "message", "role": "assistant", "content": [{"type": "output_text", "text": text}]},
+            ],
+        }
+        if not payload.get("stream"):
+            self._json(200, final)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(self._sse("response.created", {"type": "response.created", "response": {"id": "resp_mock"}}))
+        for piece in REPLY_PIECES:
+            if self.server.delta_delay_s:
+                time.sleep(self.server.delta_delay_s)
+            self._chunk(self._sse("response.output_text.delta", {"type": "response.output_text.delta", "delta": piece}))
+        self._chunk(self._sse("response.completed", {"type": "response.completed", "response": final}))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _json(self, code: int, obj: dict) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _sse(event: str, obj: dict) -> bytes:
+        return f"event: {event}\ndata: {json.dumps(obj)}\n\n".encode("utf-8")
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def start_mock_server(port: int = 0, delta_delay_s: float = 0.0) -> MockResponsesServer:
+    server = MockResponsesServer(("127.0.0.1", port), delta_delay_s=delta_delay_s)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Serve a mock Responses API on localhost.")
+    ap.add_argument("--port", type=int, default=8799)
+    ap.add_argument("--delta-delay", type=float, default=0.05, help="Seconds between streamed deltas.")
+    args = ap.parse_args()
+    srv = MockResponsesServer(("127.0.0.1", args.port), delta_delay_s=args.delta_delay)
+    print(f"Mock Responses API on {srv.base_url} (set OPENCLAW_UI_OPENAI_BASE_URL). Ctrl-C to exit.")
+    srv.serve_forever()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from mock_openai_server import REPLY_PIECES, start_mock_server
+
+
+def main():
+    server = start_mock_server(delta_delay_s=0.02)
+    os.environ["OPENCLAW_UI_OPENAI_BASE_URL"] = server.base_url
+    from ui.dashboard import openai_client
+
+    payload = {"model": "mock", "instructions": "smoke", "input": "hello"}
+    expected = "".join(REPLY_PIECES)
+
+    first = openai_client.create_response("sk-mock", payload)
+    second = openai_client.create_response("sk-mock", payload)
+    assert first.ok and first.text == expected, first
+    assert second.ok, second
+    assert server.connections == 1, f"keep-alive pool should reuse one socket, saw {server.connections}"
+
+    deltas = []
+    done = None
+    for kind, value in openai_client.stream_response("sk-mock", payload):
+        if kind == "delta":
+            deltas.append(value)
+        else:
+            done = value
+    assert deltas == REPLY_PIECES, deltas
+    assert done is not None and done.ok and done.streamed, done
+    assert done.ttft_ms is not None and done.ttft_ms < done.total_ms, done
+    assert server.connections == 1, f"streamed call should reuse the pooled socket, saw {server.connections}"
+
+    denied = openai_client.create_response("", payload)
+    assert not denied.ok and denied.error.startswith("HTTP 401"), denied
+
+    stats = openai_client.CHAT_LATENCY.snapshot()
+    assert stats["calls"] == 4 and stats["streamed"] == 1, stats
+
+    server.shutdown()
+    print("OK: chat stream smoke passed")
+
+
+if __name__ == "__main__":
+    main()
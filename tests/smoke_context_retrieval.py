@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+SOUL = "# Painter\nYou are painter, the UI design agent.\n"
+RUNBOOK = """# Runbook
+
+## Colour contrast
+Body text needs a contrast ratio of at least 4.5:1 against its background.
+
+## Deploys
+Deploys run from the release branch after the verify gate passes.
+
+## Focus rings
+Keyboard focus indicators stay visible and use a 2px outline.
+"""
+FILLER = "\n\n".join(f"## Archive {i}\nHistorical note {i} about quarterly planning and budgets." for i in range(200))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        ws, rt = Path(tmp) / "ws", Path(tmp) / "rt"
+        agent = ws / "agents" / "painter"
+        agent.mkdir(parents=True)
+        (agent / "SOUL.md").write_text(SOUL, encoding="utf-8")
+        (agent / "RUNBOOK.md").write_text(RUNBOOK, encoding="utf-8")
+        (agent / "NOTES.md").write_text(FILLER, encoding="utf-8")
+        os.environ["OPENCLAW_WORKSPACE"] = str(ws)
+        os.environ["OPENCLAW_RUNTIME"] = str(rt)
+        from ui.dashboard import agent_context as ctx
+        from ops.textindex.bm25 import approx_tokens
+
+        built = ctx.build_index()
+        assert built["sources"] == 3 and built["reindexed"] == 3, built
+        assert ctx.CONTEXT_INDEX_PATH.exists()
+
+        # Names without an agent directory never reach the index or the bundle list.
+        index_mtime = ctx.CONTEXT_INDEX_PATH.stat().st_mtime_ns
+        for name in ("ghost", "..", ""):
+            assert ctx.get_context_bundle(name, "anything").text == ""
+        assert ctx.CONTEXT_INDEX_PATH.stat().st_mtime_ns == index_mtime
+        assert ctx.cache_info() == {}
+
+        started = time.perf_counter()
+        bundle = ctx.get_context_bundle("painter", "what contrast ratio should body text have?", budget_tokens=200)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        assert bundle.pinned.startswith("===== SOUL.md =====\n# Painter"), bundle.pinned
+        assert "4.5:1" in bundle.retrieved and "Deploys" not in bundle.text, bundle.text
+        assert "SOUL.md" not in bundle.retrieved, bundle.retrieved
+        assert approx_tokens(bundle.text) <= 200, approx_tokens(bundle.text)
+        assert elapsed_ms < 50, elapsed_ms
+
+        focus = ctx.get_context_bundle("painter", "keyboard focus outline", budget_tokens=200)
+        assert "2px outline" in focus.text and "4.5:1" not in focus.text, focus.text
+        # Retrieval varies per message; the pinned prefix and its cache key do not.
+        assert focus.pinned == bundle.pinned and focus.cache_key == bundle.cache_key
+
+        # A message with no indexed terms falls back to source order within the budget.
+        fallback = ctx.get_context_bundle("painter", "zzz", budget_tokens=200)
+        assert "===== RUNBOOK.md =====" in fallback.retrieved and approx_tokens(fallback.text) <= 200
+
+        # Only the edited file is re-indexed; a fresh process reuses the persisted index.
+        (agent / "RUNBOOK.md").write_text(RUNBOOK + "\n## Motion\nHonour prefers-reduced-motion.\n", encoding="utf-8")
+        assert ctx.build_index()["reindexed"] == 1
+        fresh = ctx.ContextIndex(ctx.CONTEXT_INDEX_PATH)
+        sources = ctx._context_sources("painter")
+        assert fresh.refresh(sources, ctx._signature(sources))
+        _, text, _ = fresh.select(sources, "reduced motion", 200, 4)
+        assert "prefers-reduced-motion" in text, text
+
+        # Editing a pinned source moves the cache key.
+        (agent / "SOUL.md").write_text(SOUL + "Prefer tokens over raw colours.\n", encoding="utf-8")
+        assert ctx.get_context_bundle("painter", "keyboard focus outline", budget_tokens=200).cache_key != focus.cache_key
+
+    print("OK: context retrieval smoke test passed")
+
+
+if __name__ == "__main__":
+    main()
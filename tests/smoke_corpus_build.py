@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "ops" / "scripts" / "design"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+import build_rembrandt_corpus as corpus
+from mock_corpus_server import fixture_page, start_mock_server
+
+DELAY_S = 0.3
+
+
+def run_build(manifest: Path, out: Path, *extra: str) -> tuple[float, list[dict]]:
+    started = time.perf_counter()
+    rc = corpus.main(["--sources", str(manifest), "--out", str(out), "--per-domain", "3", *extra])
+    assert rc == 0
+    rows = [json.loads(line) for line in (out / "index.jsonl").read_text(encoding="utf-8").splitlines()]
+    return time.perf_counter() - started, rows
+
+
+def main():
+    server = start_mock_server(delay_s=DELAY_S)
+    validators = ("etag", "last-modified", "none")
+    sources = []
+    for i in range(6):
+        server.add_page(f"/doc-{i}", fixture_page(f"Doc {i}"), validators[i % 3])
+        host = "127.0.0.1" if i % 2 else "localhost"
+        sources.append({"id": f"doc-{i}", "url": server.url(f"/doc-{i}", host), "topic": "fixture"})
+    sources.append({"id": "missing", "url": server.url("/missing"), "topic": "fixture"})
+    sources.append({"id": "elsewhere", "url": "https://example.com/", "topic": "fixture"})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Path(tmp) / "sources.json"
+        manifest.write_text(json.dumps({"allowed_domains": ["127.0.0.1", "localhost"], "sources": sources}))
+        out = Path(tmp) / "corpus"
+
+        took, rows = run_build(manifest, out)
+        assert [r["id"] for r in rows] == [s["id"] for s in sources], "index must follow manifest order"
+        assert [r["ok"] for r in rows] == [True] * 6 + [False, False], rows
+        assert rows[6]["error"] == "http_404" and rows[7]["error"] == "domain_not_allowed", rows[6:]
+        assert took < DELAY_S * 7 / 2, f"fetches should overlap, took {took:.2f}s"
+        assert max(server.peak.values()) <= 3, f"per-domain limit exceeded: {server.peak}"
+        assert server.peak_total > 3, f"hosts should be fetched in parallel: {server.peak_total}"
+        assert "24 by 24 pixels" in (out / "text" / "doc-0.txt").read_text() and "var x" not in (out / "text" / "doc-0.txt").read_text()
+        text_mtimes = {p.name: p.stat().st_mtime_ns for p in (out / "text").iterdir()}
+
+        _, rows = run_build(manifest, out)
+        assert all(not r.get("changed") for r in rows if r["ok"]), rows
+        assert server.not_modified == 4, f"etag/last-modified sources should revalidate with 304: {server.not_modified}"
+        assert {p.name: p.stat().st_mtime_ns for p in (out / "text").iterdir()} == text_mtimes, "unchanged text rewritten"
+
+        server.add_page("/doc-2", fixture_page("Doc 2 revised"), "none")
+        server.add_page("/doc-3", fixture_page("Doc 3 revised"), "etag")
+        _, rows = run_build(manifest, out)
+        assert sorted(r["id"] for r in rows if r.get("changed")) == ["doc-2", "doc-3"], rows
+        assert "Doc 3 revised" in (out / "text" / "doc-3.txt").read_text()
+
+        _, rows = run_build(manifest, out, "--force")
+        assert sum(1 for r in rows if r.get("changed")) == 6, rows
+
+        # Large page: streamed with bounded memory, and refused past --max-bytes.
+        big = fixture_page("Big", paragraphs=60_000)
+        server.add_page("/doc-0", big, "etag")
+        tracemalloc.start()
+        _, rows = run_build(manifest, out, "--limit", "1")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert rows[0]["changed"] and rows[0]["bytes"] == len(big), rows[0]
+        assert peak < len(big) / 4, f"extraction should stream, peak {peak} for {len(big)} bytes"
+        assert (out / "raw" / "doc-0.html").read_bytes() == big
+        kept = (out / "text" / "doc-0.txt").read_text()
+        server.add_page("/doc-0", fixture_page("Bigger", paragraphs=70_000), "etag")
+        _, rows = run_build(manifest, out, "--limit", "1", "--max-bytes", str(len(big)))
+        assert not rows[0]["ok"] and rows[0]["error"] == "too_large", rows[0]
+        assert (out / "text" / "doc-0.txt").read_text() == kept, "oversized fetch must keep the previous copy"
+        assert not list((out / "raw").glob("*.tmp")), "temp files left behind"
+
+    server.shutdown()
+    print("OK: corpus build smoke passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from ops.textindex.near_dup import NearDupIndex
+
+WCAG = [
+    "text and images of large-scale text have a contrast ratio of at least 3:1;",
+    "text and images of large-scale text have a contrast ratio of at least 4.5:1;",
+    "The requirement is to ensure that when a user overrides the authored text spacing, content or functionality is not lost.",
+]
+QUICKREF = [
+    "Large-scale text and images of large-scale text have a contrast ratio of at least 3:1;",
+    "The requirement is to ensure that when a user overrides the authored text spacing, content or functionality is not lost.",
+    "Keyboard focus indicators must remain visible while the component has focus.",
+]
+
+
+def main():
+    idx = NearDupIndex()
+    assert idx.update("wcag", "k1", WCAG)
+    assert idx.update("quickref", "k1", QUICKREF)
+    clusters = idx.clusters(["wcag", "quickref"])
+    by_canonical = {c.canonical: c for c in clusters}
+    assert len(clusters) == 4, [c.canonical for c in clusters]
+    # Rephrasings merge under the earlier source's wording; a different ratio never does.
+    assert by_canonical[WCAG[0]].sources == ["wcag", "quickref"]
+    assert by_canonical[WCAG[1]].sources == ["wcag"]
+    assert by_canonical[WCAG[2]].sources == ["wcag", "quickref"]
+    assert by_canonical[QUICKREF[2]].sources == ["quickref"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "near_dup.json"
+        idx.save(path)
+        again = NearDupIndex.load(path)
+        # Unchanged keys are not re-fingerprinted; a changed source is.
+        assert not again.update("wcag", "k1", WCAG)
+        assert again.update("quickref", "k2", QUICKREF[2:])
+        assert [c.sources for c in again.clusters(["wcag", "quickref"])] == [["wcag"], ["wcag"], ["wcag"], ["quickref"]]
+        again.retain(["quickref"])
+        assert [c.canonical for c in again.clusters(["wcag", "quickref"])] == [QUICKREF[2]]
+
+    print("OK: near-duplicate index smoke test passed")
+
+
+if __name__ == "__main__":
+    main()
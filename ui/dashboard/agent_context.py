@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ops.textindex.bm25 import Bm25Index, approx_tokens, chunk_text
+
+from .config import CONTEXT_INDEX_PATH, CONTEXT_TOKEN_BUDGET, CONTEXT_TOP_K, WORKSPACE_BASE
+from .metrics import CONTEXT_RETRIEVAL_SECONDS, cache_result
+
+DESIGN_ROOT = WORKSPACE_BASE / "docs" / "design"
+# Always sent in full (budget permitting): the agent's identity, whatever the message.
+PINNED_SOURCES = ("SOUL.md",)
+
+
+@dataclass(frozen=True)
+class ContextBundle:
+    agent: str
+    pinned: str  # same for every message until a pinned source changes
+    retrieved: str  # chunks picked for this message
+    sha256: str  # of `pinned`
+    signature: tuple[tuple[str, int, int], ...]
+    chunks: int = 0
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(part for part in (self.pinned, self.retrieved) if part)
+
+    @property
+    def cache_key(self) -> str:
+        """Per-agent key of the pinned prefix, suitable for upstream prompt caching."""
+        return f"openclaw-ctx:{self.agent}:{self.sha256[:24]}"
+
+
+def _agent_root(agent: str) -> Path | None:
+    """`agents/<agent>/` when it is an existing agent directory, else None."""
+    if not agent or agent in {".", ".."} or "/" in agent or "\\" in agent:
+        return None
+    root = WORKSPACE_BASE / "agents" / agent
+    return root if root.is_dir() else None
+
+
+def _context_sources(agent: str) -> list[tuple[str, Path]]:
+    """Existing context files of `agent`; missing ones are skipped, not indexed as empty."""
+    root = _agent_root(agent)
+    if root is None:
+        return []
+    sources = [(name, root / name) for name in ("SOUL.md", "RUNBOOK.md", "NOTES.md")]
+    if agent == "rembrandt":
+        sources += [
+            ("CANON_INDEX.md", DESIGN_ROOT / "CANON_INDEX.md"),
+            ("REMBRANDT_UI_KNOWLEDGE.md", DESIGN_ROOT / "REMBRANDT_UI_KNOWLEDGE.md"),
+            ("LATEST_SNAPSHOT.md", DESIGN_ROOT / "corpus" / "LATEST_SNAPSHOT.md"),
+            ("PRINCIPLES_SNAPSHOT.md", DESIGN_ROOT / "corpus" / "PRINCIPLES_SNAPSHOT.md"),
+        ]
+        canon = DESIGN_ROOT / "corpus" / "principles_canon.jsonl"
+        if canon.exists():
+            sources.append(("PRINCIPLES_CANON", canon))
+        else:
+            sources.append(("PRINCIPLES_INDEX", DESIGN_ROOT / "corpus" / "principles_index.jsonl"))
+        sources += [(f"corpus/text/{p.name}", p) for p in sorted((DESIGN_ROOT / "corpus" / "text").glob("*.txt"))]
+    return [(label, p) for label, p in sources if p.is_file()]
+
+
+def _source_id(path: Path) -> str:
+    try:
+        return str(path.relative_to(WORKSPACE_BASE))
+    except ValueError:
+        return str(path)
+
+
+def _signature(sources: list[tuple[str, Path]]) -> tuple[tuple[str, int, int], ...]:
+    sig: list[tuple[str, int, int]] = []
+    for _, p in sources:
+        try:
+            st = p.stat()
+        except OSError:
+            sig.append((str(p), -1, -1))
+            continue
+        sig.append((str(p), st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _principles_refs(path: Path) -> str:
+    refs: list[str] = []
+    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        txt = line.strip()
+        if not txt:
+            continue
+        try:
+            row = json.loads(txt)
+        except json.JSONDecodeError:
+            continue
+        if row.get("accepted") is False:
+            continue
+        refs.append(f"- {row.get('id','source')} [{row.get('topic','')}]: {row.get('principles_path','')}")
+    return "\n".join(refs)
+
+
+def _canon_refs(path: Path) -> str:
+    """Near-duplicate-free principles, most-cited first, each tagged with the sources that state it."""
+    rows: list[dict] = []
+    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        txt = line.strip()
+        if not txt:
+            continue
+        try:
+            row = json.loads(txt)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(row, dict) and row.get("text"):
+            rows.append(row)
+    rows.sort(key=lambda r: len(r.get("citations") or []), reverse=True)
+    refs = []
+    for row in rows:
+        ids = ", ".join(str(c.get("id", "")) for c in row.get("citations") or [])
+        refs.append(f"- {row['text']} [{ids}]")
+    return "\n".join(refs)
+
+
+def _source_text(p: Path) -> str:
+    if not p.exists():
+        return ""
+    try:
+        if p.name == "principles_canon.jsonl":
+            return _canon_refs(p)
+        if p.suffix == ".jsonl":
+            return _principles_refs(p)
+        return p.read_text(encoding="utf-8", errors="replace").strip()
+    except OSError:
+        return ""
+
+
+class ContextIndex:
+    """
+    BM25 chunk index over every agent's context sources, persisted at
+    CONTEXT_INDEX_PATH. Sources whose (mtime, size) changed since this process
+    last looked are re-read and hashed; only those whose sha256 differs from the
+    persisted index are re-chunked, so a warm start costs one read per file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._index: Bm25Index | None = None
+        self._seen: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self, sources: list[tuple[str, Path]], sig: tuple[tuple[str, int, int], ...]) -> int:
+        if self._index is None:
+            self._index = Bm25Index.load(self.path)
+        changed = 0
+        for (_, p), (_, mtime_ns, size) in zip(sources, sig):
+            sid = _source_id(p)
+            if self._seen.get(sid) == (mtime_ns, size) and self._index.key(sid) is not None:
+                continue
+            text = _source_text(p)
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            if self._index.key(sid) != key:
+                self._index.update(sid, key, chunk_text(text) if text else [])
+                changed += 1
+            self._seen[sid] = (mtime_ns, size)
+        return changed
+
+    def _save(self) -> None:
+        try:
+            self._index.save(self.path)  # type: ignore[union-attr]
+        except OSError:
+            # Read-only runtime: the in-memory index still serves this process.
+            pass
+
+    def refresh(self, sources: list[tuple[str, Path]], sig: tuple[tuple[str, int, int], ...]) -> bool:
+        """Bring `sources` up to date; True when nothing had to be re-indexed."""
+        with self._lock:
+            changed = self._refresh(sources, sig)
+            if changed:
+                self._save()
+        return not changed
+
+    def rebuild(self, source_lists: list[list[tuple[str, Path]]]) -> dict[str, int]:
+        """Refresh every agent's sources, drop sources no agent uses any more, and save."""
+        with self._lock:
+            changed = 0
+            keep: set[str] = set()
+            for sources in source_lists:
+                changed += self._refresh(sources, _signature(sources))
+                keep.update(_source_id(p) for _, p in sources)
+            assert self._index is not None
+            self._index.retain(keep)
+            self._save()
+            return {"sources": len(self._index.sources), "chunks": self._index.chunk_count(), "reindexed": changed}
+
+    def select(
+        self, sources: list[tuple[str, Path]], query: str, budget_tokens: int, top_k: int
+    ) -> tuple[str, str, int]:
+        """
+        Pinned sources first, then the best BM25 chunks for `query` that fit in
+        `budget_tokens` (at most `top_k`). Without any matching chunk the budget
+        is filled in source order instead. Returns (pinned text, retrieved text,
+        chunk count), each rendered in source order.
+        """
+        labels = {_source_id(p): (n, label) for n, (label, p) in enumerate(sources)}
+        pinned = [sid for sid, (_, label) in labels.items() if label in PINNED_SOURCES]
+        picked: list[tuple[str, int, str]] = []
+        used_labels: set[str] = set()
+        spent = 0
+
+        def take(sid: str, no: int, text: str) -> bool:
+            nonlocal spent
+            label = labels[sid][1]
+            cost = approx_tokens(text) + 1 + (0 if label in used_labels else approx_tokens(f"===== {label} =====") + 1)
+            if spent + cost > budget_tokens:
+                return False
+            spent += cost
+            used_labels.add(label)
+            picked.append((sid, no, text))
+            return True
+
+        with self._lock:
+            index = self._index
+            assert index is not None
+            for sid in pinned:
+                for no, text in enumerate(index.chunks(sid)):
+                    take(sid, no, text)
+            rest = [sid for sid in labels if sid not in pinned]
+            found = 0
+            for hit in (index.search(query, k=top_k * 4, source_ids=rest) if rest else []):
+                if found >= top_k:
+                    break
+                found += take(hit.source_id, hit.chunk_no, hit.text)
+            if not found:
+                for sid in rest:
+                    for no, text in enumerate(index.chunks(sid)):
+                        if not take(sid, no, text):
+                            break
+
+        picked.sort(key=lambda c: (labels[c[0]][0], c[1]))
+
+        def render(chunks: list[tuple[str, int, str]]) -> str:
+            parts: list[str] = []
+            current = None
+            for sid, _, text in chunks:
+                if sid != current:
+                    if parts:
+                        parts.append("")
+                    parts.append(f"===== {labels[sid][1]} =====")
+                    current = sid
+                parts.append(text)
+            return "\n".join(parts)
+
+        return (
+            render([c for c in picked if c[0] in pinned]),
+            render([c for c in picked if c[0] not in pinned]),
+            len(picked),
+        )
+
+
+_INDEX = ContextIndex(CONTEXT_INDEX_PATH)
+_LAST: dict[tuple[str, int], ContextBundle] = {}
+_LAST_LOCK = threading.Lock()
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+def get_context_bundle(
+    agent: str, query: str = "", budget_tokens: int = CONTEXT_TOKEN_BUDGET, top_k: int = CONTEXT_TOP_K
+) -> ContextBundle:
+    """
+    Return the chat context for one message: the agent's pinned sources plus the
+    chunks of its other sources that best match `query`, within `budget_tokens`.
+    Source files are only stat()ed per call; changed ones are re-indexed lazily.
+    Only the pinned part is hashed into `cache_key`. Names without an
+    `agents/<agent>/` directory get an empty bundle and never touch the index.
+    """
+    started = time.perf_counter()
+    sources = _context_sources(agent)
+    if not sources:
+        with _LAST_LOCK:
+            for key in [k for k in _LAST if k[0] == agent]:
+                del _LAST[key]
+        return ContextBundle(agent=agent, pinned="", retrieved="", sha256=_EMPTY_SHA256, signature=())
+    sig = _signature(sources)
+    cache_result("agent_context", _INDEX.refresh(sources, sig))
+    pinned, retrieved, chunks = _INDEX.select(sources, query, budget_tokens, top_k)
+    bundle = ContextBundle(
+        agent=agent,
+        pinned=pinned,
+        retrieved=retrieved,
+        sha256=hashlib.sha256(pinned.encode("utf-8")).hexdigest(),
+        signature=sig,
+        chunks=chunks,
+    )
+    CONTEXT_RETRIEVAL_SECONDS.observe(time.perf_counter() - started, agent=agent)
+    with _LAST_LOCK:
+        _LAST[(agent, budget_tokens)] = bundle
+    return bundle
+
+
+def build_index(agents: list[str] | None = None) -> dict[str, int]:
+    """Offline (re)build of the context index for `agents` (default: every agent directory)."""
+    if agents is None:
+        agents_dir = WORKSPACE_BASE / "agents"
+        agents = sorted(p.name for p in agents_dir.iterdir() if p.is_dir()) if agents_dir.is_dir() else []
+    agents = [a for a in agents if _agent_root(a) is not None]
+    return {"agents": len(agents), **_INDEX.rebuild([_context_sources(a) for a in agents])}
+
+
+def cache_info() -> dict[str, dict[str, object]]:
+    """Most recent bundle per (agent, budget)."""
+    with _LAST_LOCK:
+        items = list(_LAST.items())
+    return {
+        f"{agent}:{budget}": {
+            "sha256": b.sha256,
+            "chars": len(b.text),
+            "tokens": approx_tokens(b.text),
+            "pinned_tokens": approx_tokens(b.pinned),
+            "files": len(b.signature),
+            "chunks": b.chunks,
+        }
+        for (agent, budget), b in items
+    }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import csv
+import importlib.util
 import io
 import json
 import os
@@ -10,22 +11,94 @@ import re
 import subprocess
 import sys
 import tempfile
+import time
 from typing import Any
 import uuid
-import urllib.error
-import urllib.request
 
 from fastapi import FastAPI, Form, Request
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from .cli import run_query_status
-from .config import ATTENTION_TYPES, POLL_AGENTS_SECS, POLL_TASKS_SECS, QUERY_STATUS_CLI, RUNTIME_BASE, STATUS_AGENTS_DIR, STATUS_TASKS_DIR, TEAM_BUS, WORKSPACE_BASE
+from .query_runner import CliResult, run_query_status as _spawn_query_status
+from .agent_context import cache_info as context_cache_info, get_context_bundle
+from ops.teambus.columnar import MANIFEST as COLUMNAR_MANIFEST, ColumnarUnavailable, LiveHistory, load as load_columnar
+from ops.teambus.record import EventRecord
+
+from .bus_window import TailWindow, decode_bus_event, decode_json_row, parse_ts
+from .chat_index import chat_index_for
+from . import metrics
+from .config import ATTENTION_TYPES, BUS_COLUMNAR_DIR, POLL_AGENTS_SECS, POLL_TASKS_SECS, PROFILE_DIR, PROFILE_INTERVAL_MS, PROFILE_KEEP, PROFILE_SAMPLE_RATE, QUERY_STATUS_CLI, RECEIPTS_CATALOG, RECEIPTS_PAGE_SIZE, RUNTIME_BASE, SHARED_STATE_LOCK, SHARED_STATE_PATH, STATUS_AGENTS_DIR, STATUS_TASKS_DIR, TEAM_BUS, WORKSPACE_BASE
+from .openai_client import CHAT_LATENCY, ResponseResult, create_response, stream_response
 from .parsers import parse_agent_output, parse_task_output, read_receipt
+from .profiler import ProfileStore, ProfilingMiddleware, sample_hit
+from .receipts_catalog import ReceiptsCatalog
+from .shared_state import BusStatusSource, SharedQueryStatus
+
+class _TimedTemplates(Jinja2Templates):
+    """Jinja2Templates that records render time per template name."""
+
+    def TemplateResponse(self, *args: Any, **kwargs: Any):  # noqa: N802 - Starlette API name
+        name = args[0] if args and isinstance(args[0], str) else str(kwargs.get("name", ""))
+        with metrics.TEMPLATE_RENDER_SECONDS.time(template=name):
+            return super().TemplateResponse(*args, **kwargs)
+
+
+class _RouteTimingMiddleware:
+    """
+    ASGI middleware recording request latency per route template. Timing ends
+    when the last body chunk is sent, so streamed responses are fully counted.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal status
+            if message.get("type") == "http.response.start":
+                status = str(message.get("status", 500))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            # Label by template (e.g. /tasks/{task_id}) to keep cardinality bounded.
+            label = getattr(route, "path", None) or ("/static" if scope.get("path", "").startswith("/static/") else "unmatched")
+            metrics.HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=label,
+                status=status,
+            )
+
+
+def _profile_decision(scope: dict) -> bool:
+    """
+    Profile when OPENCLAW_UI_PROFILE is on (sampled at OPENCLAW_UI_PROFILE_RATE),
+    or always when the request asks via `x-openclaw-profile: 1` and carries the
+    profiling scope.
+    """
+    request = Request(scope)
+    if request.headers.get("x-openclaw-profile", "").strip().lower() in TRUTHY:
+        if _required_profile_scope() in _request_scopes(request):
+            return True
+    return _is_truthy_env("OPENCLAW_UI_PROFILE", "0") and sample_hit(PROFILE_SAMPLE_RATE)
+
 
+PROFILES = ProfileStore(PROFILE_DIR, PROFILE_KEEP)
 app = FastAPI(title="OpenClaw Control Plane UI")
-templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+# Starlette wraps in reverse order: timing stays outermost so profiled requests still count.
+app.add_middleware(ProfilingMiddleware, store=PROFILES, decide=_profile_decision, interval_s=PROFILE_INTERVAL_MS / 1000)
+app.add_middleware(_RouteTimingMiddleware)
+templates = _TimedTemplates(directory=str(Path(__file__).parent / "templates"))
 app.mount("/static", StaticFiles(directory=str(Path(__file__).parent / "static")), name="static")
 
 AGENT_ROLE_MAP = {
@@ -62,6 +135,13 @@ FEED_SEVERITY_SET = {"info", "warn", "err"}
 SCOPE_TOKEN_RE = re.compile(r"^[A-Za-z0-9_.:/-]{1,64}$")
 UI_AUDIT_LOG = RUNTIME_BASE / "logs" / "ui_audit.jsonl"
 TRUTHY = {"1", "true", "yes", "on"}
+RECEIPT_NAME_RE = re.compile(r"^[A-Za-z0-9._:-]{1,160}-report\.md$")
+RECEIPTS = ReceiptsCatalog(STATUS_TASKS_DIR, RECEIPTS_CATALOG)
+HOME_INTEL_WINDOW = 400
+_BUS_WINDOW: TailWindow[EventRecord] = TailWindow(TEAM_BUS, 1200, decode_bus_event, "bus_window")
+_AUDIT_WINDOW: TailWindow[dict] = TailWindow(UI_AUDIT_LOG, 1200, decode_json_row, "ui_audit_window")
+# Full bus history as columns (compacted snapshot + live tail) for long-horizon trends.
+_HISTORY = LiveHistory(TEAM_BUS, BUS_COLUMNAR_DIR)
 
 
 def _auto_reply_text(agent: str, message: str) -> str:
@@ -90,178 +170,46 @@ def _load_openai_api_key() -> str:
     return ""
 
 
-def _agent_context(agent: str, max_chars: int = 18_000) -> str:
-    root = WORKSPACE_BASE / "agents" / agent
-    parts: list[str] = []
-    for name in ("SOUL.md", "RUNBOOK.md", "NOTES.md"):
-        p = root / name
-        if not p.exists():
-            continue
-        try:
-            txt = p.read_text(encoding="utf-8", errors="replace").strip()
-        except OSError:
-            continue
-        if txt:
-            parts.append(f"===== {name} =====\n{txt}\n")
-    if agent == "rembrandt":
-        canon_idx = WORKSPACE_BASE / "docs" / "design" / "CANON_INDEX.md"
-        if canon_idx.exists():
-            try:
-                ci_txt = canon_idx.read_text(encoding="utf-8", errors="replace").strip()
-            except OSError:
-                ci_txt = ""
-            if ci_txt:
-                parts.append(f"===== CANON_INDEX.md =====\n{ci_txt}\n")
-
-        design_kb = WORKSPACE_BASE / "docs" / "design" / "REMBRANDT_UI_KNOWLEDGE.md"
-        if design_kb.exists():
-            try:
-                kb_txt = design_kb.read_text(encoding="utf-8", errors="replace").strip()
-            except OSError:
-                kb_txt = ""
-            if kb_txt:
-                parts.append(f"===== REMBRANDT_UI_KNOWLEDGE.md =====\n{kb_txt}\n")
-
-        corpus_snapshot = WORKSPACE_BASE / "docs" / "design" / "corpus" / "LATEST_SNAPSHOT.md"
-        if corpus_snapshot.exists():
-            try:
-                snap_txt = corpus_snapshot.read_text(encoding="utf-8", errors="replace").strip()
-            except OSError:
-                snap_txt = ""
-            if snap_txt:
-                parts.append(f"===== LATEST_SNAPSHOT.md =====\n{snap_txt}\n")
-
-        principles_snapshot = WORKSPACE_BASE / "docs" / "design" / "corpus" / "PRINCIPLES_SNAPSHOT.md"
-        if principles_snapshot.exists():
-            try:
-                ps_txt = principles_snapshot.read_text(encoding="utf-8", errors="replace").strip()
-            except OSError:
-                ps_txt = ""
-            if ps_txt:
-                parts.append(f"===== PRINCIPLES_SNAPSHOT.md =====\n{ps_txt}\n")
-
-        principles_index = WORKSPACE_BASE / "docs" / "design" / "corpus" / "principles_index.jsonl"
-        if principles_index.exists():
-            refs: list[str] = []
-            try:
-                for line in principles_index.read_text(encoding="utf-8", errors="replace").splitlines():
-                    txt = line.strip()
-                    if not txt:
-                        continue
-                    try:
-                        row = json.loads(txt)
-                    except json.JSONDecodeError:
-                        continue
-                    if row.get("accepted") is False:
-                        continue
-                    refs.append(
-                        f"- {row.get('id','source')} [{row.get('topic','')}]: {row.get('principles_path','')}"
-                    )
-                    if len(refs) >= 30:
-                        break
-            except OSError:
-                refs = []
-            if refs:
-                parts.append("===== PRINCIPLES_INDEX =====\n" + "\n".join(refs) + "\n")
-    combined = "\n".join(parts).strip()
-    if not combined:
-        return ""
-    if len(combined) <= max_chars:
-        return combined
-    return combined[: max_chars - 64] + "\n\n[truncated for chat context]"
-
-
-def _extract_response_text(obj: object) -> str:
-    chunks: list[str] = []
-
-    def walk(node: object) -> None:
-        if isinstance(node, dict):
-            ot = node.get("output_text")
-            if isinstance(ot, str) and ot.strip():
-                chunks.append(ot.strip())
-            t = node.get("text")
-            if isinstance(t, str) and t.strip():
-                chunks.append(t.strip())
-            for v in node.values():
-                walk(v)
-            return
-        if isinstance(node, list):
-            for item in node:
-                walk(item)
-
-    walk(obj)
-    if not chunks:
-        return ""
-    # Preserve first-seen order while de-duplicating exact repeats.
-    seen: set[str] = set()
-    out: list[str] = []
-    for c in chunks:
-        if c in seen:
-            continue
-        seen.add(c)
-        out.append(c)
-    return "\n\n".join(out).strip()
-
+def _chat_model() -> str:
+    return (os.environ.get("OPENCLAW_UI_CHAT_MODEL") or "gpt-5-mini").strip()
 
-def _live_agent_reply(agent: str, message: str) -> tuple[bool, str, str]:
-    """
-    Return (ok, text, error_detail).
-    """
-    api_key = _load_openai_api_key()
-    if not api_key:
-        return False, "", "OPENAI_API_KEY missing"
 
-    model = (os.environ.get("OPENCLAW_UI_CHAT_MODEL") or "gpt-5-mini").strip()
-    context = _agent_context(agent)
+def _chat_payload(agent: str, message: str) -> dict[str, Any]:
+    # Only names that can be agent directories reach the context index.
+    bundle = get_context_bundle(_safe_token(agent), message)
     instructions = (
         f"You are the OpenClaw agent '{agent}'. "
         "Answer as that agent in a concise, action-oriented way. "
         "If unsure, state uncertainty and propose a concrete next step."
     )
-    if context:
-        instructions += "\n\nUse this agent context:\n" + context
-
-    payload = {
-        "model": model,
+    payload: dict[str, Any] = {
+        "model": _chat_model(),
         "instructions": instructions,
         "input": message,
     }
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        "https://api.openai.com/v1/responses",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-    except urllib.error.HTTPError as e:
-        err_code = ""
-        try:
-            body = e.read().decode("utf-8", errors="replace")
-            obj = json.loads(body)
-            err_code = str((obj.get("error") or {}).get("code") or "").strip()
-        except Exception:
-            err_code = ""
-        if err_code:
-            return False, "", f"HTTP {e.code} ({err_code})"
-        return False, "", f"HTTP {e.code}"
-    except Exception as e:
-        return False, "", str(e)
+    if bundle.pinned:
+        payload["instructions"] += "\n\nUse this agent context:\n" + bundle.pinned
+        # Instructions only change with the pinned sources; let the API reuse its cached prompt.
+        payload["prompt_cache_key"] = bundle.cache_key
+    if bundle.retrieved:
+        # Per-message chunks go after the cached prefix, alongside the message.
+        payload["input"] = f"Relevant agent context:\n{bundle.retrieved}\n\n{message}"
+    return payload
 
-    try:
-        body = json.loads(raw)
-    except json.JSONDecodeError:
-        return False, "", "non-JSON response from API"
 
-    text = _extract_response_text(body)
-    if not text:
-        return False, "", "empty model output"
-    return True, text, ""
+def _live_agent_reply(agent: str, message: str) -> ResponseResult:
+    api_key = _load_openai_api_key()
+    if not api_key:
+        return ResponseResult(False, "", "OPENAI_API_KEY missing", None, 0, False)
+    return create_response(api_key, _chat_payload(agent, message))
+
+
+def _chat_live_enabled() -> bool:
+    return os.environ.get("OPENCLAW_UI_CHAT_LIVE", "1").strip().lower() not in {"0", "false", "no"}
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 
 def _should_run_rembrandt_worker(message: str) -> bool:
@@ -361,6 +309,43 @@ def discover_tasks() -> list[str]:
     return sorted([p.name for p in STATUS_TASKS_DIR.iterdir() if p.is_dir()])
 
 
+# Multi-worker mode (OPENCLAW_UI_SHARED_STATE=1): one worker tails the bus and renders
+# query_status for every agent and task; the others read its snapshot instead of spawning it.
+_SHARED = SharedQueryStatus(
+    SHARED_STATE_PATH,
+    SHARED_STATE_LOCK,
+    interval_s=POLL_AGENTS_SECS,
+    max_age_s=3 * POLL_AGENTS_SECS,
+)
+
+
+def _shared_state_enabled() -> bool:
+    return _is_truthy_env("OPENCLAW_UI_SHARED_STATE", "0")
+
+
+def _shared_jobs() -> list[tuple[str, ...]]:
+    return [("--agent", a) for a in discover_agents()] + [("--task-id", t) for t in discover_tasks()]
+
+
+def run_query_status(*args: str) -> CliResult:
+    if _shared_state_enabled():
+        hit = _SHARED.lookup(args)
+        if hit is not None:
+            return hit
+    return _spawn_query_status(*args)
+
+
+@app.on_event("startup")
+def _start_shared_state() -> None:
+    if _shared_state_enabled():
+        _SHARED.start(_shared_jobs, BusStatusSource(TEAM_BUS, STATUS_AGENTS_DIR, STATUS_TASKS_DIR))
+
+
+@app.on_event("shutdown")
+def _stop_shared_state() -> None:
+    _SHARED.stop()
+
+
 def _format_ts(ts: float | None) -> str:
     if ts is None:
         return "n/a"
@@ -402,24 +387,67 @@ def _format_date_value(value: object) -> str:
     return txt
 
 
-def _task_time_bounds(task_id: str) -> tuple[float | None, float | None]:
-    task_dir = STATUS_TASKS_DIR / task_id
-    if not task_dir.exists():
+# path -> (dir mtime_ns, min file mtime, max file mtime, subdirectories)
+_DIR_BOUNDS_CACHE: dict[str, tuple[int, float | None, float | None, tuple[str, ...]]] = {}
+
+
+def _dir_time_bounds(path: str, rescan: bool) -> tuple[float | None, float | None]:
+    """
+    Min/max file mtime under `path`, one os.scandir per directory. Directories
+    whose own mtime is unchanged reuse their cached file bounds; `rescan` forces a
+    fresh scan (task roots hold lane files that are appended in place).
+    """
+    try:
+        dir_mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _DIR_BOUNDS_CACHE.pop(path, None)
         return None, None
-    mtimes: list[float] = []
-    for p in task_dir.rglob("*"):
-        if p.is_file():
-            try:
-                mtimes.append(p.stat().st_mtime)
-            except OSError:
-                continue
-    if not mtimes:
+    cached = _DIR_BOUNDS_CACHE.get(path)
+    if cached is not None and not rescan and cached[0] == dir_mtime_ns:
+        metrics.cache_result("dir_bounds", True)
+        lo, hi, subdirs = cached[1], cached[2], cached[3]
+    else:
+        if not rescan:
+            metrics.cache_result("dir_bounds", False)
+        lo = hi = None
+        found: list[str] = []
         try:
-            ts = task_dir.stat().st_mtime
-            return ts, ts
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            found.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        m = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    lo = m if lo is None or m < lo else lo
+                    hi = m if hi is None or m > hi else hi
         except OSError:
             return None, None
-    return min(mtimes), max(mtimes)
+        subdirs = tuple(found)
+        _DIR_BOUNDS_CACHE[path] = (dir_mtime_ns, lo, hi, subdirs)
+    for sub in subdirs:
+        sub_lo, sub_hi = _dir_time_bounds(sub, rescan=False)
+        if sub_lo is not None and (lo is None or sub_lo < lo):
+            lo = sub_lo
+        if sub_hi is not None and (hi is None or sub_hi > hi):
+            hi = sub_hi
+    return lo, hi
+
+
+def _task_time_bounds(task_id: str) -> tuple[float | None, float | None]:
+    task_dir = STATUS_TASKS_DIR / task_id
+    lo, hi = _dir_time_bounds(str(task_dir), rescan=True)
+    if lo is not None:
+        return lo, hi
+    try:
+        ts = task_dir.stat().st_mtime
+        return ts, ts
+    except OSError:
+        return None, None
 
 
 def _humanize_agent_update(line: str) -> dict[str, str]:
@@ -508,6 +536,13 @@ def _required_governed_scope() -> str:
     return "ui:governed_actions"
 
 
+def _required_profile_scope() -> str:
+    scope = (os.environ.get("OPENCLAW_UI_PROFILE_SCOPE") or "ui:profile").strip()
+    if scope and SCOPE_TOKEN_RE.fullmatch(scope):
+        return scope
+    return "ui:profile"
+
+
 def _request_scopes(request: Request | None = None) -> list[str]:
     items: set[str] = set()
     env_scopes = str(os.environ.get("OPENCLAW_UI_SCOPES") or "")
@@ -611,49 +646,34 @@ def _notify_custodian_governed_action(
 
 
 def _read_recent_ui_audit_events(limit: int = 800) -> list[dict]:
-    if not UI_AUDIT_LOG.exists():
-        return []
-    lines: list[str] = []
-    try:
-        with UI_AUDIT_LOG.open("r", encoding="utf-8") as f:
-            for line in f:
-                txt = line.strip()
-                if txt:
-                    lines.append(txt)
-    except OSError:
-        return []
+    return _AUDIT_WINDOW.rows(limit)
 
-    rows: list[dict] = []
-    for txt in lines[-limit:]:
-        try:
-            ev = json.loads(txt)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(ev, dict):
-            rows.append(ev)
-    return rows
+
+def _governed_ack_map(records: list[EventRecord]) -> dict[str, dict[str, str]]:
+    ack_by_run: dict[str, dict[str, str]] = {}
+    for rec in records:
+        _note_governed_ack(ack_by_run, rec)
+    return ack_by_run
+
+
+def _note_governed_ack(ack_by_run: dict[str, dict[str, str]], rec: EventRecord) -> None:
+    if rec.type.upper() != "CUSTODIAN_AUDIT_ACK":
+        return
+    rid = _safe_token(rec.get("run_id", ""), fallback="")
+    if not rid:
+        return
+    # keep latest ack seen for this run id
+    ack_by_run[rid] = {
+        "ack_ts": _format_mmddyyyy_hhmm(rec.dt),
+        "ack_actor": _safe_token(rec.actor, fallback="custodian"),
+    }
 
 
 def _collect_governed_history(
     *,
-    bus_events: list[dict],
+    ack_by_run: dict[str, dict[str, str]],
     limit: int = 50,
 ) -> tuple[list[dict], list[str], list[str]]:
-    ack_by_run: dict[str, dict[str, str]] = {}
-    for ev in bus_events[-800:]:
-        if str(ev.get("type", "")).strip().upper() != "CUSTODIAN_AUDIT_ACK":
-            continue
-        rid = _safe_token(ev.get("run_id", ""), fallback="")
-        if not rid:
-            continue
-        ts_dt = _parse_iso_dt(ev.get("ts"))
-        rec = {
-            "ack_ts": _format_mmddyyyy_hhmm(ts_dt),
-            "ack_actor": _safe_token(ev.get("actor", ""), fallback="custodian"),
-        }
-        # keep latest ack seen for this run id
-        ack_by_run[rid] = rec
-
     governed_history: list[dict] = []
     reason_set: set[str] = set()
     result_set: set[str] = set()
@@ -732,16 +752,7 @@ def _validate_feed_filters(
 
 
 def _parse_iso_dt(value: object) -> datetime | None:
-    txt = str(value or "").strip()
-    if not txt:
-        return None
-    try:
-        dt = datetime.fromisoformat(txt.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt
+    return parse_ts(str(value or ""))
 
 
 def _format_mmddyyyy_hhmm(dt: datetime | None) -> str:
@@ -750,31 +761,6 @@ def _format_mmddyyyy_hhmm(dt: datetime | None) -> str:
     return dt.astimezone().strftime("%m/%d/%Y %H:%M")
 
 
-def _read_recent_bus_events(limit: int = 400) -> list[dict]:
-    if not TEAM_BUS.exists():
-        return []
-    lines: list[str] = []
-    try:
-        with TEAM_BUS.open("r", encoding="utf-8") as f:
-            for line in f:
-                txt = line.strip()
-                if txt:
-                    lines.append(txt)
-    except OSError:
-        return []
-
-    rows: list[dict] = []
-    for txt in lines[-limit:]:
-        try:
-            ev = json.loads(txt)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(ev, dict):
-            continue
-        rows.append(ev)
-    return rows
-
-
 def collect_home_intel(
     agent_cards: list[dict],
     task_rows: list[dict],
@@ -782,25 +768,64 @@ def collect_home_intel(
     governance_status: dict[str, Any] | None = None,
 ) -> dict:
     now = datetime.now(timezone.utc)
-    bus_events = _read_recent_bus_events()
+    records = _BUS_WINDOW.rows(HOME_INTEL_WINDOW)
 
-    last_chat_req: dict[str, datetime] = {}
+    ff = feed_filters or {}
+    filter_type = str(ff.get("event_type", "")).strip().upper()
+    filter_actor = str(ff.get("actor", "")).strip()
+    filter_severity = str(ff.get("severity", "")).strip().lower()
+    filter_task_id = str(ff.get("task_id", "")).strip()
+    max_items = int(ff.get("limit", 20))
+
+    # One pass over the window feeds every panel; each panel keeps its own tail span.
+    n = len(records)
+    activity_from, edges_from, inbox_from = n - 80, n - 200, n - 240
+    last_chat_req: dict[str, int] = {}
     last_chat_latency: dict[str, int] = {}
-    for ev in bus_events:
-        ev_type = str(ev.get("type", ""))
-        actor = str(ev.get("actor", "")).strip()
-        target = str(ev.get("target_agent", "")).strip()
-        ev_dt = _parse_iso_dt(ev.get("ts"))
-        if ev_dt is None:
-            continue
-        if ev_type == "CHAT_MESSAGE" and target:
-            last_chat_req[target] = ev_dt
-        elif ev_type == "CHAT_REPLY" and actor:
-            req_dt = last_chat_req.get(actor)
-            if req_dt:
-                sec = int((ev_dt - req_dt).total_seconds())
-                if sec >= 0:
-                    last_chat_latency[actor] = sec
+    ack_by_run: dict[str, dict[str, str]] = {}
+    activity_recs: list[tuple[EventRecord, str, str, str]] = []
+    inbox_recs: list[EventRecord] = []
+    edge_map: dict[tuple[str, str], int] = {}
+    token_memo: dict[str, str] = {}
+    for i, rec in enumerate(records):
+        ev_type = rec.type
+        if rec.ts is not None:
+            if ev_type == "CHAT_MESSAGE" and rec.target_agent:
+                last_chat_req[rec.target_agent] = rec.ts
+            elif ev_type == "CHAT_REPLY" and rec.actor:
+                req_ts = last_chat_req.get(rec.actor)
+                if req_ts is not None:
+                    sec = rec.ts - req_ts
+                    if sec >= 0:
+                        last_chat_latency[rec.actor] = sec
+
+        _note_governed_ack(ack_by_run, rec)
+
+        if i >= activity_from:
+            a_type = ev_type or "event"
+            a_actor = rec.actor or "system"
+            severity = _event_severity(a_type)
+            if (
+                (not filter_type or a_type.upper() == filter_type)
+                and (not filter_actor or a_actor == filter_actor)
+                and (not filter_severity or severity == filter_severity)
+                and (not filter_task_id or rec.task_id == filter_task_id)
+            ):
+                activity_recs.append((rec, a_type, a_actor, severity))
+
+        if i >= edges_from:
+            actor = token_memo.get(rec.actor)
+            if actor is None:
+                actor = token_memo[rec.actor] = _safe_token(rec.actor)
+            target = token_memo.get(rec.target_agent)
+            if target is None:
+                target = token_memo[rec.target_agent] = _safe_token(rec.target_agent)
+            if actor and target and actor != target:
+                key = (actor, target)
+                edge_map[key] = min(edge_map.get(key, 0) + 1, 999)
+
+        if i >= inbox_from and ev_type.upper() == "GOVERNED_ACTION_AUDIT" and rec.target_agent.lower() == "custodian":
+            inbox_recs.append(rec)
 
     sla_rows: list[dict] = []
     for c in agent_cards:
@@ -824,43 +849,23 @@ def collect_home_intel(
         )
 
     activity: list[dict] = []
-    ff = feed_filters or {}
-    filter_type = str(ff.get("event_type", "")).strip().upper()
-    filter_actor = str(ff.get("actor", "")).strip()
-    filter_severity = str(ff.get("severity", "")).strip().lower()
-    filter_task_id = str(ff.get("task_id", "")).strip()
-    max_items = int(ff.get("limit", 20))
-    for ev in reversed(bus_events[-80:]):
-        ts_dt = _parse_iso_dt(ev.get("ts"))
-        ev_type = str(ev.get("type", "event")).strip() or "event"
-        actor = str(ev.get("actor", "system")).strip() or "system"
-        target = str(ev.get("target_agent", "")).strip()
-        task_id = str(ev.get("task_id", "")).strip()
-        severity = _event_severity(ev_type)
-        if filter_type and ev_type.upper() != filter_type:
-            continue
-        if filter_actor and actor != filter_actor:
-            continue
-        if filter_severity and severity != filter_severity:
-            continue
-        if filter_task_id and task_id != filter_task_id:
-            continue
+    for rec, ev_type, actor, severity in reversed(activity_recs[-max(0, max_items):] if max_items > 0 else []):
+        ev = rec.to_dict()
         summary = _sanitize_text(ev.get("summary") or ev.get("message") or "", max_len=240)
         if not summary:
             summary = f"{actor} emitted {ev_type}"
         activity.append(
             {
-                "ts": _format_mmddyyyy_hhmm(ts_dt),
+                "ts": _format_mmddyyyy_hhmm(rec.dt),
                 "type": ev_type,
                 "actor": actor,
-                "target": target,
-                "task_id": task_id or "",
+                "target": rec.target_agent,
+                "task_id": rec.task_id,
                 "severity": severity,
                 "summary": _sanitize_text(summary, max_len=240),
                 "source": "team_bus",
             }
         )
-    activity = activity[:max_items]
 
     alerts: list[dict] = []
     for row in sla_rows:
@@ -895,14 +900,6 @@ def collect_home_intel(
     sev_rank = {"err": 0, "warn": 1, "info": 2}
     alerts = sorted(uniq.values(), key=lambda a: sev_rank.get(str(a.get("level", "info")), 3))[:12]
 
-    edge_map: dict[tuple[str, str], int] = {}
-    for ev in bus_events[-200:]:
-        actor = _safe_token(ev.get("actor", ""))
-        target = _safe_token(ev.get("target_agent", ""))
-        if not actor or not target or actor == target:
-            continue
-        key = (actor, target)
-        edge_map[key] = min(edge_map.get(key, 0) + 1, 999)
     graph_edges = [
         {"source": src, "target": dst, "count": cnt}
         for (src, dst), cnt in sorted(edge_map.items(), key=lambda item: item[1], reverse=True)[:24]
@@ -911,31 +908,25 @@ def collect_home_intel(
     metrics = {
         "agents": len(agent_cards),
         "tasks": len(task_rows),
-        "events": len(bus_events),
+        "events": len(records),
         "alerts": len(alerts),
     }
 
-    governed_history, reason_options, result_options = _collect_governed_history(bus_events=bus_events, limit=50)
+    governed_history, reason_options, result_options = _collect_governed_history(ack_by_run=ack_by_run, limit=50)
 
     custodian_audit_inbox: list[dict] = []
-    for ev in reversed(bus_events[-240:]):
-        ev_type = str(ev.get("type", "")).strip().upper()
-        target = str(ev.get("target_agent", "")).strip().lower()
-        if ev_type != "GOVERNED_ACTION_AUDIT" or target != "custodian":
-            continue
-        ts_dt = _parse_iso_dt(ev.get("ts"))
+    for rec in reversed(inbox_recs[-10:]):
+        ev = rec.to_dict()
         custodian_audit_inbox.append(
             {
-                "ts": _format_mmddyyyy_hhmm(ts_dt),
+                "ts": _format_mmddyyyy_hhmm(rec.dt),
                 "summary": _sanitize_text(ev.get("summary") or "governed action audit", max_len=160),
                 "message": _sanitize_text(ev.get("message") or "", max_len=220),
                 "result": _safe_token(ev.get("result", ""), fallback="unknown"),
                 "reason": _safe_token(ev.get("reason", ""), fallback=""),
-                "actor": _safe_token(ev.get("actor", ""), fallback="system"),
+                "actor": _safe_token(rec.actor, fallback="system"),
             }
         )
-        if len(custodian_audit_inbox) >= 10:
-            break
 
     return {
         "sla_rows": sla_rows,
@@ -951,51 +942,44 @@ def collect_home_intel(
     }
 
 
-def discover_receipts(task_id: str | None = None) -> list[dict]:
-    base = STATUS_TASKS_DIR
-    if not base.exists():
-        return []
-    pattern = f"{task_id}/*-report.md" if task_id else "*/*-report.md"
-    receipts = [read_receipt(p) for p in base.glob(pattern)]
-    return sorted(receipts, key=lambda r: r["mtime"], reverse=True)
+def discover_receipts(task_id: str | None = None, page: int = 1) -> tuple[list[dict], int]:
+    """Return (receipt rows, total) from the catalog. Rows carry a preview, not the body."""
+    if task_id is not None:
+        return RECEIPTS.page(task_id=task_id)
+    page = max(1, page)
+    # Past the last page, serve the last page (what _receipts_pager clamps to).
+    return RECEIPTS.page(offset=(page - 1) * RECEIPTS_PAGE_SIZE, limit=RECEIPTS_PAGE_SIZE, clamp=True)
+
+
+def _receipts_pager(page: int, total: int) -> dict:
+    pages = max(1, -(-total // max(1, RECEIPTS_PAGE_SIZE)))
+    page = max(1, min(page, pages))
+    return {"page": page, "pages": pages, "total": total, "prev": page - 1 if page > 1 else None, "next": page + 1 if page < pages else None}
+
+
+def _chat_row(agent: str, offset: int, ev: dict) -> dict:
+    target = str(ev.get("target_agent", "")).strip()
+    actor = str(ev.get("actor", "")).strip()
+    body = str(ev.get("message") or ev.get("summary") or "").strip()
+    return {
+        "offset": offset,
+        "ts": _format_date_value(ev.get("ts", "")),
+        "actor": actor or "unknown",
+        "target_agent": target or "",
+        "body": _sanitize_text(body, max_len=600),
+        "mine": actor != agent,
+    }
+
+
+def read_chat_page(agent: str, limit: int = 200, before: int | None = None) -> tuple[list[dict], bool]:
+    if not agent:
+        return [], False
+    rows, has_more = chat_index_for(TEAM_BUS).page(agent, limit=limit, before=before)
+    return [_chat_row(agent, off, ev) for off, ev in rows], has_more
 
 
 def read_chat_messages(agent: str, limit: int = 200) -> list[dict]:
-    if not agent or not TEAM_BUS.exists():
-        return []
-    rows: list[dict] = []
-    try:
-        with TEAM_BUS.open("r", encoding="utf-8") as f:
-            for line in f:
-                txt = line.strip()
-                if not txt:
-                    continue
-                try:
-                    ev = json.loads(txt)
-                except json.JSONDecodeError:
-                    continue
-                ev_type = str(ev.get("type", ""))
-                if ev_type not in {"CHAT_MESSAGE", "CHAT_REPLY"}:
-                    continue
-                target = str(ev.get("target_agent", "")).strip()
-                actor = str(ev.get("actor", "")).strip()
-                if target != agent and actor != agent:
-                    continue
-                body = str(ev.get("message") or ev.get("summary") or "").strip()
-                if not body:
-                    continue
-                rows.append(
-                    {
-                        "ts": _format_date_value(ev.get("ts", "")),
-                        "actor": actor or "unknown",
-                        "target_agent": target or "",
-                        "body": _sanitize_text(body, max_len=600),
-                        "mine": actor != agent,
-                    }
-                )
-    except OSError:
-        return []
-    return rows[-limit:]
+    return read_chat_page(agent, limit=limit)[0]
 
 
 def post_chat_message(agent: str, message: str, sender: str = "operator") -> None:
@@ -1036,10 +1020,10 @@ def post_chat_reply(agent: str, message: str) -> None:
         f.write(json.dumps(reply, ensure_ascii=False) + "\n")
 
 
-def post_chat_reply_live(agent: str, message: str, model: str | None = None) -> None:
+def post_chat_reply_live(agent: str, message: str, model: str | None = None, timing: ResponseResult | None = None) -> None:
     TEAM_BUS.parent.mkdir(parents=True, exist_ok=True)
     now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    model_name = model or (os.environ.get("OPENCLAW_UI_CHAT_MODEL") or "gpt-5-mini")
+    model_name = model or _chat_model()
     reply = {
         "schema_version": "team_bus.v1.1",
         "ts": now,
@@ -1053,6 +1037,10 @@ def post_chat_reply_live(agent: str, message: str, model: str | None = None) ->
         "model": model_name,
         "dry_run": False,
     }
+    if timing is not None:
+        reply["ttft_ms"] = timing.ttft_ms
+        reply["latency_ms"] = timing.total_ms
+        reply["streamed"] = timing.streamed
     with TEAM_BUS.open("a", encoding="utf-8") as f:
         f.write(json.dumps(reply, ensure_ascii=False) + "\n")
 
@@ -1270,6 +1258,7 @@ def summarize_dashboard(agent_cards: list[dict], task_rows: list[dict]) -> dict:
         )
 
     return {
+        "history_trend": _overview_history_trend(),
         "agent_total": agent_total,
         "agent_attention": agent_attention,
         "agent_healthy": agent_healthy,
@@ -1287,44 +1276,125 @@ def summarize_dashboard(agent_cards: list[dict], task_rows: list[dict]) -> dict:
     }
 
 
+def _trends() -> Any:
+    """ui.dashboard.trends needs numpy; import it only when a trend is requested."""
+    try:
+        from . import trends
+    except ImportError as e:
+        raise ColumnarUnavailable(f"numpy is required for trends: {e}") from None
+    return trends
+
+
+def collect_trends(days: int, resolution: str) -> dict:
+    """
+    Long-horizon bus trends from the columnar history: task completions and
+    event severity per bucket, plus per-agent chat latency percentiles.
+    Raises ColumnarUnavailable when numpy is not installed.
+    """
+    trends = _trends()
+    bucket_s = trends.RESOLUTIONS[resolution]
+    snap = _HISTORY.current()
+    now_s = int(time.time())
+    start, _ = trends.bucket_edges(now_s, days, bucket_s)
+    return {
+        "days": days,
+        "resolution": resolution,
+        "rows": len(snap),
+        "completions": trends.completions_trend(snap, now_s, days, bucket_s),
+        "severity": trends.severity_trend(snap, now_s, days, bucket_s, _event_severity),
+        "chat_latency": trends.chat_latency_percentiles(snap, start),
+    }
+
+
+_OVERVIEW_TREND: dict[str, Any] = {"key": None, "rows": None}
+
+
+def _overview_history_trend() -> list[dict] | None:
+    """
+    7-day daily completion bars for the overview panel, from the compacted
+    snapshot only: overview polls never encode bus lines. Cached until the
+    manifest changes or the UTC day rolls over; None without a snapshot for the
+    current bus or without the analytics extras.
+    """
+    try:
+        mst = (BUS_COLUMNAR_DIR / COLUMNAR_MANIFEST).stat()
+        bst = TEAM_BUS.stat()
+    except OSError:
+        return None
+    now_s = int(time.time())
+    key = (mst.st_mtime_ns, mst.st_size, bst.st_dev, bst.st_ino, now_s - now_s % 86400)
+    if _OVERVIEW_TREND["key"] == key:
+        return _OVERVIEW_TREND["rows"]
+    rows = None
+    try:
+        trends = _trends()
+        snap = load_columnar(BUS_COLUMNAR_DIR)
+    except (ColumnarUnavailable, OSError):
+        snap = None
+    if snap is not None and (snap.manifest.get("dev"), snap.manifest.get("ino")) == (bst.st_dev, bst.st_ino):
+        series = trends.completions_trend(snap, now_s, 7, trends.RESOLUTIONS["day"])
+        scale = max(series["values"]) or 1
+        rows = [
+            {
+                "label": datetime.fromtimestamp(series["start"] + i * series["bucket_s"], timezone.utc).strftime("%m/%d"),
+                "value": value,
+                "pct": round((value * 100) / scale),
+            }
+            for i, value in enumerate(series["values"])
+        ]
+    _OVERVIEW_TREND.update(key=key, rows=rows)
+    return rows
+
+
+_RESPONDER_MODULE: Any = None
+
+
+def _load_responder() -> Any:
+    """Import agent_status_responder.py in-process (it is a script, not a package)."""
+    global _RESPONDER_MODULE
+    if _RESPONDER_MODULE is None:
+        path = QUERY_STATUS_CLI.parent / "agent_status_responder.py"
+        spec = importlib.util.spec_from_file_location("openclaw_agent_status_responder", path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load {path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _RESPONDER_MODULE = module
+    return _RESPONDER_MODULE
+
+
 def close_placebo_tasks() -> dict:
     responder = QUERY_STATUS_CLI.parent / "agent_status_responder.py"
     if not responder.exists():
-        return {"closed": 0, "tasks": 0, "errors": [f"Missing responder script: {responder}"]}
+        return {"closed": 0, "tasks": 0, "errors": [f"Missing responder script: {responder}"], "lanes": []}
+    try:
+        mod = _load_responder()
+    except Exception as e:
+        return {"closed": 0, "tasks": 0, "errors": [f"Cannot load responder: {e}"], "lanes": []}
 
-    closed = 0
     tasks_seen = 0
-    errors: list[str] = []
-
+    updates: list[dict[str, str]] = []
     for task_dir in sorted(STATUS_TASKS_DIR.glob("placebo-*")):
         if not task_dir.is_dir():
             continue
         tasks_seen += 1
         for p in sorted(task_dir.glob("*.jsonl")):
-            agent = p.stem
-            if agent == "latest":
+            if p.stem == "latest":
                 continue
-            cmd = [
-                "python3",
-                str(responder),
-                "update",
-                "--agent",
-                agent,
-                "--task-id",
-                task_dir.name,
-                "--state",
-                "complete",
-                "--summary",
-                "Placebo task closed from dashboard action",
-            ]
-            proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
-            if proc.returncode == 0:
-                closed += 1
-            else:
-                err = (proc.stderr or proc.stdout or "unknown error").strip().splitlines()[-1]
-                errors.append(f"{task_dir.name}/{agent}: {err}")
+            updates.append(
+                {
+                    "agent": p.stem,
+                    "task_id": task_dir.name,
+                    "state": "complete",
+                    "summary": "Placebo task closed from dashboard action",
+                }
+            )
 
-    return {"closed": closed, "tasks": tasks_seen, "errors": errors}
+    # One locked bus append and one write per lane file for the whole batch.
+    lanes = mod.batch_update(TEAM_BUS, updates, status_root=STATUS_TASKS_DIR.parent)
+    errors = [f"{r['task_id']}/{r['agent']}: {r['error']}" for r in lanes if not r["ok"]]
+    closed = sum(1 for r in lanes if r["ok"])
+    return {"closed": closed, "tasks": tasks_seen, "errors": errors, "lanes": lanes}
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -1413,7 +1483,7 @@ def task_detail(request: Request, task_id: str):
     res = run_query_status("--task-id", task_id)
     parsed = parse_task_output(task_id, res.stdout)
     latest_human = [_humanize_agent_update(item) for item in parsed.latest_by_agent]
-    receipts = discover_receipts(task_id)
+    receipts, _ = discover_receipts(task_id)
     return templates.TemplateResponse(
         "task_detail.html",
         {
@@ -1428,10 +1498,10 @@ def task_detail(request: Request, task_id: str):
 
 
 @app.get("/receipts", response_class=HTMLResponse)
-def receipts(request: Request):
+def receipts(request: Request, page: int = 1):
     return templates.TemplateResponse(
         "receipts.html",
-        {"request": request, "receipts": discover_receipts(), "poll_tasks_s": POLL_TASKS_SECS},
+        {"request": request, "page": max(1, page), "poll_tasks_s": POLL_TASKS_SECS},
     )
 
 
@@ -1469,8 +1539,26 @@ def task_table_partial(request: Request):
 
 
 @app.get("/partials/receipts-list", response_class=HTMLResponse)
-def receipts_list_partial(request: Request):
-    return templates.TemplateResponse("partials/receipts_list.html", {"request": request, "receipts": discover_receipts()})
+def receipts_list_partial(request: Request, page: int = 1):
+    # One catalog refresh: the page comes back clamped, and the pager clamps to match.
+    rows, total = discover_receipts(page=page)
+    pager = _receipts_pager(page, total)
+    return templates.TemplateResponse(
+        "partials/receipts_list.html",
+        {"request": request, "receipts": rows, "pager": pager},
+    )
+
+
+@app.get("/partials/receipt-raw", response_class=HTMLResponse)
+def receipt_raw_partial(request: Request, task_id: str, name: str):
+    task_id = (task_id or "").strip()
+    name = (name or "").strip()
+    if not _is_valid_task_id(task_id) or not RECEIPT_NAME_RE.fullmatch(name):
+        return HTMLResponse("<div class='warn'>Invalid receipt.</div>", status_code=400)
+    path = STATUS_TASKS_DIR / task_id / name
+    if not path.is_file():
+        return HTMLResponse("<div class='warn'>Receipt not found.</div>", status_code=404)
+    return templates.TemplateResponse("partials/receipt_raw.html", {"request": request, "receipt": read_receipt(path)})
 
 
 @app.get("/partials/overview-gauges", response_class=HTMLResponse)
@@ -1556,8 +1644,8 @@ def governed_actions_csv(
         return PlainTextResponse("invalid reason filter\n", status_code=400)
     lim = max(1, min(int(limit or 200), 500))
 
-    bus_events = _read_recent_bus_events(limit=1200)
-    history, _, _ = _collect_governed_history(bus_events=bus_events, limit=lim)
+    ack_by_run = _governed_ack_map(_BUS_WINDOW.rows(800))
+    history, _, _ = _collect_governed_history(ack_by_run=ack_by_run, limit=lim)
     if rr:
         history = [h for h in history if h.get("result", "") == rr]
     if rk:
@@ -1853,15 +1941,14 @@ def chat_send_action(request: Request, agent: str = Form(...), message: str = Fo
                 {"request": request, "selected_agent": target, "messages": read_chat_messages(target)},
             )
 
-    live_enabled = (os.environ.get("OPENCLAW_UI_CHAT_LIVE", "1").strip().lower() not in {"0", "false", "no"})
-    if live_enabled:
-        ok, reply_text, err = _live_agent_reply(target, body)
-        if ok:
-            post_chat_reply_live(target, reply_text)
+    if _chat_live_enabled():
+        res = _live_agent_reply(target, body)
+        if res.ok:
+            post_chat_reply_live(target, res.text, timing=res)
         else:
             post_chat_reply_system(
                 target,
-                f"[system] Live reply unavailable ({err}). Using fallback mode.",
+                f"[system] Live reply unavailable ({res.error}). Using fallback mode.",
             )
             post_chat_reply(target, body)
     else:
@@ -1870,3 +1957,140 @@ def chat_send_action(request: Request, agent: str = Form(...), message: str = Fo
         "partials/chat_thread.html",
         {"request": request, "selected_agent": target, "messages": read_chat_messages(target)},
     )
+
+
+@app.post("/actions/chat-stream")
+def chat_stream_action(request: Request, agent: str = Form(...), message: str = Form(...), sender: str = Form("operator")):
+    """
+    Streaming variant of /actions/chat-send. Live model replies are relayed as
+    SSE `delta` events while they generate, followed by one `done` event once the
+    reply is on the bus. Everything else (governance gate, fallback mode) answers
+    with the chat thread partial exactly like chat-send.
+    """
+    target = (agent or "").strip()
+    body = (message or "").strip()
+    api_key = _load_openai_api_key() if _chat_live_enabled() else ""
+    strict_gate = target.lower() == "rembrandt" and _should_run_rembrandt_worker(body)
+    if not target or not body or not api_key or strict_gate:
+        return chat_send_action(request, agent=agent, message=message, sender=sender)
+
+    post_chat_message(target, body, sender=(sender.strip() or "operator"))
+    payload = _chat_payload(target, body)
+
+    def relay():
+        result: ResponseResult | None = None
+        for kind, value in stream_response(api_key, payload):
+            if kind == "delta":
+                yield _sse_event("delta", {"text": value})
+            else:
+                result = value
+        if result is not None and result.ok:
+            post_chat_reply_live(target, result.text, model=payload["model"], timing=result)
+        else:
+            err = result.error if result is not None else "stream ended early"
+            post_chat_reply_system(
+                target,
+                f"[system] Live reply unavailable ({err}). Using fallback mode.",
+            )
+            post_chat_reply(target, body)
+        yield _sse_event(
+            "done",
+            {
+                "ok": bool(result and result.ok),
+                "error": result.error if result is not None else "",
+                "ttft_ms": result.ttft_ms if result is not None else None,
+                "latency_ms": result.total_ms if result is not None else None,
+            },
+        )
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics")
+def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def _has_profile_scope(request: Request) -> bool:
+    # Profiles are stack dumps (module paths, function names): same scope as requesting one.
+    return _required_profile_scope() in _request_scopes(request)
+
+
+@app.get("/api/profiles")
+def profiles_api(request: Request):
+    if not _has_profile_scope(request):
+        return JSONResponse(
+            {"ok": False, "error": "missing_scope", "required_scope": _required_profile_scope()}, status_code=403
+        )
+    return {
+        "ok": True,
+        "env_enabled": _is_truthy_env("OPENCLAW_UI_PROFILE", "0"),
+        "sample_rate": PROFILE_SAMPLE_RATE,
+        "required_scope": _required_profile_scope(),
+        "profiles": PROFILES.list(),
+    }
+
+
+@app.get("/api/profiles/{route}/{name}")
+def profile_download(request: Request, route: str, name: str):
+    if not _has_profile_scope(request):
+        return PlainTextResponse(f"Missing scope: {_required_profile_scope()}", status_code=403)
+    path = PROFILES.path_for(route, name)
+    if path is None:
+        return PlainTextResponse("Profile not found.", status_code=404)
+    return PlainTextResponse(
+        path.read_text(encoding="utf-8", errors="replace"),
+        headers={"Content-Disposition": f'attachment; filename="{route}-{name}"'},
+    )
+
+
+@app.get("/api/chat/latency")
+def chat_latency_api():
+    return {"ok": True, "latency": CHAT_LATENCY.snapshot()}
+
+
+@app.get("/api/trends")
+def trends_api(days: int = 7, resolution: str = "day"):
+    try:
+        trends = _trends()
+    except ColumnarUnavailable as e:
+        return {"ok": False, "error": str(e)}
+    if days not in trends.HORIZON_DAYS:
+        return {"ok": False, "error": f"days must be one of {list(trends.HORIZON_DAYS)}"}
+    if resolution not in trends.RESOLUTIONS:
+        return {"ok": False, "error": f"resolution must be one of {sorted(trends.RESOLUTIONS)}"}
+    try:
+        return {"ok": True, **collect_trends(days, resolution)}
+    except ColumnarUnavailable as e:
+        return {"ok": False, "error": str(e)}
+
+
+@app.get("/api/shared-state")
+def shared_state_api():
+    return {"ok": True, "enabled": _shared_state_enabled(), **_SHARED.info()}
+
+
+@app.get("/api/chat/context")
+def chat_context_api():
+    return {"ok": True, "bundles": context_cache_info()}
+
+
+@app.get("/api/chat/{agent}")
+def chat_history_api(agent: str, before: int | None = None, limit: int | None = None):
+    target = (agent or "").strip()
+    if not _safe_token(target, fallback=""):
+        return {"ok": False, "error": "Invalid agent."}
+    lim = max(1, min(int(limit or 50), 200))
+    items, has_more = read_chat_page(target, limit=lim, before=before)
+    return {
+        "ok": True,
+        "agent": target,
+        "count": len(items),
+        "items": items,
+        "has_more": has_more,
+        "next_before": items[0]["offset"] if (items and has_more) else None,
+    }
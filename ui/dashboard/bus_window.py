@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+from ops.teambus.codec import loads_object
+from ops.teambus.record import EventRecord
+
+from .metrics import BUS_BYTES_SCANNED, BUS_EVENTS_PARSED, BUS_READ_SECONDS, cache_result
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=8192)
+def parse_ts(value: str) -> datetime | None:
+    """ISO-8601 (`Z` or offset) to an aware UTC datetime; memoized since bus rows share second-resolution stamps."""
+    txt = value.strip()
+    if not txt:
+        return None
+    try:
+        dt = datetime.fromisoformat(txt.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def decode_json_row(raw: bytes) -> dict | None:
+    return loads_object(raw)
+
+
+def decode_bus_event(raw: bytes) -> EventRecord | None:
+    return EventRecord.from_line(raw)
+
+
+class TailWindow(Generic[T]):
+    """
+    The last `size` decoded rows of an append-only JSONL file, kept in memory.
+
+    A refresh reads only the bytes appended since the previous one; the first
+    load scans the file but decodes just its last `size` lines. Truncation or
+    replacement (size shrink / new inode) triggers a full reload.
+
+    With `on_rows`, every appended line is decoded (the first load included) and
+    passed on in batches as `on_rows(rows, reset)`; `reset` is True on the first
+    batch after a (re)load, so incremental projections can start over.
+    """
+
+    BATCH = 4096
+
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        decode: Callable[[bytes], T | None],
+        reader: str,
+        on_rows: Callable[[list[T], bool], None] | None = None,
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.decode = decode
+        self.reader = reader
+        self.on_rows = on_rows
+        self._lock = threading.Lock()
+        self._ident: tuple[int, int] | None = None
+        self._scanned = 0
+        # Undecodable lines stay as None so `limit` counts lines, like a plain tail.
+        self._rows: deque[T | None] = deque(maxlen=size)
+
+    def _read_new(self, start: int, reset: bool) -> tuple[int, int]:
+        """Decode complete lines from `start` into the window (and `on_rows`); returns (lines, end offset)."""
+        sink = self.on_rows
+        lines: deque[bytes] | list[bytes] = deque(maxlen=self.size) if sink is None else []
+        count = 0
+        pos = start
+        with self.path.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # Partial trailing write; pick it up on the next refresh.
+                    break
+                pos += len(raw)
+                if raw.strip():
+                    lines.append(raw)
+                    count += 1
+                    if sink is not None and len(lines) >= self.BATCH:
+                        reset = self._emit(lines, reset)
+                        lines = []
+        if sink is None:
+            self._rows.extend(self.decode(raw) for raw in lines)
+        elif lines or reset:
+            self._emit(lines, reset)
+        return count, pos
+
+    def _emit(self, lines: list[bytes], reset: bool) -> bool:
+        rows = [self.decode(raw) for raw in lines]
+        self._rows.extend(rows)
+        self.on_rows([r for r in rows if r is not None], reset)  # type: ignore[misc]
+        return False
+
+    def refresh(self) -> bool:
+        """Read appended bytes; True when rows were added or the window was reset."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            with self._lock:
+                was_loaded = self._ident is not None
+                self._ident, self._scanned = None, 0
+                self._rows.clear()
+                if was_loaded and self.on_rows is not None:
+                    self.on_rows([], True)
+            return was_loaded
+        with self._lock:
+            ident = (st.st_dev, st.st_ino)
+            reset = ident != self._ident or st.st_size < self._scanned
+            if reset:
+                self._ident, self._scanned = ident, 0
+                self._rows.clear()
+            if st.st_size == self._scanned:
+                cache_result(self.reader, True)
+                if reset and self.on_rows is not None:
+                    self.on_rows([], True)
+                return reset
+            cache_result(self.reader, False)
+            started = time.perf_counter()
+            try:
+                count, pos = self._read_new(self._scanned, reset)
+            except OSError:
+                return False
+            BUS_READ_SECONDS.observe(time.perf_counter() - started, reader=self.reader)
+            BUS_BYTES_SCANNED.inc(pos - self._scanned, reader=self.reader)
+            BUS_EVENTS_PARSED.inc(count, reader=self.reader)
+            changed = reset or pos > self._scanned
+            self._scanned = pos
+            return changed
+
+    def rows(self, limit: int | None = None) -> list[T]:
+        """Snapshot of the newest `limit` rows (all when None), oldest first."""
+        self.refresh()
+        with self._lock:
+            rows = list(self._rows)
+        if limit is not None:
+            rows = rows[-limit:] if limit > 0 else []
+        return [r for r in rows if r is not None]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from pathlib import Path
+
+from ops.teambus.codec import loads_object, may_contain
+
+from .metrics import BUS_BYTES_SCANNED, BUS_EVENTS_PARSED, BUS_READ_SECONDS, cache_result
+
+CHAT_TYPES = {"CHAT_MESSAGE", "CHAT_REPLY"}
+
+
+class ChatIndex:
+    """
+    Per-agent byte-offset index of chat rows in the append-only team bus.
+
+    Only bytes appended since the previous refresh are scanned, so opening a
+    thread costs one stat, a tail read, and one seek per returned message.
+    Truncation or replacement of the bus file (size shrink / new inode) resets
+    the index.
+    """
+
+    def __init__(self, bus: Path) -> None:
+        self.bus = bus
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, ident: tuple[int, int] | None) -> None:
+        self._ident = ident
+        self._scanned = 0
+        self._offsets: dict[str, list[int]] = {}
+
+    def refresh(self) -> None:
+        try:
+            st = self.bus.stat()
+        except OSError:
+            with self._lock:
+                self._reset(None)
+            return
+        with self._lock:
+            ident = (st.st_dev, st.st_ino)
+            if ident != self._ident or st.st_size < self._scanned:
+                self._reset(ident)
+            if st.st_size == self._scanned:
+                cache_result("chat_index", True)
+                return
+            cache_result("chat_index", False)
+            started = time.perf_counter()
+            before = self._scanned
+            try:
+                with self.bus.open("rb") as f:
+                    f.seek(self._scanned)
+                    pos = self._scanned
+                    for raw in f:
+                        if not raw.endswith(b"\n"):
+                            # Partial trailing write; pick it up on the next refresh.
+                            break
+                        offset = pos
+                        pos += len(raw)
+                        if not may_contain(raw, b'"CHAT_'):
+                            continue
+                        self._index_line(offset, raw)
+                    self._scanned = pos
+            except OSError:
+                return
+            finally:
+                BUS_READ_SECONDS.observe(time.perf_counter() - started, reader="chat_index")
+            BUS_BYTES_SCANNED.inc(self._scanned - before, reader="chat_index")
+
+    def _index_line(self, offset: int, raw: bytes) -> None:
+        ev = loads_object(raw)
+        BUS_EVENTS_PARSED.inc(reader="chat_index")
+        if ev is None or str(ev.get("type", "")) not in CHAT_TYPES:
+            return
+        if not str(ev.get("message") or ev.get("summary") or "").strip():
+            return
+        actor = str(ev.get("actor", "")).strip()
+        target = str(ev.get("target_agent", "")).strip()
+        for agent in {actor, target}:
+            if agent:
+                self._offsets.setdefault(agent, []).append(offset)
+
+    def page(self, agent: str, limit: int = 200, before: int | None = None) -> tuple[list[tuple[int, dict]], bool]:
+        """
+        Return (rows, has_more) for the newest `limit` chat rows of `agent` whose
+        byte offset is below `before`. Rows are (offset, event) in bus order.
+        """
+        self.refresh()
+        with self._lock:
+            offsets = self._offsets.get(agent, [])
+            end = len(offsets) if before is None else bisect.bisect_left(offsets, before)
+            start = max(0, end - max(1, limit))
+            wanted = offsets[start:end]
+        rows: list[tuple[int, dict]] = []
+        if not wanted:
+            return rows, start > 0
+        try:
+            with self.bus.open("rb") as f:
+                for off in wanted:
+                    f.seek(off)
+                    ev = loads_object(f.readline())
+                    if ev is not None:
+                        rows.append((off, ev))
+        except OSError:
+            return [], False
+        return rows, start > 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "scanned_bytes": self._scanned,
+                "agents": len(self._offsets),
+                "rows": sum(len(v) for v in self._offsets.values()),
+            }
+
+
+_INDEXES: dict[str, ChatIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def chat_index_for(bus: Path) -> ChatIndex:
+    key = os.fspath(bus)
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = _INDEXES[key] = ChatIndex(bus)
+        return idx
@@ -1,55 +1,16 @@
 from __future__ import annotations
 
-import subprocess
-from dataclasses import dataclass
-
-from .config import CLI_MAX_BYTES, CLI_TIMEOUT_SECS, QUERY_STATUS_CLI
-
-
-@dataclass
-class CliResult:
-    ok: bool
-    stdout: str
-    stderr: str
-    code: int
-    cmd: list[str]
-    timed_out: bool
-    truncated_stdout: bool
-    truncated_stderr: bool
-
-    @property
-    def truncated(self) -> bool:
-        return self.truncated_stdout or self.truncated_stderr
-
-
-def _truncate_utf8(text: str, max_bytes: int) -> tuple[str, bool]:
-    raw = text.encode("utf-8", errors="replace")
-    if len(raw) <= max_bytes:
-        return text, False
-    return raw[:max_bytes].decode("utf-8", errors="ignore"), True
-
-
-def run_query_status(*args: str) -> CliResult:
-    cmd = ["python3", str(QUERY_STATUS_CLI), *args]
-    try:
-        proc = subprocess.run(
-            cmd,
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=CLI_TIMEOUT_SECS,
-        )
-        out, out_trunc = _truncate_utf8(proc.stdout or "", CLI_MAX_BYTES)
-        err, err_trunc = _truncate_utf8(proc.stderr or "", CLI_MAX_BYTES)
-        return CliResult(proc.returncode == 0, out, err, proc.returncode, cmd, False, out_trunc, err_trunc)
-    except subprocess.TimeoutExpired as exc:
-        raw_out = (exc.stdout or "") if isinstance(exc.stdout, str) else ""
-        raw_err = (exc.stderr or "") if isinstance(exc.stderr, str) else ""
-        out, out_trunc = _truncate_utf8(raw_out, CLI_MAX_BYTES)
-        err, err_trunc = _truncate_utf8(raw_err, CLI_MAX_BYTES)
-        if not err:
-            err = f"Command timed out after {CLI_TIMEOUT_SECS}s"
-        return CliResult(False, out, err, 124, cmd, True, out_trunc, err_trunc)
+# Kept import-light: `python -m ui.dashboard agents list` must not pay for
+# subprocess/dataclasses/metrics. The query_status runner lives in query_runner
+# and is loaded only by the commands (and the web app) that call it.
+
+
+def __getattr__(name: str):
+    if name in ("CliResult", "run_query_status"):
+        from . import query_runner
+
+        return getattr(query_runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def list_agents(base_dir: str | None = None) -> dict:
@@ -98,6 +59,11 @@ def main(argv=None) -> int:
     agents_sub = p_agents.add_subparsers(dest="agents_cmd")
     agents_sub.add_parser("list", help="List filesystem-backed agents under ./agents")
 
+    p_context = sub.add_parser("context", help="Chat context retrieval index")
+    context_sub = p_context.add_subparsers(dest="context_cmd")
+    p_build = context_sub.add_parser("build", help="Build or incrementally refresh the chat context index")
+    p_build.add_argument("agents", nargs="*", help="Agents to index (default: every agent directory)")
+
     args = parser.parse_args(argv)
 
     if args.cmd is None:
@@ -105,7 +71,8 @@ def main(argv=None) -> int:
         return 0
 
     if args.cmd == "status":
-        # uses existing helper in this module
+        from .query_runner import run_query_status
+
         res = run_query_status()
         out = getattr(res, "output", None)
         if out:
@@ -115,6 +82,7 @@ def main(argv=None) -> int:
         # Fallback: emit useful local JSON status so this is never silent.
         import json, os, subprocess, sys
         from datetime import datetime, timezone
+        from pathlib import Path
 
         def sh(cmd):
             try:
@@ -173,6 +141,16 @@ def main(argv=None) -> int:
         p_agents.print_help()
         return 2
 
+    if args.cmd == "context":
+        import json
+        if getattr(args, "context_cmd", None) == "build":
+            from .agent_context import build_index
+
+            print(json.dumps(build_index(args.agents or None), indent=2, sort_keys=True))
+            return 0
+        p_context.print_help()
+        return 2
+
     parser.print_help()
     return 0
 
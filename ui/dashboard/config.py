@@ -26,6 +26,7 @@ WORKSPACE_BASE = _env_path("OPENCLAW_WORKSPACE", "~/.openclaw/workspace")
 RUNTIME_BASE = _env_path("OPENCLAW_RUNTIME", "~/.openclaw/runtime")
 
 TEAM_BUS = RUNTIME_BASE / "logs" / "team_bus.jsonl"
+BUS_COLUMNAR_DIR = RUNTIME_BASE / "logs" / "bus_columnar"
 STATUS_AGENTS_DIR = RUNTIME_BASE / "logs" / "status" / "agents"
 STATUS_TASKS_DIR = RUNTIME_BASE / "logs" / "status" / "tasks"
 
@@ -36,3 +37,22 @@ CLI_MAX_BYTES = _env_int("OPENCLAW_UI_CLI_MAX_BYTES", 256_000)
 POLL_AGENTS_SECS = _env_float("OPENCLAW_UI_POLL_AGENTS_S", 5.0)
 POLL_TASKS_SECS = _env_float("OPENCLAW_UI_POLL_TASKS_S", 10.0)
 ATTENTION_TYPES = {"ERROR", "ESCALATE", "REVIEW_REQUEST", "BLOCKED"}
+
+OPENAI_BASE_URL = (os.environ.get("OPENCLAW_UI_OPENAI_BASE_URL") or "https://api.openai.com/v1").rstrip("/")
+OPENAI_TIMEOUT_SECS = _env_float("OPENCLAW_UI_OPENAI_TIMEOUT_S", 30.0)
+OPENAI_POOL_SIZE = _env_int("OPENCLAW_UI_OPENAI_POOL_SIZE", 4)
+
+RECEIPTS_CATALOG = RUNTIME_BASE / "logs" / "ui_receipts_catalog.json"
+RECEIPTS_PAGE_SIZE = _env_int("OPENCLAW_UI_RECEIPTS_PAGE_SIZE", 50)
+
+SHARED_STATE_PATH = RUNTIME_BASE / "logs" / "ui_shared_state.json"
+SHARED_STATE_LOCK = RUNTIME_BASE / "logs" / "ui_shared_state.lock"
+
+PROFILE_DIR = RUNTIME_BASE / "logs" / "ui_profiles"
+PROFILE_SAMPLE_RATE = _env_float("OPENCLAW_UI_PROFILE_RATE", 0.05)
+PROFILE_INTERVAL_MS = _env_float("OPENCLAW_UI_PROFILE_INTERVAL_MS", 5.0)
+PROFILE_KEEP = _env_int("OPENCLAW_UI_PROFILE_KEEP", 20)
+
+CONTEXT_INDEX_PATH = RUNTIME_BASE / "logs" / "ui_context_index.json"
+CONTEXT_TOKEN_BUDGET = _env_int("OPENCLAW_UI_CONTEXT_TOKENS", 2000)
+CONTEXT_TOP_K = _env_int("OPENCLAW_UI_CONTEXT_TOP_K", 12)
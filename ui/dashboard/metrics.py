@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
+
+# Seconds; tuned for a local control-plane UI (sub-ms cache hits up to multi-second CLI/API calls).
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt_num(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labels)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Exposition lines for every label set, without the HELP/TYPE header."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_fmt_labels(self.labels, k)} {_fmt_num(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum.
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[idx] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            row = self._values.get(self._key(labels))
+        return sum(row[0]) if row else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s)) for k, (c, s) in self._values.items())
+        out: list[str] = []
+        for key, (counts, total) in items:
+            running = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                running += n
+                le = f'le="{_fmt_num(bound)}"'
+                out.append(f"{self.name}_bucket{_fmt_labels(self.labels, key, le)} {running}")
+            out.append(f"{self.name}_sum{_fmt_labels(self.labels, key)} {_fmt_num(total)}")
+            out.append(f"{self.name}_count{_fmt_labels(self.labels, key)} {running}")
+        return out
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        lines: list[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help_text: str, labels: tuple[str, ...] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help_text, labels))  # type: ignore[return-value]
+
+
+def histogram(name: str, help_text: str, labels: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help_text, labels, buckets))  # type: ignore[return-value]
+
+
+HTTP_REQUEST_SECONDS = histogram(
+    "openclaw_ui_http_request_duration_seconds",
+    "Dashboard request latency by route template.",
+    ("method", "route", "status"),
+)
+QUERY_STATUS_SECONDS = histogram(
+    "openclaw_ui_query_status_duration_seconds",
+    "Wall time of query_status.py subprocess calls.",
+    ("command",),
+)
+QUERY_STATUS_EXIT = counter(
+    "openclaw_ui_query_status_exit_total",
+    "query_status.py exit codes.",
+    ("command", "code"),
+)
+QUERY_STATUS_TIMEOUTS = counter(
+    "openclaw_ui_query_status_timeouts_total",
+    "query_status.py calls killed by CLI_TIMEOUT_SECS.",
+    ("command",),
+)
+QUERY_STATUS_TRUNCATED = counter(
+    "openclaw_ui_query_status_truncated_total",
+    "query_status.py outputs truncated at CLI_MAX_BYTES.",
+    ("command", "stream"),
+)
+BUS_READ_SECONDS = histogram(
+    "openclaw_ui_bus_read_duration_seconds",
+    "Time spent reading the team bus.",
+    ("reader",),
+)
+BUS_BYTES_SCANNED = counter(
+    "openclaw_ui_bus_bytes_scanned_total",
+    "Team bus bytes read.",
+    ("reader",),
+)
+BUS_EVENTS_PARSED = counter(
+    "openclaw_ui_bus_events_parsed_total",
+    "Team bus rows decoded from JSON.",
+    ("reader",),
+)
+TEMPLATE_RENDER_SECONDS = histogram(
+    "openclaw_ui_template_render_duration_seconds",
+    "Jinja2 template render time.",
+    ("template",),
+)
+OPENAI_CALL_SECONDS = histogram(
+    "openclaw_ui_openai_call_duration_seconds",
+    "Responses API call latency (total).",
+    ("mode", "ok"),
+)
+OPENAI_TTFT_SECONDS = histogram(
+    "openclaw_ui_openai_ttft_seconds",
+    "Responses API time to first output token.",
+    ("mode",),
+)
+CONTEXT_RETRIEVAL_SECONDS = histogram(
+    "openclaw_ui_context_retrieval_duration_seconds",
+    "Chat context index refresh plus BM25 chunk selection per message.",
+    ("agent",),
+)
+CACHE_REQUESTS = counter(
+    "openclaw_ui_cache_requests_total",
+    "Cache lookups by cache and result (hit/miss).",
+    ("cache", "result"),
+)
+
+
+def cache_result(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def render() -> str:
+    return REGISTRY.render()
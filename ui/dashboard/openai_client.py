@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+from .config import OPENAI_BASE_URL, OPENAI_POOL_SIZE, OPENAI_TIMEOUT_SECS
+from .metrics import OPENAI_CALL_SECONDS, OPENAI_TTFT_SECONDS
+
+# Errors raised when a pooled keep-alive socket was closed by the server while idle.
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError)
+
+
+@dataclass
+class ResponseResult:
+    ok: bool
+    text: str
+    error: str
+    ttft_ms: int | None
+    total_ms: int
+    streamed: bool
+
+
+class ConnectionPool:
+    """
+    Keep-alive connections to a single API origin, shared by request threads.
+    Idle connections are reused LIFO so the warmest TLS session is picked first.
+    """
+
+    def __init__(self, base_url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "https"
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=max(1, size))
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def post(self, path: str, body: bytes, headers: dict[str, str]) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a POST and return (connection, response). The caller must read the
+        response and hand the connection back via release().
+        """
+        for _ in range(2):
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(), False
+            try:
+                conn.request("POST", self.base_path + path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+        raise ConnectionError("connection pool exhausted retries")
+
+
+class LatencyStats:
+    """Rolling window of live chat call timings (time-to-first-token and total)."""
+
+    def __init__(self, maxlen: int = 256) -> None:
+        self._rows: deque[ResponseResult] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, result: ResponseResult) -> None:
+        with self._lock:
+            self._rows.append(result)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            rows = list(self._rows)
+        ok_rows = [r for r in rows if r.ok]
+        ttft = sorted(r.ttft_ms for r in ok_rows if r.ttft_ms is not None)
+        total = sorted(r.total_ms for r in ok_rows)
+        return {
+            "calls": len(rows),
+            "ok": len(ok_rows),
+            "errors": len(rows) - len(ok_rows),
+            "streamed": sum(1 for r in rows if r.streamed),
+            "ttft_ms_p50": _percentile(ttft, 50),
+            "ttft_ms_p95": _percentile(ttft, 95),
+            "total_ms_p50": _percentile(total, 50),
+            "total_ms_p95": _percentile(total, 95),
+        }
+
+
+def _percentile(sorted_vals: list[int], pct: int) -> int | None:
+    if not sorted_vals:
+        return None
+    idx = max(0, min(len(sorted_vals) - 1, round((pct / 100) * len(sorted_vals) + 0.5) - 1))
+    return sorted_vals[idx]
+
+
+CHAT_LATENCY = LatencyStats()
+_POOL: ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ConnectionPool(OPENAI_BASE_URL, OPENAI_POOL_SIZE, OPENAI_TIMEOUT_SECS)
+        return _POOL
+
+
+def _walk_response_text(obj: object) -> str:
+    chunks: list[str] = []
+
+    def walk(node: object) -> None:
+        if isinstance(node, dict):
+            ot = node.get("output_text")
+            if isinstance(ot, str) and ot.strip():
+                chunks.append(ot.strip())
+            t = node.get("text")
+            if isinstance(t, str) and t.strip():
+                chunks.append(t.strip())
+            for v in node.values():
+                walk(v)
+            return
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(obj)
+    # Preserve first-seen order while de-duplicating exact repeats.
+    return "\n\n".join(dict.fromkeys(chunks)).strip()
+
+
+def extract_response_text(obj: object) -> str:
+    """
+    Read text from a Responses API body. Checks the documented locations
+    (`output_text`, then `output[].content[]` parts of type output_text) before
+    falling back to a full tree walk for unexpected shapes.
+    """
+    if not isinstance(obj, dict):
+        return _walk_response_text(obj)
+    ot = obj.get("output_text")
+    if isinstance(ot, str) and ot.strip():
+        return ot.strip()
+    chunks: list[str] = []
+    for item in obj.get("output") or []:
+        if not isinstance(item, dict):
+            continue
+        for part in item.get("content") or []:
+            if not isinstance(part, dict) or part.get("type") != "output_text":
+                continue
+            t = part.get("text")
+            if isinstance(t, str) and t.strip():
+                chunks.append(t.strip())
+    if chunks:
+        return "\n\n".join(dict.fromkeys(chunks)).strip()
+    return _walk_response_text(obj)
+
+
+def _headers(api_key: str, stream: bool) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream" if stream else "application/json",
+        "Connection": "keep-alive",
+    }
+
+
+def _http_error(resp: http.client.HTTPResponse) -> str:
+    err_code = ""
+    try:
+        obj = json.loads(resp.read().decode("utf-8", errors="replace"))
+        err_code = str((obj.get("error") or {}).get("code") or "").strip()
+    except Exception:
+        err_code = ""
+    if err_code:
+        return f"HTTP {resp.status} ({err_code})"
+    return f"HTTP {resp.status}"
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
+
+def _finish(ok: bool, text: str, error: str, ttft_ms: int | None, started: float, streamed: bool) -> ResponseResult:
+    result = ResponseResult(ok, text, error, ttft_ms, _elapsed_ms(started), streamed)
+    CHAT_LATENCY.record(result)
+    mode = "stream" if streamed else "blocking"
+    OPENAI_CALL_SECONDS.observe(result.total_ms / 1000, mode=mode, ok="1" if ok else "0")
+    if ok and ttft_ms is not None:
+        OPENAI_TTFT_SECONDS.observe(ttft_ms / 1000, mode=mode)
+    return result
+
+
+def create_response(api_key: str, payload: dict[str, Any]) -> ResponseResult:
+    """Blocking Responses API call over a pooled keep-alive connection."""
+    started = time.monotonic()
+    pool = get_pool()
+    body = json.dumps(payload).encode("utf-8")
+    try:
+        conn, resp = pool.post("/responses", body, _headers(api_key, stream=False))
+    except Exception as e:
+        return _finish(False, "", str(e), None, started, False)
+    reusable = False
+    try:
+        if resp.status >= 400:
+            return _finish(False, "", _http_error(resp), None, started, False)
+        raw = resp.read().decode("utf-8", errors="replace")
+        reusable = not resp.will_close
+    except Exception as e:
+        return _finish(False, "", str(e), None, started, False)
+    finally:
+        pool.release(conn, reusable)
+
+    try:
+        obj = json.loads(raw)
+    except json.JSONDecodeError:
+        return _finish(False, "", "non-JSON response from API", None, started, False)
+    text = extract_response_text(obj)
+    if not text:
+        return _finish(False, "", "empty model output", None, started, False)
+    # Without streaming the first token only becomes visible with the full body.
+    return _finish(True, text, "", _elapsed_ms(started), started, False)
+
+
+def _iter_sse(resp: http.client.HTTPResponse) -> Iterator[tuple[str, str]]:
+    event = ""
+    data: list[str] = []
+    while True:
+        raw = resp.readline()
+        if not raw:
+            break
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "", []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+def stream_response(api_key: str, payload: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """
+    Streaming Responses API call. Yields ("delta", str) for each text delta as
+    it arrives, then exactly one ("done", ResponseResult).
+    """
+    started = time.monotonic()
+    pool = get_pool()
+    body = json.dumps({**payload, "stream": True}).encode("utf-8")
+    try:
+        conn, resp = pool.post("/responses", body, _headers(api_key, stream=True))
+    except Exception as e:
+        yield "done", _finish(False, "", str(e), None, started, True)
+        return
+    if resp.status >= 400:
+        err = _http_error(resp)
+        pool.release(conn, False)
+        yield "done", _finish(False, "", err, None, started, True)
+        return
+
+    pieces: list[str] = []
+    ttft_ms: int | None = None
+    final_text = ""
+    error = ""
+    reusable = False
+    try:
+        for ev_name, data in _iter_sse(resp):
+            if data == "[DONE]":
+                break
+            try:
+                obj = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(obj, dict):
+                continue
+            ev_type = str(obj.get("type") or ev_name)
+            if ev_type == "response.output_text.delta":
+                delta = obj.get("delta")
+                if isinstance(delta, str) and delta:
+                    if ttft_ms is None:
+                        ttft_ms = _elapsed_ms(started)
+                    pieces.append(delta)
+                    yield "delta", delta
+            elif ev_type == "response.completed":
+                final_text = extract_response_text(obj.get("response") or {})
+            elif ev_type in {"response.failed", "error"}:
+                err_obj = obj.get("error") or (obj.get("response") or {}).get("error") or {}
+                error = str(err_obj.get("code") or err_obj.get("message") or ev_type) if isinstance(err_obj, dict) else ev_type
+        reusable = resp.isclosed() and not resp.will_close
+    except Exception as e:
+        error = error or str(e)
+    finally:
+        pool.release(conn, reusable)
+
+    text = final_text or "".join(pieces).strip()
+    if error:
+        yield "done", _finish(False, text, error, ttft_ms, started, True)
+    elif not text:
+        yield "done", _finish(False, "", "empty model output", ttft_ms, started, True)
+    else:
+        yield "done", _finish(True, text, "", ttft_ms, started, True)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import random
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+PACKAGE_DIR = str(Path(__file__).resolve().parent)
+PROFILE_NAME_RE = re.compile(r"^[0-9]{8}T[0-9]{6}Z-[0-9a-f]{8}\.folded$")
+ROUTE_SLUG_RE = re.compile(r"^[a-z0-9_]{1,96}$")
+MAX_STACK_DEPTH = 96
+
+
+def route_slug(path: str) -> str:
+    """Filesystem-safe name for a route template: `/tasks/{task_id}` -> `tasks_task_id`."""
+    slug = re.sub(r"[^a-z0-9]+", "_", path.lower()).strip("_")
+    return slug[:96] or "root"
+
+
+def _collapse(frame: Any) -> tuple[str, bool]:
+    """Return (`mod:func;mod:func` root-first, whether any frame is dashboard code)."""
+    names: list[str] = []
+    ours = False
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        code = frame.f_code
+        if code.co_filename.startswith(PACKAGE_DIR):
+            ours = True
+        mod = frame.f_globals.get("__name__", "?")
+        names.append(f"{mod}:{code.co_name}")
+        frame = frame.f_back
+        depth += 1
+    names.reverse()
+    return ";".join(names), ours
+
+
+class StackSampler:
+    """
+    Statistical profiler: a daemon thread snapshots every thread's stack at a
+    fixed interval and counts collapsed stacks that pass through dashboard code.
+    Idle pool workers and the event loop's select() never match, so only
+    request work is kept; concurrent requests on other threads can still show up.
+    """
+
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = max(0.001, interval_s)
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ui-profiler", daemon=True)
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            self.samples += 1
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                stack, ours = _collapse(frame)
+                if ours:
+                    self.stacks[stack] += 1
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        return self.stacks
+
+
+class ProfileStore:
+    """Collapsed-stack profiles under `<root>/<route_slug>/<ts>-<id>.folded`, newest `keep` per route."""
+
+    def __init__(self, root: Path, keep: int) -> None:
+        self.root = root
+        self.keep = max(1, keep)
+
+    def new_name(self) -> str:
+        return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}.folded"
+
+    def save(self, slug: str, name: str, stacks: Counter[str]) -> Path | None:
+        """Write the profile; empty when the request finished before the first sample."""
+        out_dir = self.root / slug
+        try:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path = out_dir / name
+            path.write_text("".join(f"{s} {n}\n" for s, n in stacks.most_common()), encoding="utf-8")
+            for old in sorted(out_dir.glob("*.folded"))[: -self.keep]:
+                old.unlink(missing_ok=True)
+        except OSError:
+            return None
+        return path
+
+    def list(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        if not self.root.is_dir():
+            return rows
+        for route_dir in sorted(p for p in self.root.iterdir() if p.is_dir()):
+            for p in route_dir.glob("*.folded"):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                rows.append({"route": route_dir.name, "name": p.name, "size": st.st_size, "mtime": int(st.st_mtime)})
+        rows.sort(key=lambda r: r["name"], reverse=True)
+        return rows
+
+    def path_for(self, slug: str, name: str) -> Path | None:
+        if not ROUTE_SLUG_RE.fullmatch(slug) or not PROFILE_NAME_RE.fullmatch(name):
+            return None
+        path = self.root / slug / name
+        return path if path.is_file() else None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles the requests `decide(scope)` selects. The
+    profile location is returned in the `x-openclaw-profile` response header.
+    """
+
+    def __init__(self, app: Any, *, store: ProfileStore, decide: Callable[[dict], bool], interval_s: float) -> None:
+        self.app = app
+        self.store = store
+        self.decide = decide
+        self.interval_s = interval_s
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope.get("type") != "http" or not self.decide(scope):
+            await self.app(scope, receive, send)
+            return
+        name = self.store.new_name()
+        slug = "unmatched"
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal slug
+            if message.get("type") == "http.response.start":
+                slug = route_slug(getattr(scope.get("route"), "path", "") or "unmatched")
+                headers = list(message.get("headers") or [])
+                headers.append((b"x-openclaw-profile", f"{slug}/{name}".encode("ascii")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(self.interval_s).start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.store.save(slug, name, sampler.stop())
+
+
+def sample_hit(rate: float) -> bool:
+    return rate > 0 and (rate >= 1 or random.random() < rate)
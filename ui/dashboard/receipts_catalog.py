@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from .metrics import cache_result
+
+PREVIEW_CHARS = 1200
+RECEIPT_SUFFIX = "-report.md"
+CATALOG_VERSION = 1
+
+
+def _read_preview(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(PREVIEW_CHARS * 4)
+    except OSError as exc:
+        return f"[read error] {exc}"
+    return head.decode("utf-8", errors="replace")[:PREVIEW_CHARS]
+
+
+class ReceiptsCatalog:
+    """
+    Persistent catalog of `<tasks>/<task_id>/*-report.md` receipts.
+
+    Each refresh lists the tasks root once, re-lists only task directories whose
+    mtime changed, and re-reads a receipt preview only when its (mtime, size)
+    changed. Bodies are never held in memory; see parsers.read_receipt for the
+    on-demand full read.
+    """
+
+    def __init__(self, tasks_dir: Path, catalog_path: Path) -> None:
+        self.tasks_dir = tasks_dir
+        self.catalog_path = catalog_path
+        self._lock = threading.Lock()
+        self._tasks: dict[str, dict[str, Any]] | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            obj = json.loads(self.catalog_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(obj, dict) or obj.get("version") != CATALOG_VERSION:
+            return {}
+        tasks = obj.get("tasks")
+        return tasks if isinstance(tasks, dict) else {}
+
+    def _save(self) -> None:
+        tmp = self.catalog_path.with_name(self.catalog_path.name + ".tmp")
+        try:
+            self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"version": CATALOG_VERSION, "tasks": self._tasks}, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.catalog_path)
+        except OSError:
+            return
+
+    def _scan_task(self, task_dir: str, prev: dict[str, Any]) -> dict[str, Any]:
+        known = prev.get("receipts") or {}
+        receipts: dict[str, Any] = {}
+        with os.scandir(task_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(RECEIPT_SUFFIX):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                old = known.get(entry.name)
+                if old and old.get("mtime_ns") == st.st_mtime_ns and old.get("size") == st.st_size:
+                    receipts[entry.name] = old
+                    continue
+                receipts[entry.name] = {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "preview": _read_preview(entry.path),
+                }
+        return {"receipts": receipts}
+
+    def _stat_known(self, task_dir: str, prev: dict[str, Any]) -> bool:
+        """True when every cataloged receipt in an unchanged directory is still current."""
+        for name, rec in (prev.get("receipts") or {}).items():
+            try:
+                st = os.stat(os.path.join(task_dir, name))
+            except OSError:
+                return False
+            if st.st_mtime_ns != rec.get("mtime_ns") or st.st_size != rec.get("size"):
+                return False
+        return True
+
+    def refresh(self) -> None:
+        with self._lock:
+            if self._tasks is None:
+                self._tasks = self._load()
+            changed = False
+            seen: set[str] = set()
+            try:
+                entries = list(os.scandir(self.tasks_dir))
+            except OSError:
+                entries = []
+            for entry in entries:
+                try:
+                    if not entry.is_dir():
+                        continue
+                    dir_mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(entry.name)
+                prev = self._tasks.get(entry.name) or {}
+                if prev.get("dir_mtime_ns") == dir_mtime_ns and self._stat_known(entry.path, prev):
+                    cache_result("receipts_catalog", True)
+                    continue
+                cache_result("receipts_catalog", False)
+                try:
+                    rec = self._scan_task(entry.path, prev)
+                except OSError:
+                    continue
+                rec["dir_mtime_ns"] = dir_mtime_ns
+                self._tasks[entry.name] = rec
+                changed = True
+            for gone in [t for t in self._tasks if t not in seen]:
+                del self._tasks[gone]
+                changed = True
+            if changed:
+                self._save()
+
+    def page(
+        self, task_id: str | None = None, offset: int = 0, limit: int | None = None, clamp: bool = False
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Return (receipts newest-first, total count) without reading any bodies.
+        With `clamp`, an offset past the end yields the last full `limit` page.
+        """
+        self.refresh()
+        with self._lock:
+            tasks = self._tasks or {}
+            if task_id is not None:
+                tasks = {task_id: tasks[task_id]} if task_id in tasks else {}
+            rows = [
+                {
+                    "path": str(self.tasks_dir / tid / name),
+                    "name": name,
+                    "task_id": tid,
+                    "mtime": int(rec["mtime_ns"] // 1_000_000_000),
+                    "size": rec["size"],
+                    "preview": rec["preview"],
+                }
+                for tid, task in tasks.items()
+                for name, rec in (task.get("receipts") or {}).items()
+            ]
+        rows.sort(key=lambda r: r["mtime"], reverse=True)
+        total = len(rows)
+        start = max(0, offset)
+        if clamp and limit and start >= total:
+            start = max(0, (total - 1) // limit * limit)
+        end = total if limit is None else start + max(0, limit)
+        return rows[start:end], total
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from ops.teambus.codec import loads
+from ops.teambus.record import EventRecord
+from ops.teambus.status import StatusProjection, agent_report, last_record, task_report
+
+from .bus_window import TailWindow, decode_bus_event
+from .config import CLI_MAX_BYTES, QUERY_STATUS_CLI
+from .metrics import cache_result
+from .query_runner import CliResult, _truncate_utf8
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts run single-process only
+    fcntl = None
+
+SNAPSHOT_VERSION = 2
+
+
+def _key(args: Sequence[str]) -> str:
+    return "\x1f".join(args)
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class BusStatusSource:
+    """
+    query_status reports for many agents and tasks from one incremental bus pass.
+
+    The bus is tailed by byte offset: each refresh folds only the newly appended
+    records into a StatusProjection (rebuilt when the bus is replaced or
+    truncated). Persisted status files are stat()ed per cycle and re-read only
+    when they change. Output matches `query_status.py --agent/--task-id`.
+    """
+
+    def __init__(self, bus: Path, agents_dir: Path, tasks_dir: Path) -> None:
+        self.agents_dir = agents_dir
+        self.tasks_dir = tasks_dir
+        self.projection = StatusProjection()
+        self.window: TailWindow[EventRecord] = TailWindow(bus, 1, decode_bus_event, "shared_state", on_rows=self._apply)
+        self._persisted: dict[Path, tuple[tuple[int, int], EventRecord | None]] = {}
+
+    def _apply(self, rows: list[EventRecord], reset: bool) -> None:
+        if reset:
+            self.projection = StatusProjection()
+        for ev in rows:
+            self.projection.add(ev)
+
+    def refresh(self) -> bool:
+        """Fold newly appended bus records in; True when the bus grew or was replaced."""
+        return self.window.refresh()
+
+    def files(self, jobs: list[tuple[str, ...]]) -> dict[Path, tuple[int, int]]:
+        """(mtime_ns, size) of every persisted status file the jobs read."""
+        out: dict[Path, tuple[int, int]] = {}
+        for flag, value in jobs:
+            if flag == "--agent":
+                paths = [self.agents_dir / f"{value}.latest.json"]
+            else:
+                paths = sorted((self.tasks_dir / value).glob("*.jsonl"))
+            for p in paths:
+                sk = _stat_key(p)
+                if sk is not None:
+                    out[p] = sk
+        return out
+
+    def _last_record(self, path: Path, sk: tuple[int, int]) -> EventRecord | None:
+        hit = self._persisted.get(path)
+        if hit is None or hit[0] != sk:
+            hit = self._persisted[path] = (sk, last_record(path))
+        return hit[1]
+
+    def report(self, args: tuple[str, ...], files: dict[Path, tuple[int, int]]) -> str:
+        flag, value = args
+        if flag == "--agent":
+            latest = self.agents_dir / f"{value}.latest.json"
+            text = None
+            if latest in files:
+                try:
+                    text = latest.read_text(encoding="utf-8")
+                except OSError:
+                    pass
+            return agent_report(value, self.projection.agents.get(value), text)
+        task_dir = self.tasks_dir / value
+        persisted = {}
+        for p, sk in files.items():
+            if p.parent == task_dir:
+                row = self._last_record(p, sk)
+                if row is not None:
+                    persisted[p.stem] = row
+        return task_report(value, self.projection.tasks.get(value), persisted)
+
+    def result(self, args: tuple[str, ...], files: dict[Path, tuple[int, int]]) -> CliResult:
+        out, truncated = _truncate_utf8(self.report(args, files), CLI_MAX_BYTES)
+        cmd = ["python3", str(QUERY_STATUS_CLI), *args]
+        return CliResult(True, out, "", 0, cmd, False, truncated, False)
+
+    def retain(self, files: dict[Path, tuple[int, int]]) -> None:
+        for p in [p for p in self._persisted if p not in files]:
+            del self._persisted[p]
+
+
+class SharedQueryStatus:
+    """
+    query_status results shared by every worker of a multi-process deployment.
+
+    The worker holding an exclusive flock on `lock_path` is the leader: it keeps
+    a BusStatusSource up to date and, when the bus, the job list or a status
+    file changed, publishes every report as one snapshot file (temp file +
+    rename, so readers never see a partial write). It touches the lock file each
+    `interval_s` as a heartbeat; followers use the snapshot only while that
+    heartbeat is younger than `max_age_s`. Other workers read the current file and
+    decode it only when a new one appears. Every worker retries the lock each
+    interval; the kernel drops it when a leader exits, and one follower takes over.
+    """
+
+    def __init__(self, path: Path, lock_path: Path, interval_s: float, max_age_s: float) -> None:
+        self.path = path
+        self.lock_path = lock_path
+        self.interval_s = interval_s
+        self.max_age_s = max_age_s
+        self._lock_fd: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._ident: tuple[int, int] | None = None
+        self._snapshot: dict[str, Any] = {}
+        self._published: tuple | None = None
+        self._mu = threading.Lock()
+
+    @property
+    def leader(self) -> bool:
+        return self._lock_fd is not None
+
+    def _try_lead(self) -> bool:
+        if self._lock_fd is not None:
+            return True
+        if fcntl is None:
+            return False
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode("ascii"))
+        # Writing the pid bumped the mtime; no heartbeat until our first snapshot is out.
+        os.utime(self.lock_path, (0, 0))
+        self._lock_fd = fd
+        self._published = None
+        return True
+
+    def heartbeat(self) -> None:
+        os.utime(self.lock_path)
+
+    def heartbeat_age(self) -> float | None:
+        try:
+            return time.time() - self.lock_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def publish(self, jobs: list[tuple[str, ...]], source: BusStatusSource) -> bool:
+        """Refresh `source` and replace the snapshot file if anything changed (leader only)."""
+        grew = source.refresh()
+        files = source.files(jobs)
+        state = (tuple(jobs), tuple(sorted(files.items())))
+        if not grew and state == self._published and self.path.exists():
+            return False
+        source.retain(files)
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "ts": time.time(),
+            "pid": os.getpid(),
+            "results": {_key(args): asdict(source.result(args, files)) for args in jobs},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._published = state
+        return True
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return {}
+        ident = (st.st_ino, st.st_mtime_ns)
+        with self._mu:
+            if ident != self._ident:
+                snapshot: dict[str, Any] = {}
+                try:
+                    obj = loads(self.path.read_bytes())
+                    if isinstance(obj, dict) and obj.get("version") == SNAPSHOT_VERSION:
+                        snapshot = obj
+                except (OSError, ValueError):
+                    pass
+                self._ident, self._snapshot = ident, snapshot
+            return self._snapshot
+
+    def lookup(self, args: Sequence[str]) -> CliResult | None:
+        """Published result for `args`, or None when absent or the leader's heartbeat is older than `max_age_s`."""
+        row = None
+        age = self.heartbeat_age()
+        if age is not None and age <= self.max_age_s:
+            snap = self._load()
+            if snap:
+                row = snap.get("results", {}).get(_key(args))
+        cache_result("shared_query_status", row is not None)
+        if row is None:
+            return None
+        try:
+            return CliResult(**row)
+        except TypeError:
+            return None
+
+    def info(self) -> dict[str, Any]:
+        snap = self._load()
+        ts = float(snap.get("ts", 0)) if snap else 0.0
+        heartbeat = self.heartbeat_age()
+        return {
+            "pid": os.getpid(),
+            "leader": self.leader,
+            "leader_pid": snap.get("pid") if snap else None,
+            "age_s": round(time.time() - ts, 1) if ts else None,
+            "heartbeat_age_s": round(heartbeat, 1) if heartbeat is not None else None,
+            "entries": len(snap.get("results", {})) if snap else 0,
+        }
+
+    def start(self, jobs: Callable[[], list[tuple[str, ...]]], source: BusStatusSource) -> None:
+        if self._thread is not None:
+            return
+
+        def loop() -> None:
+            while True:
+                if self._try_lead():
+                    try:
+                        self.publish(jobs(), source)
+                        self.heartbeat()
+                    except Exception:
+                        # No heartbeat: followers fall back to running query_status once it ages out.
+                        pass
+                if self._stop.wait(self.interval_s):
+                    return
+
+        self._thread = threading.Thread(target=loop, name="openclaw-shared-state", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_s + 1)
+            self._thread = None
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
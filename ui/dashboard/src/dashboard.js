@@ -735,6 +735,139 @@ function setupGovernedHistoryFilters(scope = document) {
   apply();
 }
 
+function parseSseBlock(block) {
+  let event = "message";
+  const data = [];
+  block.split("\n").forEach((line) => {
+    if (line.startsWith("event:")) event = line.slice(6).trim();
+    else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+  });
+  try {
+    return { event, data: JSON.parse(data.join("\n") || "{}") };
+  } catch {
+    return { event, data: {} };
+  }
+}
+
+function chatMessageItem(msg) {
+  const li = document.createElement("li");
+  li.className = `chat-msg ${msg.mine ? "chat-msg-out" : "chat-msg-in"}`;
+  const head = document.createElement("div");
+  head.className = "chat-msg-head";
+  const who = document.createElement("span");
+  who.className = "chat-msg-actor";
+  who.textContent = msg.actor;
+  const ts = document.createElement("span");
+  ts.className = "chat-msg-ts";
+  ts.textContent = msg.ts;
+  head.append(who, ts);
+  const p = document.createElement("p");
+  p.className = "chat-msg-body";
+  p.textContent = msg.body;
+  li.append(head, p);
+  return li;
+}
+
+function appendChatBubble(thread, actor, body, incoming) {
+  let list = thread.querySelector("ul.chat-thread");
+  if (!list) {
+    thread.innerHTML = "";
+    list = document.createElement("ul");
+    list.className = "chat-thread";
+    thread.appendChild(list);
+  }
+  const li = chatMessageItem({ actor, body, mine: !incoming, ts: incoming ? "streaming..." : "now" });
+  list.appendChild(li);
+  return li.querySelector(".chat-msg-body");
+}
+
+function setupChatHistory(scope = document) {
+  scope.querySelectorAll("ul.chat-thread[data-chat-agent]").forEach((list) => {
+    const box = list.parentElement;
+    if (!box || box.dataset.historyBound === "1") return;
+    box.dataset.historyBound = "1";
+    box.addEventListener("scroll", async () => {
+      if (box.scrollTop + box.clientHeight >= box.scrollHeight - 8) {
+        // Back at the newest message: let polling refresh the thread again.
+        delete box.dataset.history;
+        return;
+      }
+      const current = box.querySelector("ul.chat-thread[data-chat-agent]");
+      const before = current?.dataset.chatBefore || "";
+      if (!current || !before || box.scrollTop > 24 || box.dataset.historyLoading === "1") return;
+      box.dataset.historyLoading = "1";
+      try {
+        const agent = encodeURIComponent(current.dataset.chatAgent || "");
+        const res = await fetch(`/api/chat/${agent}?before=${encodeURIComponent(before)}&limit=50`);
+        const page = await res.json();
+        if (page.ok) {
+          const prevHeight = box.scrollHeight;
+          const frag = document.createDocumentFragment();
+          page.items.forEach((m) => frag.appendChild(chatMessageItem(m)));
+          current.prepend(frag);
+          current.dataset.chatBefore = page.next_before ?? "";
+          box.dataset.history = "1";
+          box.scrollTop += box.scrollHeight - prevHeight;
+        }
+      } catch (err) {
+        console.error("chat history load failed", err);
+      } finally {
+        delete box.dataset.historyLoading;
+      }
+    });
+  });
+}
+
+function setupChatStreaming(scope = document) {
+  scope.querySelectorAll("form[data-chat-stream]").forEach((form) => {
+    if (form.dataset.bound === "1") return;
+    form.dataset.bound = "1";
+    form.addEventListener("submit", async (evt) => {
+      evt.preventDefault();
+      const thread = document.querySelector(form.dataset.chatThread || "");
+      const box = form.querySelector("textarea");
+      const payload = new FormData(form);
+      const agent = String(payload.get("agent") || "");
+      if (box) box.value = "";
+      if (!thread) return;
+      thread.dataset.streaming = "1";
+      try {
+        const res = await fetch(form.action, { method: "POST", body: payload });
+        const ctype = res.headers.get("content-type") || "";
+        if (!ctype.includes("text/event-stream") || !res.body) {
+          thread.innerHTML = await res.text();
+          boot(thread);
+          return;
+        }
+        appendChatBubble(thread, String(payload.get("sender") || "operator"), String(payload.get("message") || ""), false);
+        const bubble = appendChatBubble(thread, agent, "", true);
+        const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buf = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buf += value;
+          let idx = buf.indexOf("\n\n");
+          while (idx !== -1) {
+            const msg = parseSseBlock(buf.slice(0, idx));
+            buf = buf.slice(idx + 2);
+            if (msg.event === "delta") bubble.textContent += msg.data.text || "";
+            idx = buf.indexOf("\n\n");
+          }
+        }
+      } catch (err) {
+        console.error("chat stream failed", err);
+      } finally {
+        delete thread.dataset.streaming;
+        delete thread.dataset.history;
+      }
+      if (window.htmx) {
+        window.htmx.ajax("GET", `/partials/chat-thread?agent=${encodeURIComponent(agent)}`, { target: thread, swap: "innerHTML" });
+      }
+    });
+  });
+}
+
 function boot(scope = document) {
   const steps = [
     setupVisualStack,
@@ -752,6 +885,8 @@ function boot(scope = document) {
     setupChangeViewer,
     setupNotificationRules,
     setupGovernedHistoryFilters,
+    setupChatStreaming,
+    setupChatHistory,
   ];
   steps.forEach((fn) => {
     try {
@@ -763,6 +898,11 @@ function boot(scope = document) {
 }
 
 boot(document);
+document.addEventListener("htmx:beforeRequest", (evt) => {
+  // Keep thread polling from replacing a streaming reply or scrolled-back history.
+  const ds = evt.detail?.elt?.dataset;
+  if (ds?.streaming === "1" || ds?.history === "1") evt.preventDefault();
+});
 document.addEventListener("htmx:afterSwap", (evt) => {
   const target = evt.detail?.target;
   if (!target) return;
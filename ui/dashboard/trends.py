@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from ops.teambus.columnar import TS_MISSING, Snapshot
+
+# Trend horizons/resolutions exposed by /api/trends.
+HORIZON_DAYS = (1, 7, 30, 90)
+RESOLUTIONS = {"hour": 3600, "day": 86400}
+DONE_STATES = ("complete", "completed", "done", "ok")
+SEVERITIES = ("err", "warn", "info")
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def bucket_edges(now_s: int, days: int, bucket_s: int) -> tuple[int, int]:
+    """(start, n_buckets) for `days` ending at the bucket containing `now_s`, aligned to UTC bucket boundaries."""
+    end = now_s - now_s % bucket_s + bucket_s
+    n = max(1, -(-days * 86400 // bucket_s))
+    return end - n * bucket_s, n
+
+
+def histogram(ts: Any, start: int, n_buckets: int, bucket_s: int) -> list[int]:
+    """Counts of epoch seconds `ts` per bucket; values outside the range are dropped."""
+    idx = (ts[(ts >= start) & (ts != TS_MISSING)] - start) // bucket_s
+    idx = idx[idx < n_buckets]
+    return np.bincount(idx, minlength=n_buckets).tolist()
+
+
+def _codes_in(snap: Snapshot, values: Iterable[str]) -> Any:
+    codes = [c for c in (snap.code(v) for v in values) if c >= 0]
+    return np.asarray(codes or [-1], dtype=np.int32)
+
+
+def completion_times(snap: Snapshot) -> Any:
+    """Epoch of the latest done-state event per task (re-completion moves a task forward)."""
+    cols = snap.columns
+    m = np.isin(cols["state"], _codes_in(snap, DONE_STATES)) & (cols["task_id"] != 0) & (cols["ts"] != TS_MISSING)
+    task, ts = cols["task_id"][m], cols["ts"][m]
+    if task.size == 0:
+        return ts
+    # np.unique keeps the first occurrence; reverse so that is the latest row per task.
+    _, last = np.unique(task[::-1], return_index=True)
+    return ts[::-1][last]
+
+
+def completions_trend(snap: Snapshot, now_s: int, days: int, bucket_s: int) -> dict:
+    start, n = bucket_edges(now_s, days, bucket_s)
+    return {"start": start, "bucket_s": bucket_s, "values": histogram(completion_times(snap), start, n, bucket_s)}
+
+
+def severity_trend(snap: Snapshot, now_s: int, days: int, bucket_s: int, classify: Callable[[str], str]) -> dict:
+    """Event counts per bucket for each severity; `classify` maps an event type to a severity."""
+    start, n = bucket_edges(now_s, days, bucket_s)
+    ts = snap.columns["ts"]
+    m = (ts >= start) & (ts != TS_MISSING)
+    # Classify each dictionary string once, then look severities up by type code.
+    lut = np.asarray([SEVERITIES.index(classify(v or "event")) for v in snap.strings.values], dtype=np.int64)
+    sev = lut[snap.columns["type"][m]]
+    idx = (ts[m] - start) // bucket_s
+    keep = idx < n
+    counts = np.bincount(sev[keep] * n + idx[keep], minlength=len(SEVERITIES) * n).reshape(len(SEVERITIES), n)
+    return {"start": start, "bucket_s": bucket_s, "series": {s: counts[i].tolist() for i, s in enumerate(SEVERITIES)}}
+
+
+def chat_latency_percentiles(snap: Snapshot, since: int, percentiles: Iterable[int] = LATENCY_PERCENTILES) -> dict[str, dict]:
+    """
+    Per-agent CHAT_MESSAGE -> CHAT_REPLY latency (seconds) for replies since
+    `since`. Each reply pairs with the newest earlier message (bus order)
+    addressed to the replying agent, as the home SLA panel does.
+    """
+    cols = snap.columns
+    valid = cols["ts"] != TS_MISSING
+    ts, typ = cols["ts"][valid], cols["type"][valid]
+    actor, target = cols["actor"][valid], cols["target_agent"][valid]
+    msg_code, reply_code = snap.code("CHAT_MESSAGE"), snap.code("CHAT_REPLY")
+    is_msg = (typ == msg_code) & (target != 0)
+    is_reply = (typ == reply_code) & (actor != 0) & (ts >= since)
+    pos = np.arange(ts.shape[0])
+    pcts = list(percentiles)
+    out: dict[str, dict] = {}
+    for agent_code in np.unique(actor[is_reply]):
+        msg_pos = pos[is_msg & (target == agent_code)]
+        reply_pos = pos[is_reply & (actor == agent_code)]
+        prev = np.searchsorted(msg_pos, reply_pos) - 1
+        paired = prev >= 0
+        lat = ts[reply_pos[paired]] - ts[msg_pos[prev[paired]]]
+        lat = lat[lat >= 0]
+        if lat.size == 0:
+            continue
+        values = np.percentile(lat, pcts)
+        row = {"count": int(lat.size), "max_s": int(lat.max())}
+        row.update({f"p{p}_s": round(float(v), 1) for p, v in zip(pcts, values)})
+        out[snap.strings.values[int(agent_code)]] = row
+    return out